@@ -1,13 +1,15 @@
 from PyQt6.QtWidgets import QWidget, QApplication, QMainWindow, QLabel, QMainWindow
-from PyQt6.QtGui import QPixmap, QPainter, QPen, QColor
+from PyQt6.QtGui import QPixmap, QPainter
 from PyQt6.QtCore import Qt, QRectF, QPointF, QTimer
 import sys, math
+from functools import lru_cache
 from datetime import datetime, timedelta
 import config
+from resources import resources
 
-settings = config.load_settings()
-clocks = settings['clock.defaults']['clocks']
-theme_name = settings['selected_theme']
+settings = config.get_settings()
+clocks = settings.clock.clocks
+theme_name = settings.theme_name
 
 size = 100
 pad = 5
@@ -15,10 +17,77 @@ center = QPointF(size / 2, size / 2)
 min_hand = (size - pad * 4) / 2
 hour_hand = min_hand * 0.6
 
+def static_face(theme: str, face_size: int = size, antialiased: bool = False) -> QPixmap:
+    """Bezel and ticks rendered once per theme and size, blitted on every tick."""
+    return resources.get(theme, ('face', face_size, antialiased),
+                         lambda: render_face(theme, face_size, antialiased))
+
+def render_face(theme: str, face_size: int, antialiased: bool) -> QPixmap:
+    face = QPixmap(face_size, face_size)
+    face.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(face)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, antialiased)
+    draw_face(painter, theme, face_size)
+    painter.end()
+    return face
+
+def draw_face(painter: QPainter, theme: str, face_size: int):
+    """Paint the bezel and hour ticks at the painter's origin."""
+    face_pad = pad
+    face_center = QPointF(face_size / 2, face_size / 2)
+    face_min_hand = (face_size - face_pad * 4) / 2
+
+    painter.setPen(resources.pen(theme, settings.themes[theme].clock.color))
+    painter.drawEllipse(QRectF(face_pad, face_pad,
+                               face_size - face_pad * 2,
+                               face_size - face_pad * 2))
+
+    painter.setPen(resources.pen(theme, '#777'))
+    for tick in range(12):
+        angle_r = math.radians(360 / 12 * tick - 90)
+        painter.drawLine(QPointF(face_center.x() + face_min_hand * 0.9 * math.cos(angle_r),
+                                 face_center.y() + face_min_hand * 0.9 * math.sin(angle_r)),
+                         QPointF(face_center.x() + face_min_hand * math.cos(angle_r),
+                                 face_center.y() + face_min_hand * math.sin(angle_r)))
+
+@lru_cache(maxsize=None)
+def hand_tips(face_size: int = size):
+    """Endpoint lookup tables for every hand position.
+
+    Returns (sec_tips, min_tips, hour_tips) with 60, 60 and 720 entries; the
+    hour table is indexed by minutes past 12 o'clock so the hand creeps.
+    """
+    face_center = QPointF(face_size / 2, face_size / 2)
+    face_min_hand = (face_size - pad * 4) / 2
+    face_hour_hand = face_min_hand * 0.6
+
+    def tips(steps, length):
+        points = []
+        for step in range(steps):
+            angle_r = math.radians(360 / steps * step - 90)
+            points.append(QPointF(face_center.x() + length * math.cos(angle_r),
+                                  face_center.y() + length * math.sin(angle_r)))
+        return tuple(points)
+
+    return tips(60, face_min_hand * 0.95), tips(60, face_min_hand), tips(720, face_hour_hand)
+
+def hand_pens(theme: str):
+    """(sec_pen, min_pen, hour_pen) for a theme."""
+    color = settings.themes[theme].clock.color
+    return resources.pen(theme, 'tomato', 1), resources.pen(theme, color, 2), resources.pen(theme, color, 4)
+
+def clear_caches(theme: str = None):
+    """Drop cached faces and pens, e.g. after a theme was edited in settings.json."""
+    resources.invalidate(theme)
+
 class QAClock(QWidget):
-    def __init__(self):
+    def __init__(self, prerendered=True):
         super().__init__()
 
+        # prerendered=True blits a cached face and looks hands up in hand_tips;
+        # False repaints the whole face with fresh trigonometry each tick.
+        self.prerendered = prerendered
+
         self.label = QLabel()
         canvas = QPixmap(size, size)
         canvas.fill(Qt.GlobalColor.transparent)
@@ -28,24 +97,42 @@ class QAClock(QWidget):
         self.draw_clock(datetime.now())
 
     def draw_clock(self, draw_time: datetime):
+        if self.prerendered:
+            self.draw_prerendered(draw_time)
+        else:
+            self.paint_clock(draw_time)
+
+    def draw_prerendered(self, draw_time: datetime):
+        sec_tips, min_tips, hour_tips = hand_tips(size)
+        sec_pen, min_pen, hour_pen = hand_pens(theme_name)
+
         canvas = self.label.pixmap()
         canvas.fill(Qt.GlobalColor.transparent)
         painter = QPainter(canvas)
-        bezel_pen = QPen()
-        bezel_pen.setWidth(1)
-        bezel_pen.setColor(QColor(settings['themes'][theme_name]['clock']['font.color']))
+        painter.drawPixmap(0, 0, static_face(theme_name, size))
+        painter.setPen(sec_pen)
+        painter.drawLine(center, sec_tips[draw_time.second])
+        painter.setPen(min_pen)
+        painter.drawLine(center, min_tips[draw_time.minute])
+        painter.setPen(hour_pen)
+        painter.drawLine(center, hour_tips[draw_time.hour % 12 * 60 + draw_time.minute])
+        painter.end()
+        self.label.setPixmap(canvas)
 
-        painter.setPen(bezel_pen)
+    def paint_clock(self, draw_time: datetime):
+        canvas = self.label.pixmap()
+        canvas.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(canvas)
+        theme = settings.theme_name
+        color = settings.theme.clock.color
+        painter.setPen(resources.pen(theme, color))
 
         bound_box = QRectF(pad, pad,
                            size - pad * 2,
                            size - pad * 2)
         painter.drawEllipse(bound_box)
 
-        tick_pen = QPen()
-        tick_pen.setWidth(1)
-        tick_pen.setColor(QColor('#777'))
-        painter.setPen(tick_pen)
+        painter.setPen(resources.pen(theme, '#777'))
 
         ticks = list(range(12))
         for tick in ticks:
@@ -57,10 +144,7 @@ class QAClock(QWidget):
                                center.y() + min_hand * math.sin(angle_r))
             painter.drawLine(tick_start, tick_tip)
 
-        sec_pen = QPen()
-        sec_pen.setWidth(1)
-        sec_pen.setColor(QColor('tomato'))
-        painter.setPen(sec_pen)
+        painter.setPen(resources.pen(theme, 'tomato'))
         
         angle = 360 / 60 * draw_time.second
         angle_r = math.radians(angle - 90)
@@ -69,10 +153,7 @@ class QAClock(QWidget):
 
         painter.drawLine(center, sec_tip)
 
-        min_pen = QPen()
-        min_pen.setWidth(2)
-        min_pen.setColor(QColor(settings['themes'][theme_name]['clock']['font.color']))
-        painter.setPen(min_pen)
+        painter.setPen(resources.pen(theme, color, 2))
         
         angle = 360 / 60 * draw_time.minute
         angle_r = math.radians(angle - 90)
@@ -81,10 +162,7 @@ class QAClock(QWidget):
 
         painter.drawLine(center, min_tip)
 
-        hour_pen = QPen()
-        hour_pen.setWidth(4)
-        hour_pen.setColor(QColor(settings['themes'][theme_name]['clock']['font.color']))
-        painter.setPen(hour_pen)
+        painter.setPen(resources.pen(theme, color, 4))
 
         angle = 360 / 12 * (draw_time.hour + draw_time.minute / 60)
         angle_r = math.radians(angle - 90)
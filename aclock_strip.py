@@ -0,0 +1,103 @@
+"""
+Many analog clocks painted by one widget.
+
+AnalogClockStrip draws every face in a single paintEvent from the shared
+static-face cache in aclock, instead of one QGraphicsScene and QGraphicsView
+per zone. Faces are laid out in a row, or in a grid when `columns` is set.
+"""
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtGui import QPainter
+from PyQt6.QtCore import QPointF, QRect, QSize
+from datetime import datetime
+from time import perf_counter_ns
+from aclock import static_face, hand_tips, hand_pens, theme_name
+from tick_profiler import NULL_PROFILER
+
+
+class AnalogClockStrip(QWidget):
+    def __init__(self, count: int, columns: int = None, face_size: int = 125, parent=None):
+        super().__init__(parent)
+        self.count = count
+        self.fixed_columns = columns
+        self.columns = columns or max(count, 1)
+        self.face_size = face_size
+        self.theme_name = theme_name
+        # (second, minute, hour-table index) per face; None until first set
+        self.hands = [None] * count
+        self.profiler = NULL_PROFILER
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+
+    @property
+    def rows(self):
+        return -(-self.count // self.columns)
+
+    def sizeHint(self):
+        return QSize(self.columns * self.face_size, self.rows * self.face_size)
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def set_time(self, index: int, draw_time: datetime):
+        hands = (draw_time.second, draw_time.minute, draw_time.hour % 12 * 60 + draw_time.minute)
+        if self.hands[index] != hands:
+            self.hands[index] = hands
+            self.update(self.cell_rect(index))
+
+    def set_times(self, times):
+        """Update every face; only a changed strip schedules a repaint."""
+        changed = False
+        for index, draw_time in enumerate(times):
+            hands = (draw_time.second, draw_time.minute, draw_time.hour % 12 * 60 + draw_time.minute)
+            if self.hands[index] != hands:
+                self.hands[index] = hands
+                changed = True
+        if changed:
+            self.update()
+
+    def set_count(self, count: int):
+        """Change the number of faces; hands are unset until the next set_time."""
+        self.count = count
+        self.columns = self.fixed_columns or max(count, 1)
+        self.hands = [None] * count
+        self.updateGeometry()
+        self.update()
+
+    def set_theme(self, name: str):
+        self.theme_name = name
+        self.update()
+
+    def cell_rect(self, index: int):
+        """Rect of face `index`; cells share the width equally so faces line up with grid columns."""
+        cell_width = self.width() / self.columns
+        row, column = divmod(index, self.columns)
+        left = int(column * cell_width + (cell_width - self.face_size) / 2)
+        return QRect(left, row * self.face_size, self.face_size, self.face_size)
+
+    def paintEvent(self, event):
+        started = perf_counter_ns()
+        face = static_face(self.theme_name, self.face_size, True)
+        sec_tips, min_tips, hour_tips = hand_tips(self.face_size)
+        sec_pen, min_pen, hour_pen = hand_pens(self.theme_name)
+        center = QPointF(self.face_size / 2, self.face_size / 2)
+        dirty = event.rect()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        for index, hands in enumerate(self.hands):
+            rect = self.cell_rect(index)
+            if hands is None or not dirty.intersects(rect):
+                continue
+            second, minute, hour = hands
+            painter.save()
+            painter.translate(rect.left(), rect.top())
+            painter.drawPixmap(0, 0, face)
+            painter.setPen(sec_pen)
+            painter.drawLine(center, sec_tips[second])
+            painter.setPen(min_pen)
+            painter.drawLine(center, min_tips[minute])
+            painter.setPen(hour_pen)
+            painter.drawLine(center, hour_tips[hour])
+            painter.restore()
+        painter.end()
+        self.profiler.record('paint', perf_counter_ns() - started)
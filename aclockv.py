@@ -11,9 +11,9 @@ import math
 from datetime import datetime
 import config
 
-settings = config.load_settings()
-clocks = settings['clock.defaults']['clocks']
-theme_name = settings['selected_theme']
+settings = config.get_settings()
+clocks = settings.clock.clocks
+theme_name = settings.theme_name
 
 size = 125
 pad = 5
@@ -31,14 +31,15 @@ class QAClock(QWidget):
         self.view = QGraphicsView(self.scene)
         self.view.setStyleSheet('border: 0px solid transparent;')
         self.view.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        self.build_face()
         self.draw_clock(datetime.now())
-        
-    def draw_clock(self, draw_time: datetime):
 
-        self.scene.clear()
+    def build_face(self):
+        """Create the bezel, ticks and hands once; later ticks only rotate the hands."""
         bezel_pen = QPen()
         bezel_pen.setWidth(1)
-        bezel_pen.setColor(QColor(settings['themes'][theme_name]['clock']['font.color']))
+        bezel_pen.setColor(QColor(settings.theme.clock.color))
 
         bound_box = QRectF(pad, pad,
                            size - pad * 2,
@@ -51,56 +52,41 @@ class QAClock(QWidget):
         tick_pen.setWidth(1)
         tick_pen.setColor(QColor('#777'))
 
-
-        ticks = list(range(12))
-        for tick in ticks:
-            angle = 360 / 12 * tick
-            angle_r = math.radians(angle - 90)
-            tick_start = QPointF(center.x() + min_hand * 0.9 * math.cos(angle_r), 
+        for tick in range(12):
+            angle_r = math.radians(360 / 12 * tick - 90)
+            tick_start = QPointF(center.x() + min_hand * 0.9 * math.cos(angle_r),
                                  center.y() + min_hand * 0.9 * math.sin(angle_r))
-            tick_tip = QPointF(center.x() + min_hand * math.cos(angle_r), 
+            tick_tip = QPointF(center.x() + min_hand * math.cos(angle_r),
                                center.y() + min_hand * math.sin(angle_r))
             tick_line = QGraphicsLineItem(tick_start.x(), tick_start.y(),
                                           tick_tip.x(), tick_tip.y())
             tick_line.setPen(tick_pen)
             self.scene.addItem(tick_line)
 
-        sec_pen = QPen()
-        sec_pen.setWidth(1)
-        sec_pen.setColor(QColor('tomato'))
-        
-        angle = 360 / 60 * draw_time.second
-        angle_r = math.radians(angle - 90)
-        sec_tip = QPointF(center.x() + min_hand * 0.95 * math.cos(angle_r), 
-                          center.y() + min_hand * 0.95 * math.sin(angle_r))
-        sec_line = QGraphicsLineItem(center.x(), center.y(), sec_tip.x(), sec_tip.y())
-        sec_line.setPen(sec_pen)
-        self.scene.addItem(sec_line)
-
-        min_pen = QPen()
-        min_pen.setWidth(2)
-        min_pen.setColor(QColor(settings['themes'][theme_name]['clock']['font.color']))
-        
-        angle = 360 / 60 * draw_time.minute
-        angle_r = math.radians(angle - 90)
-        min_tip = QPointF(center.x() + min_hand * math.cos(angle_r), 
-                          center.y() + min_hand * math.sin(angle_r))
+        # Hands are drawn pointing at 12 o'clock and rotated about the center
+        self.sec_line = self.add_hand(min_hand * 0.95, 1, 'tomato')
+        self.min_line = self.add_hand(min_hand, 2, settings.theme.clock.color)
+        self.hour_line = self.add_hand(hour_hand, 4, settings.theme.clock.color)
+
+    def add_hand(self, length, width, color):
+        pen = QPen()
+        pen.setWidth(width)
+        pen.setColor(QColor(color))
+        hand = QGraphicsLineItem(center.x(), center.y(), center.x(), center.y() - length)
+        hand.setPen(pen)
+        hand.setTransformOriginPoint(center)
+        self.scene.addItem(hand)
+        return hand
 
-        min_line = QGraphicsLineItem(center.x(), center.y(), min_tip.x(), min_tip.y())
-        min_line.setPen(min_pen)
-        self.scene.addItem(min_line)
-
-        hour_pen = QPen()
-        hour_pen.setWidth(4)
-        hour_pen.setColor(QColor(settings['themes'][theme_name]['clock']['font.color']))
-
-        angle = 360 / 12 * (draw_time.hour + draw_time.minute / 60)
-        angle_r = math.radians(angle - 90)
-        hour_tip = QPointF(center.x() + hour_hand * math.cos(angle_r), 
-                           center.y() + hour_hand * math.sin(angle_r))
-        
-        hour_line = QGraphicsLineItem(center.x(), center.y(), hour_tip.x(), hour_tip.y())
-        hour_line.setPen(hour_pen)
-        self.scene.addItem(hour_line)
-
-        self.view.setScene(self.scene)
+    def draw_clock(self, draw_time: datetime):
+        sec_angle = 360 / 60 * draw_time.second
+        min_angle = 360 / 60 * draw_time.minute
+        hour_angle = 360 / 12 * (draw_time.hour % 12 + draw_time.minute / 60)
+
+        # setRotation schedules a repaint, so only call it when the hand moved
+        if self.sec_line.rotation() != sec_angle:
+            self.sec_line.setRotation(sec_angle)
+        if self.min_line.rotation() != min_angle:
+            self.min_line.setRotation(min_angle)
+        if self.hour_line.rotation() != hour_angle:
+            self.hour_line.setRotation(hour_angle)
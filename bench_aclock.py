@@ -0,0 +1,36 @@
+"""
+Time per tick for a wall of aclock.QAClock faces, painted vs prerendered.
+
+"painted" repaints bezel, ticks and hands with fresh trigonometry every tick;
+"prerendered" blits the cached static face and draws three looked-up lines.
+"""
+
+import os, sys
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from datetime import datetime, timedelta
+from time import perf_counter
+from PyQt6.QtWidgets import QApplication
+
+clock_counts = [1, 12, 48]
+ticks = 120
+
+
+def measure(clocks):
+    start_time = datetime(2025, 1, 1, 9, 0, 0)
+    times = [start_time + timedelta(seconds=i) for i in range(ticks)]
+    start = perf_counter()
+    for draw_time in times:
+        for clock in clocks:
+            clock.draw_clock(draw_time)
+    return (perf_counter() - start) / ticks
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    from aclock import QAClock
+    print(f'{"clocks":>6} {"painted (ms/tick)":>18} {"prerendered (ms/tick)":>22} {"speedup":>8}')
+    for count in clock_counts:
+        painted = measure([QAClock(prerendered=False) for _ in range(count)])
+        prerendered = measure([QAClock(prerendered=True) for _ in range(count)])
+        print(f'{count:>6} {painted * 1e3:>18.3f} {prerendered * 1e3:>22.3f} {painted / prerendered:>7.1f}x')
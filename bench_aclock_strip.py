@@ -0,0 +1,67 @@
+"""
+Repaint time per tick: one aclockv.QAClock view per zone vs one AnalogClockStrip.
+
+Both are laid out in the same grid (at most 25 faces per row) under the Qt
+offscreen platform; each tick advances every clock by one second and forces
+a synchronous repaint of the container.
+"""
+
+import os, sys
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from datetime import datetime, timedelta
+from time import perf_counter
+from PyQt6.QtWidgets import QApplication, QWidget, QGridLayout
+
+clock_counts = [5, 50, 200]
+max_columns = 25
+ticks = 30
+
+
+def per_zone_views(count, columns):
+    from aclockv import QAClock
+    container = QWidget()
+    grid = QGridLayout(container)
+    clocks = [QAClock() for _ in range(count)]
+    for index, clock in enumerate(clocks):
+        grid.addWidget(clock.view, *divmod(index, columns))
+
+    def draw(times):
+        for clock, draw_time in zip(clocks, times):
+            clock.draw_clock(draw_time)
+    return container, draw
+
+
+def strip(count, columns):
+    from aclock_strip import AnalogClockStrip
+    container = QWidget()
+    grid = QGridLayout(container)
+    clock_strip = AnalogClockStrip(count, columns)
+    grid.addWidget(clock_strip, 0, 0)
+    return container, clock_strip.set_times
+
+
+def measure(container, draw, count):
+    container.show()
+    app.processEvents()
+    start_time = datetime(2025, 1, 1, 9, 0, 0)
+    elapsed = 0
+    for tick in range(ticks):
+        times = [start_time + timedelta(seconds=tick)] * count
+        start = perf_counter()
+        draw(times)
+        container.repaint()
+        app.processEvents()
+        elapsed += perf_counter() - start
+    container.close()
+    return elapsed / ticks
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    print(f'{"clocks":>6} {"views (ms/tick)":>16} {"strip (ms/tick)":>16} {"speedup":>8}')
+    for count in clock_counts:
+        columns = min(count, max_columns)
+        views = measure(*per_zone_views(count, columns), count)
+        single = measure(*strip(count, columns), count)
+        print(f'{count:>6} {views * 1e3:>16.2f} {single * 1e3:>16.2f} {views / single:>7.1f}x')
@@ -0,0 +1,91 @@
+"""
+Time and allocations per aclockv.QAClock.draw_clock, before and after.
+
+The "rebuild" clock reproduces the old draw_clock, which cleared the scene and
+re-created the bezel, ticks, hands and pens on every tick. Allocations are the
+transient Python memory per call (tracemalloc peak above the starting level).
+"""
+
+import os, sys
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import math, tracemalloc
+from datetime import datetime, timedelta
+from time import perf_counter
+from PyQt6.QtWidgets import QApplication, QGraphicsEllipseItem, QGraphicsLineItem
+from PyQt6.QtGui import QPen, QColor
+from PyQt6.QtCore import QRectF, QPointF
+
+ticks = 3600
+
+
+def make_rebuild_clock():
+    from aclockv import QAClock, settings, theme_name, size, pad, center, min_hand, hour_hand
+
+    class RebuildQAClock(QAClock):
+        def draw_clock(self, draw_time: datetime):
+            self.scene.clear()
+            color = settings.themes[theme_name].clock.color
+            bezel_pen = QPen()
+            bezel_pen.setWidth(1)
+            bezel_pen.setColor(QColor(color))
+            bezel = QGraphicsEllipseItem(QRectF(pad, pad, size - pad * 2, size - pad * 2))
+            bezel.setPen(bezel_pen)
+            self.scene.addItem(bezel)
+            tick_pen = QPen()
+            tick_pen.setWidth(1)
+            tick_pen.setColor(QColor('#777'))
+            for tick in range(12):
+                angle_r = math.radians(360 / 12 * tick - 90)
+                tick_line = QGraphicsLineItem(center.x() + min_hand * 0.9 * math.cos(angle_r),
+                                              center.y() + min_hand * 0.9 * math.sin(angle_r),
+                                              center.x() + min_hand * math.cos(angle_r),
+                                              center.y() + min_hand * math.sin(angle_r))
+                tick_line.setPen(tick_pen)
+                self.scene.addItem(tick_line)
+            for value, steps, length, width, hand_color in (
+                    (draw_time.second, 60, min_hand * 0.95, 1, 'tomato'),
+                    (draw_time.minute, 60, min_hand, 2, color),
+                    (draw_time.hour + draw_time.minute / 60, 12, hour_hand, 4, color)):
+                pen = QPen()
+                pen.setWidth(width)
+                pen.setColor(QColor(hand_color))
+                angle_r = math.radians(360 / steps * value - 90)
+                tip = QPointF(center.x() + length * math.cos(angle_r),
+                              center.y() + length * math.sin(angle_r))
+                line = QGraphicsLineItem(center.x(), center.y(), tip.x(), tip.y())
+                line.setPen(pen)
+                self.scene.addItem(line)
+            self.view.setScene(self.scene)
+
+    return RebuildQAClock()
+
+
+def measure(clock):
+    start_time = datetime(2025, 1, 1, 9, 0, 0)
+    times = [start_time + timedelta(seconds=i) for i in range(ticks)]
+    clock.draw_clock(times[0])  # warm up
+
+    tracemalloc.start()
+    transient = 0
+    for draw_time in times[:60]:
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        clock.draw_clock(draw_time)
+        transient += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+
+    start = perf_counter()
+    for draw_time in times:
+        clock.draw_clock(draw_time)
+    elapsed = perf_counter() - start
+    return transient / 60, elapsed / ticks, len(clock.scene.items())
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    from aclockv import QAClock
+    print(f'{"draw_clock":<10} {"bytes/call":>11} {"us/call":>9} {"scene items":>12}')
+    for name, clock in (('rebuild', make_rebuild_clock()), ('rotate', QAClock())):
+        transient, seconds, items = measure(clock)
+        print(f'{name:<10} {transient:>11.0f} {seconds * 1e6:>9.1f} {items:>12}')
@@ -0,0 +1,40 @@
+"""
+Zone catalog build, cached load and per-keystroke search times.
+
+Each query is typed one character at a time, as in the "add clock" palette;
+the slowest keystroke of each is reported against the 5 ms budget.
+"""
+
+import os, tempfile, time
+from multiclock_core import ZoneCatalog
+
+queries = ['new york', 'tokyo', 'britain', 'kolkta', 'nyork', 'sao paulo', 'us', 'america']
+budget_ms = 5
+
+
+def keystrokes(catalog, query, repeat=20):
+    """Slowest per-keystroke search time in ms over the prefixes of `query`."""
+    slowest = 0
+    for end in range(1, len(query) + 1):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            catalog.search(query[:end])
+        slowest = max(slowest, (time.perf_counter() - start) / repeat * 1e3)
+    return slowest
+
+
+if __name__ == '__main__':
+    path = os.path.join(tempfile.mkdtemp(), 'zone_catalog.json')
+    start = time.perf_counter()
+    catalog = ZoneCatalog.load(path)
+    print(f'build and cache: {(time.perf_counter() - start) * 1e3:.1f} ms ({len(catalog)} entries)')
+    start = time.perf_counter()
+    catalog = ZoneCatalog.load(path)
+    print(f'load from cache: {(time.perf_counter() - start) * 1e3:.1f} ms')
+
+    print(f'{"query":<16} {"worst key (ms)":>14}  first result')
+    for query in queries:
+        worst = keystrokes(catalog, query)
+        first = catalog.search(query)[0]
+        flag = '' if worst < budget_ms else '  over budget'
+        print(f'{query:<16} {worst:>14.2f}  {first.city} ({first.zone}){flag}')
@@ -0,0 +1,62 @@
+"""
+Trigger-to-audio latency: a new QMediaPlayer per chime vs ChimeService.
+
+Plays the configured chime `count` times each way at zero volume and reports
+the delay from the trigger until the audio output is active. Needs a working
+audio device; usage:
+    python bench_chime.py [count] [path]
+"""
+
+import os, sys
+from statistics import median
+from time import perf_counter
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer, QUrl
+from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
+from chime_service import ChimeService
+
+
+def wait(app, seconds):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def per_chime_player(app, path, count):
+    """The old play_chime: build a player, open the file and play it."""
+    latencies = []
+    for _ in range(count):
+        start = perf_counter()
+        player = QMediaPlayer()
+        audio_output = QAudioOutput()
+        audio_output.setVolume(0)
+        player.setAudioOutput(audio_output)
+        player.playbackStateChanged.connect(
+            lambda state: state == QMediaPlayer.PlaybackState.PlayingState and latencies.append(perf_counter() - start))
+        player.setSource(QUrl.fromLocalFile(os.path.abspath(path)))
+        player.play()
+        wait(app, 1.0)
+        player.stop()
+    return latencies
+
+
+def chime_service(app, path, count):
+    chime = ChimeService(path, 0)
+    chime.load()
+    wait(app, 2.0)
+    for _ in range(count):
+        chime.play()
+        wait(app, 1.0)
+        chime.stop()
+    return list(chime.latencies)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    path = sys.argv[2] if len(sys.argv) > 2 else './assets/cuckoo.mp3'
+    app = QCoreApplication(sys.argv)
+    for name, run in (('QMediaPlayer per chime', per_chime_player), ('ChimeService', chime_service)):
+        latencies = run(app, path, count)
+        if latencies:
+            print(f'{name:<24} median {median(latencies) * 1e3:7.1f} ms, worst {max(latencies) * 1e3:7.1f} ms')
+        else:
+            print(f'{name:<24} no audio output started')
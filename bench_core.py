@@ -0,0 +1,44 @@
+"""
+Headless benchmark of ClockCore.tick, with no display or Qt import.
+
+Run directly for a quick table, or under pytest-benchmark in CI:
+
+    python -m pytest bench_core.py --benchmark-only
+"""
+
+from timeit import repeat
+from multiclock_core import ClockCore
+from bench_zone_engine import synthetic_clocks
+
+sizes = [10, 100, 1000]
+start = 1_750_000_000
+
+
+def make_core(count):
+    return ClockCore(synthetic_clocks(count), 'Europe/London')
+
+
+def replay(core, seconds=60):
+    """Tick once per second for `seconds` simulated seconds."""
+    for second in range(seconds):
+        core.tick(start + second)
+
+
+def test_tick_10(benchmark):
+    benchmark(replay, make_core(10))
+
+
+def test_tick_100(benchmark):
+    benchmark(replay, make_core(100))
+
+
+def test_tick_1000(benchmark):
+    benchmark(replay, make_core(1000))
+
+
+if __name__ == '__main__':
+    print(f'{"zones":>6} {"ms/tick":>8}')
+    for count in sizes:
+        core = make_core(count)
+        seconds = min(repeat(lambda: replay(core), number=1, repeat=5)) / 60
+        print(f'{count:>6} {seconds * 1e3:>8.3f}')
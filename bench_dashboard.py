@@ -0,0 +1,58 @@
+"""
+Cost per tick of the dashboard's views against the shared zone states.
+
+For 100 zones in both sections, ticks the digital window, the analog
+window and both through one ClockHub, and counts the zone states the
+shared ClockCore computes per tick.
+"""
+
+import os, sys
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import copy, json, tempfile, time
+from PyQt6.QtWidgets import QApplication
+from bench_zone_engine import synthetic_clocks
+
+zone_count = 100
+ticks = 60
+start = 1_750_000_000
+
+
+def run(hub):
+    computed = []
+    tick = hub.core.tick
+    hub.core.tick = lambda now, zones=None: computed.extend(zones) or tick(now, zones)
+    for view in hub.views:
+        view.render_state.enabled = False  # repaint every zone, as if every second changed them
+    began = time.perf_counter()
+    for second in range(ticks):
+        hub.tick(start + second)
+    elapsed = (time.perf_counter() - began) / ticks
+    hub.core.tick = tick
+    return elapsed, len(computed) / ticks
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    import config
+    data = copy.deepcopy(config.fallback_settings)
+    for section in ('clock.defaults', 'clock.defaults.horizontal'):
+        data[section]['clocks'] = synthetic_clocks(zone_count)
+    os.chdir(tempfile.mkdtemp())
+    with open('settings.json', 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=4)
+
+    import dashboard
+    from clock_hub import ClockHub
+    print(f'{"views":<32} {"ms/tick":>8} {"zone states/tick":>17}')
+    for argv in (['--digital'], ['--analog'], []):
+        hub = ClockHub('UTC')
+        windows = dashboard.windows(argv, hub)
+        for window in windows:
+            window.show()
+        app.processEvents()
+        elapsed, computed = run(hub)
+        name = ' + '.join(type(window).__module__ for window in windows)
+        print(f'{name:<32} {elapsed * 1e3:>8.3f} {computed:>17.1f}')
+        for window in windows:
+            window.close()
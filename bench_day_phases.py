@@ -0,0 +1,41 @@
+"""
+Sun-based day phases: one NumPy batch against computing zone by zone, and
+the steady per-tick lookup once every zone knows its next transition.
+"""
+
+from timeit import repeat
+from multiclock_core import DayPhaseSchedule, sun_transitions, zone_coordinates
+from bench_zone_engine import synthetic_clocks
+
+sizes = [10, 100, 1000]
+start = 1_750_000_000
+
+
+def coordinates(count):
+    return [zone_coordinates(zone_name) for zone_name in synthetic_clocks(count).values()]
+
+
+def batch(points):
+    sun_transitions([latitude for latitude, _ in points], [longitude for _, longitude in points], start)
+
+
+def one_by_one(points):
+    for latitude, longitude in points:
+        sun_transitions([latitude], [longitude], start)
+
+
+def ticks(schedule, seconds=60):
+    for second in range(seconds):
+        schedule.phases(start + second)
+
+
+if __name__ == '__main__':
+    print(f'{"zones":>6} {"batch (ms)":>11} {"per zone (ms)":>14} {"tick (ms)":>10}')
+    for count in sizes:
+        points = coordinates(count)
+        batched = min(repeat(lambda: batch(points), number=1, repeat=5))
+        single = min(repeat(lambda: one_by_one(points), number=1, repeat=5))
+        schedule = DayPhaseSchedule(points)
+        schedule.phases(start)
+        tick = min(repeat(lambda: ticks(schedule), number=1, repeat=5)) / 60
+        print(f'{count:>6} {batched * 1e3:>11.2f} {single * 1e3:>14.2f} {tick * 1e3:>10.3f}')
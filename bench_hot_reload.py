@@ -0,0 +1,78 @@
+"""
+Time to apply settings.json edits to running windows with 100 zones.
+
+Each edit is written to a scratch settings.json; "apply" is the reload and
+in-place widget update, "paint" the event processing that follows.
+"""
+
+import os, sys
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import copy, json, tempfile, time
+from PyQt6.QtWidgets import QApplication
+from bench_zone_engine import synthetic_clocks
+
+zone_count = 100
+
+
+def set_theme(data):
+    data['selected_theme'] = 'night' if data['selected_theme'] != 'night' else 'classic'
+
+
+def add_zone(data):
+    for section in ('clock.defaults', 'clock.defaults.horizontal'):
+        data[section]['clocks']['Added'] = 'Europe/Paris'
+
+
+def remove_zone(data):
+    for section in ('clock.defaults', 'clock.defaults.horizontal'):
+        data[section]['clocks'].pop('Added')
+
+
+def reorder_zones(data):
+    for section in ('clock.defaults', 'clock.defaults.horizontal'):
+        data[section]['clocks'] = dict(reversed(list(data[section]['clocks'].items())))
+
+
+def change_format(data):
+    data['clock.defaults']['time.format'] = '%I:%M %p'
+
+
+edits = [set_theme, add_zone, remove_zone, reorder_zones, change_format]
+
+
+def apply(app, window, edit):
+    with open('settings.json', encoding='utf-8') as file:
+        data = json.load(file)
+    edit(data)
+    time.sleep(0.01)  # make sure the mtime moves on coarse filesystems
+    with open('settings.json', 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=4)
+    start = time.perf_counter()
+    window.settings_watcher.check()
+    applied = time.perf_counter() - start
+    app.processEvents()
+    return applied, time.perf_counter() - start - applied
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    import config
+    data = copy.deepcopy(config.fallback_settings)
+    for section in ('clock.defaults', 'clock.defaults.horizontal'):
+        data[section]['clocks'] = synthetic_clocks(zone_count)
+
+    os.chdir(tempfile.mkdtemp())
+    with open('settings.json', 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=4)
+    import multiclock, multiclock_analog
+
+    print(f'{"window":<18} {"edit":<14} {"apply (ms)":>10} {"paint (ms)":>10}')
+    for module in (multiclock, multiclock_analog):
+        window = module.Window()
+        window.show()
+        app.processEvents()
+        for edit in edits:
+            applied, painted = apply(app, window, edit)
+            print(f'{module.__name__:<18} {edit.__name__:<14} {applied * 1e3:>10.1f} {painted * 1e3:>10.1f}')
+        window.close()
@@ -0,0 +1,42 @@
+"""
+Count Qt label updates per tick with and without dirty-checking.
+
+Runs both windows under the Qt offscreen platform and replays ten simulated
+minutes, one tick per second.
+"""
+
+import os, sys
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from time import perf_counter, time
+from PyQt6.QtWidgets import QApplication
+from render_state import RenderState
+
+ticks = 600
+
+
+def run(module, enabled):
+    window = module.Window()
+    window.render_state = RenderState(len(module.clocks), enabled=enabled)
+    if hasattr(window, 'zone_model'):
+        window.zone_model.render_state = window.render_state
+    fake_now = [time()]
+    module.time = lambda: fake_now[0]
+    start = perf_counter()
+    for _ in range(ticks):
+        fake_now[0] += 1
+        window.update_time()
+    elapsed = perf_counter() - start
+    window.close()
+    return window.render_state.total_updates / ticks, elapsed / ticks
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    import multiclock, multiclock_analog
+    print(f'{"window":<18} {"mode":<8} {"Qt calls/tick":>14} {"ms/tick":>8}')
+    for module in (multiclock, multiclock_analog):
+        for enabled in (False, True):
+            updates, seconds = run(module, enabled)
+            mode = 'dirty' if enabled else 'always'
+            print(f'{module.__name__:<18} {mode:<8} {updates:>14.2f} {seconds * 1e3:>8.3f}')
@@ -0,0 +1,193 @@
+"""
+Regression suite for the cost of a tick in both windows.
+
+Builds multiclock.py and multiclock_analog.py offscreen for 1 to 1000 zones
+and replays ticks on a fake clock: a burst of 20 one-second ticks around
+each hour boundary of the days Europe and the US spring forward, so the
+zones cross their DST transitions, rather than the whole of either day.
+Above 100 zones only every few hours are replayed (every 10th at 1000
+zones). For each window and zone count it measures tick latency (p50/p95,
+including the repaint), the Python memory the window allocates and its
+widget count.
+
+    python bench_suite.py                  compare against bench_baseline.json
+    python bench_suite.py --update         write the current results as the baseline
+    python bench_suite.py --threshold=0.5  allow 50% instead of 25% before failing
+    python bench_suite.py --sizes=1,10     only these zone counts
+    python bench_suite.py --burst=60       60 ticks per hour boundary instead of 20
+
+The first run writes the baseline. Later runs exit with status 1 when any
+metric is worse than the baseline by more than the threshold (and by more
+than a small absolute slack, so sub-millisecond noise does not fail it).
+Baselines are machine-specific; keep one per machine.
+"""
+
+import os, sys
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import gc, json, tracemalloc
+from calendar import timegm
+from time import perf_counter_ns
+import numpy as np
+from PyQt6.QtWidgets import QApplication, QWidget
+from bench_zone_engine import synthetic_clocks
+
+sizes = [1, 10, 100, 1000]
+# Days with DST transitions: Europe springs forward at 01:00 UTC on the 30th, the US at 2 AM local on the 9th
+days = [(2025, 3, 9), (2025, 3, 30)]
+# Ticks per hour boundary. Big analog windows take most of a second per tick, so above
+# 100 zones only every count * burst // 2000 hours are replayed, keeping the same mix of second
+# and minute ticks
+burst = 20
+memory_ticks = 10
+baseline_path = 'bench_baseline.json'
+threshold = 0.25
+# Regressions smaller than this are noise, whatever the ratio
+slack = {'tick_p50_ms': 0.05, 'tick_p95_ms': 0.2, 'memory_kb': 256, 'widgets': 0}
+
+
+class FakeClock:
+    """A settable time() installed into the modules that read the clock."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def install(self, *modules):
+        for module in modules:
+            module.time = self
+
+
+def replay(count):
+    """`burst` seconds across each replayed hour boundary of each day, every hour up to 100 zones."""
+    stride = max(1, count * burst // 2000)
+    for year, month, day in days:
+        midnight = timegm((year, month, day, 0, 0, 0))
+        for hour in range(0, 24, stride):
+            boundary = midnight + hour * 3600
+            for second in range(-burst // 2, burst - burst // 2):
+                yield boundary + second
+
+
+def build(module, count, clock):
+    module.clocks = synthetic_clocks(count)
+    clock.now = timegm(days[0] + (0, 0, 0)) - 60
+    window = module.Window()
+    window.show()
+    app.processEvents()
+    # The replay drives the ticks; the hub's own timers would tick on wall-clock time
+    window.hub.scheduler.stop()
+    window.hub.events.stop()
+    return window
+
+
+def close(window):
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+
+
+def build_and_tick(module, count, clock):
+    window = build(module, count, clock)
+    for instant, _ in zip(replay(count), range(memory_ticks)):
+        clock.now = instant
+        window.hub.tick(instant)
+        app.processEvents()
+    return window
+
+
+def measure_memory(module, count, clock) -> float:
+    """KB of Python memory held by a window after building it and a few ticks.
+
+    A throwaway window is built, ticked and closed first, so lazy imports and
+    process-wide caches (zone tables, compiled formats, Qt's first use) do not
+    count towards whichever size happens to be measured first.
+    """
+    close(build_and_tick(module, count, clock))
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    window = build_and_tick(module, count, clock)
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    close(window)
+    return held / 1024
+
+
+def measure(module, count) -> dict:
+    import clock_hub
+    clock = FakeClock()
+    clock.install(module, clock_hub)
+    memory = measure_memory(module, count, clock)
+    window = build(module, count, clock)
+    widgets = len(window.findChildren(QWidget))
+    latencies = []
+    for instant in replay(count):
+        clock.now = instant
+        started = perf_counter_ns()
+        window.hub.tick(instant)
+        app.processEvents()
+        latencies.append(perf_counter_ns() - started)
+    close(window)
+    p50, p95 = np.percentile(latencies, [50, 95]) / 1e6
+    return {'tick_p50_ms': round(float(p50), 4), 'tick_p95_ms': round(float(p95), 4),
+            'memory_kb': round(memory, 1), 'widgets': widgets,
+            'ticks_per_s': round(len(latencies) / (sum(latencies) / 1e9))}
+
+
+def regressions(results, baseline, threshold) -> list:
+    found = []
+    for key, metrics in results.items():
+        for metric, value in metrics.items():
+            if metric not in slack or metric not in baseline.get(key, {}):
+                continue
+            old = baseline[key][metric]
+            if value > old * (1 + threshold) and value - old > slack[metric]:
+                found.append(f'{key} {metric}: {old} -> {value}')
+    return found
+
+
+if __name__ == '__main__':
+    for arg in sys.argv[1:]:
+        if arg.startswith('--threshold='):
+            threshold = float(arg.split('=', 1)[1])
+        elif arg.startswith('--baseline='):
+            baseline_path = arg.split('=', 1)[1]
+        elif arg.startswith('--burst='):
+            burst = int(arg.split('=', 1)[1])
+        elif arg.startswith('--sizes='):
+            sizes = [int(size) for size in arg.split('=', 1)[1].split(',')]
+    app = QApplication(sys.argv)
+    import multiclock, multiclock_analog
+
+    results = {}
+    print(f'{"window":<18} {"zones":>6} {"p50 (ms)":>9} {"p95 (ms)":>9} {"memory (KB)":>12} '
+          f'{"widgets":>8} {"ticks/s":>8}')
+    for module in (multiclock, multiclock_analog):
+        for count in sizes:
+            metrics = results[f'{module.__name__}/{count}'] = measure(module, count)
+            print(f'{module.__name__:<18} {count:>6} {metrics["tick_p50_ms"]:>9.3f} {metrics["tick_p95_ms"]:>9.3f} '
+                  f'{metrics["memory_kb"]:>12.1f} {metrics["widgets"]:>8} {metrics["ticks_per_s"]:>8}')
+
+    if '--update' in sys.argv or not os.path.isfile(baseline_path):
+        baseline = {}
+        if os.path.isfile(baseline_path):
+            with open(baseline_path, encoding='utf-8') as file:
+                baseline = json.load(file)
+        baseline.update(results)
+        with open(baseline_path, 'w', encoding='utf-8') as file:
+            json.dump(baseline, file, indent=4)
+        print(f'Baseline written to {baseline_path}')
+        sys.exit(0)
+
+    with open(baseline_path, encoding='utf-8') as file:
+        baseline = json.load(file)
+    found = regressions(results, baseline, threshold)
+    for line in found:
+        print(f'REGRESSION {line}', file=sys.stderr)
+    if found:
+        sys.exit(1)
+    print(f'No regressions beyond {threshold:.0%} against {baseline_path}')
@@ -0,0 +1,70 @@
+"""
+Tick lateness against the wall-clock second: QTimer(1000) vs TickScheduler.
+
+Each tick handler burns `load_ms` of CPU to simulate a busy update. The old
+timer's lateness is its offset past the last whole second; usage:
+    python bench_tick_scheduler.py [seconds] [load_ms]
+"""
+
+import os, sys
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import math
+from time import time, perf_counter
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
+from tick_scheduler import TickScheduler, LatenessHistogram
+
+
+def busy(load_ms):
+    end = perf_counter() + load_ms / 1000
+    while perf_counter() < end:
+        pass
+
+
+def run_qtimer(app, seconds, load_ms):
+    histogram = LatenessHistogram()
+    timer = QTimer()
+    shown = []
+
+    def on_timeout():
+        now = time()
+        second = math.floor(now)
+        shown.append(second)
+        histogram.record(now - second)
+        busy(load_ms)
+        if histogram.total >= seconds:
+            timer.stop()
+            app.quit()
+
+    timer.timeout.connect(on_timeout)
+    timer.start(1000)
+    app.exec()
+    # Seconds never displayed; a second shown twice hides another one
+    histogram.skipped = (max(shown) - min(shown) + 1) - len(set(shown))
+    return histogram
+
+
+def run_scheduler(app, seconds, load_ms):
+    scheduler = TickScheduler(1.0)
+
+    def on_tick(boundary):
+        busy(load_ms)
+        if scheduler.histogram.total >= seconds:
+            scheduler.stop()
+            app.quit()
+
+    scheduler.tick.connect(on_tick)
+    scheduler.start()
+    app.exec()
+    return scheduler.histogram
+
+
+if __name__ == '__main__':
+    seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    load_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 20
+    app = QApplication(sys.argv)
+    for name, run in (('QTimer(1000)', run_qtimer), ('TickScheduler', run_scheduler)):
+        histogram = run(app, seconds, load_ms)
+        print(f'{name}: {histogram.summary()}')
+        print(f'  within 5 ms: {histogram.within(5):.0%}')
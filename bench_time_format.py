@@ -0,0 +1,57 @@
+"""
+Label formatting per tick across 1,000 zones: raw strftime vs ClockFormatter.
+
+Each tick formats the date, the time and, for every tenth zone, the local
+clock with its seconds span, as update_time does.
+"""
+
+from timeit import repeat
+from multiclock_core import ZoneClockEngine
+from multiclock_core import ClockFormatter
+from bench_zone_engine import synthetic_clocks
+
+zone_count = 1000
+date_format = '%a, %d %b %Y'
+time_format = '%H:%M'
+
+
+def strftime_tick(times):
+    labels = []
+    for index, current_time in enumerate(times):
+        labels.append(current_time.strftime(date_format))
+        if index % 10 == 0:
+            labels.append(current_time.strftime('%H:%M') + f'<span style="font-size: 20px;">:{current_time.strftime("%S")}</span>')
+        else:
+            labels.append(current_time.strftime(time_format))
+    return labels
+
+
+def formatter_tick(formatter, times):
+    labels = []
+    for index, current_time in enumerate(times):
+        labels.append(formatter.date(index, current_time))
+        if index % 10 == 0:
+            labels.append(formatter.local_time(current_time))
+        else:
+            labels.append(formatter.time(current_time))
+    return labels
+
+
+if __name__ == '__main__':
+    engine = ZoneClockEngine(synthetic_clocks(zone_count))
+    ticks = [engine.tick(1_750_000_000 + second) for second in range(60)]
+    formatter = ClockFormatter(date_format, time_format, zone_count)
+    assert all(strftime_tick(times) == formatter_tick(formatter, times) for times in ticks)
+
+    def run_strftime():
+        for times in ticks:
+            strftime_tick(times)
+
+    def run_formatter():
+        for times in ticks:
+            formatter_tick(formatter, times)
+
+    raw = min(repeat(run_strftime, number=1, repeat=5)) / len(ticks)
+    compiled = min(repeat(run_formatter, number=1, repeat=5)) / len(ticks)
+    print(f'{zone_count} zones: strftime {raw * 1e3:.3f} ms/tick, '
+          f'ClockFormatter {compiled * 1e3:.3f} ms/tick ({raw / compiled:.1f}x)')
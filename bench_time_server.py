@@ -0,0 +1,55 @@
+"""
+Requests per second served by the time server over loopback HTTP.
+
+Starts a TimeServer for 100 zones in its background thread and drives it
+from asyncio clients over keep-alive connections: the current snapshot,
+one clock, a cached conversion and a conversion of a new instant each time.
+"""
+
+import asyncio
+from time import perf_counter
+from bench_zone_engine import synthetic_clocks
+import config
+from time_server import TimeServer
+
+zone_count = 100
+connections = 8
+requests = 2000
+start = 1_750_000_000
+
+
+async def client(port, targets):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    for target in targets:
+        writer.write(f'GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n'.encode())
+        length = 0
+        while (line := await reader.readline()) != b'\r\n':
+            if line.lower().startswith(b'content-length:'):
+                length = int(line.split(b':')[1])
+        await reader.readexactly(length)
+    writer.close()
+
+
+async def drive(port, target):
+    per_client = requests // connections
+    began = perf_counter()
+    await asyncio.gather(*(client(port, [target(connection * per_client + index) for index in range(per_client)])
+                           for connection in range(connections)))
+    return per_client * connections / (perf_counter() - began)
+
+
+if __name__ == '__main__':
+    clocks = synthetic_clocks(zone_count)
+    server = TimeServer(clocks, 'UTC', config.ServerSettings(True, '127.0.0.1', 0)).start_thread()
+    port = server._server.sockets[0].getsockname()[1]
+    first = next(iter(clocks)).replace(' ', '%20').replace('#', '%23')
+    cases = [('/zones', lambda index: '/zones'),
+             ('/zones/<name>', lambda index: f'/zones/{first}'),
+             ('/convert, same instant', lambda index: f'/convert?at={start}'),
+             ('/convert, new instants', lambda index: f'/convert?at={start + index * 3600}')]
+    print(f'{zone_count} zones, {connections} keep-alive connections')
+    print(f'{"request":<24} {"requests/s":>11}')
+    for name, target in cases:
+        rate = asyncio.run(drive(port, target))
+        print(f'{name:<24} {rate:>11.0f}')
+    server.stop()
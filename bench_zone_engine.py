@@ -0,0 +1,39 @@
+"""Benchmark ZoneClockEngine.tick() against the old per-zone current_times() path."""
+
+import time
+from datetime import datetime
+from timeit import repeat
+import pytz
+from multiclock_core import ZoneClockEngine
+
+sizes = [10, 100, 1000]
+
+
+def synthetic_clocks(count):
+    """Build a clocks dict of `count` entries cycling through every IANA zone."""
+    all_zones = pytz.all_timezones
+    return {f'{all_zones[i % len(all_zones)]} #{i}': all_zones[i % len(all_zones)]
+            for i in range(count)}
+
+
+def per_zone_times(clocks):
+    """The original implementation: one zone lookup and one now() per clock."""
+    times = []
+    for key in clocks.keys():
+        times.append(datetime.now(pytz.timezone(clocks[key])))
+    return times
+
+
+def best_of(func, number):
+    return min(repeat(func, number=number, repeat=5)) / number
+
+
+if __name__ == '__main__':
+    print(f'{"zones":>6} {"per-zone (ms)":>14} {"engine (ms)":>12} {"speedup":>8}')
+    for count in sizes:
+        clocks = synthetic_clocks(count)
+        engine = ZoneClockEngine(clocks)
+        number = max(1, 2000 // count)
+        legacy = best_of(lambda: per_zone_times(clocks), number)
+        batched = best_of(lambda: engine.tick(time.time()), number)
+        print(f'{count:>6} {legacy * 1e3:>14.3f} {batched * 1e3:>12.3f} {legacy / batched:>7.1f}x')
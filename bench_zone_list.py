@@ -0,0 +1,47 @@
+"""
+Vertical window cost against the number of configured zones.
+
+Builds the window offscreen for each zone count and replays two simulated
+minutes, one tick per second, reporting build time, widgets and tick cost.
+With the virtualized zone list only the rows in view are ticked and painted,
+so the last two columns should not grow with the zone count.
+"""
+
+import os, sys
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from time import perf_counter, time
+from PyQt6.QtWidgets import QApplication, QWidget
+from bench_zone_engine import synthetic_clocks
+
+sizes = [10, 100, 1000]
+ticks = 120
+
+
+def run(module, count):
+    module.clocks = synthetic_clocks(count)
+    start = perf_counter()
+    window = module.Window()
+    window.show()
+    app.processEvents()
+    built = perf_counter() - start
+    fake_now = [time()]
+    module.time = lambda: fake_now[0]
+    start = perf_counter()
+    for _ in range(ticks):
+        fake_now[0] += 1
+        window.update_time()
+        app.processEvents()
+    ticked = (perf_counter() - start) / ticks
+    widgets = len(window.findChildren(QWidget))
+    window.close()
+    return built, widgets, ticked
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    import multiclock
+    print(f'{"zones":>6} {"build (ms)":>10} {"widgets":>8} {"ms/tick":>8}')
+    for count in sizes:
+        built, widgets, ticked = run(multiclock, count)
+        print(f'{count:>6} {built * 1e3:>10.1f} {widgets:>8} {ticked * 1e3:>8.3f}')
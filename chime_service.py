@@ -0,0 +1,182 @@
+"""
+Preloaded chime playback for the MultiClock windows.
+
+The windows used to build a QMediaPlayer for every chime, so the mp3 was
+opened and decoded at the moment it should be heard and the audio started
+late. ChimeService decodes the configured file once into PCM held in memory
+and replays it through a single QAudioSink. It measures the delay from each
+trigger to active output as `latency`; the hub's EventScheduler fires chimes
+early by that much, so they are heard on the second.
+QtMultimedia is only imported by load(), so it stays off the startup path.
+Where it cannot load at all (no audio backend, as on a headless box), the
+service says so once on stderr and play() does nothing.
+"""
+
+import sys
+from collections import deque
+from statistics import median
+from time import perf_counter
+from PyQt6.QtCore import QObject, QBuffer, QByteArray, QIODevice, QUrl
+from resources import asset_path
+
+# Assumed trigger-to-audio delay until the first chime has been measured
+DEFAULT_LATENCY = 0.05
+
+
+class ChimeService(QObject):
+    """One chime sound, decoded ahead of time and replayed on demand.
+
+    If the file cannot be decoded into PCM, a single QMediaPlayer loaded
+    with the file is kept and replayed instead.
+    """
+
+    def __init__(self, path: str, volume: float = 100, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.volume = volume
+        self.latencies = deque(maxlen=20)
+        self.loaded = False
+        self.available = True
+        self._pcm = QByteArray()
+        self._format = None
+        self._buffer = None
+        self._sink = None
+        self._decoder = None
+        self._player = None
+        self._audio_output = None
+        self._triggered = None
+        self._pending = False
+
+    @property
+    def latency(self) -> float:
+        """Typical seconds from play() to the sound starting."""
+        return median(self.latencies) if self.latencies else DEFAULT_LATENCY
+
+    def set_source(self, path: str, volume: float):
+        """Switch to another file or volume, decoding the new file if it was loaded."""
+        if path == self.path and volume == self.volume:
+            return
+        reload = self.loaded or self._decoder is not None
+        self.stop()
+        for old in (self._decoder, self._sink, self._player, self._audio_output, self._buffer):
+            if old is not None:
+                old.deleteLater()
+        self._sink = self._player = self._audio_output = self._buffer = self._decoder = None
+        self._pcm, self._format = QByteArray(), None
+        self.path, self.volume = path, volume
+        self.loaded = False
+        if reload:
+            self.load()
+
+    def load(self):
+        """Start decoding the chime in the background. Safe to call more than once."""
+        if self.loaded or self._decoder is not None or not self.available:
+            return
+        try:
+            from PyQt6.QtMultimedia import QAudioDecoder
+            self._decoder = QAudioDecoder(self)
+        except (ImportError, RuntimeError) as error:
+            self._unavailable(error)
+            return
+        self._decoder.bufferReady.connect(self._on_buffer)
+        self._decoder.finished.connect(self._on_decoded)
+        self._decoder.error.connect(self._on_decode_error)
+        self._decoder.setSource(QUrl.fromLocalFile(asset_path(self.path)))
+        self._decoder.start()
+
+    def play(self):
+        """Play the chime now, from the start."""
+        if not self.available:
+            return
+        self._triggered = perf_counter()
+        if not self.loaded:
+            # Asked for before decoding finished: play as soon as it has
+            self._pending = True
+            self.load()
+            return
+        if self._sink is not None:
+            self._sink.stop()
+            self._buffer.seek(0)
+            self._sink.start(self._buffer)
+        else:
+            self._player.stop()
+            self._player.play()
+
+    def stop(self):
+        if self._decoder is not None:
+            self._decoder.stop()
+        self._pending = False
+        if self._sink is not None:
+            self._sink.stop()
+        if self._player is not None:
+            self._player.stop()
+
+    def _on_buffer(self):
+        if self.sender() is not self._decoder:
+            return  # a decoder replaced by set_source
+        buffer = self._decoder.read()
+        if self._format is None:
+            self._format = buffer.format()
+        self._pcm.append(QByteArray(buffer.constData().asstring(buffer.byteCount())))
+
+    def _on_decoded(self):
+        from PyQt6.QtMultimedia import QAudioSink, QMediaDevices
+        if self.sender() is not self._decoder:
+            return
+        self._decoder = None
+        if self._format is None or self._pcm.isEmpty():
+            self._use_player()
+            return
+        self._buffer = QBuffer(self._pcm, self)
+        self._buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        self._sink = QAudioSink(QMediaDevices.defaultAudioOutput(), self._format, self)
+        self._sink.setVolume(self.volume)
+        self._sink.stateChanged.connect(self._on_sink_state)
+        self._ready()
+
+    def _on_decode_error(self, *args):
+        if self.sender() is not self._decoder:
+            return
+        self._decoder = None
+        self._use_player()
+
+    def _use_player(self):
+        try:
+            from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
+            self._player = QMediaPlayer(self)
+            self._audio_output = QAudioOutput(self)
+        except (ImportError, RuntimeError) as error:
+            self._unavailable(error)
+            return
+        self._audio_output.setVolume(self.volume)
+        self._player.setAudioOutput(self._audio_output)
+        self._player.setSource(QUrl.fromLocalFile(asset_path(self.path)))
+        self._player.playbackStateChanged.connect(self._on_player_state)
+        self._ready()
+
+    def _unavailable(self, error):
+        self.available = False
+        self._pending = False
+        print(f'Chimes are muted, audio is unavailable: {error}', file=sys.stderr)
+
+    def _ready(self):
+        self.loaded = True
+        if self._pending:
+            self._pending = False
+            self.play()
+
+    def _on_sink_state(self, state):
+        from PyQt6.QtMultimedia import QAudio
+        if state == QAudio.State.ActiveState and self._triggered is not None:
+            # Samples still queued in the sink's buffer are heard after it turns active
+            queued = self._format.durationForBytes(self._sink.bufferSize()) / 1e6
+            self._record(perf_counter() - self._triggered + queued)
+
+    def _on_player_state(self, state):
+        from PyQt6.QtMultimedia import QMediaPlayer
+        if state == QMediaPlayer.PlaybackState.PlayingState and self._triggered is not None:
+            self._record(perf_counter() - self._triggered)
+
+    def _record(self, latency: float):
+        self.latencies.append(latency)
+        self._triggered = None
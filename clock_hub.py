@@ -0,0 +1,450 @@
+"""
+One clock engine, tick, chime and settings reload shared by MultiClock views.
+
+Each window used to run its own ClockCore, TickScheduler, SettingsWatcher,
+chime and event schedule, so showing the digital and the analog window
+meant resolving every zone twice, ticking twice and hearing every chime
+twice. A ClockHub owns all of these once. A window's `core` is a ZoneView
+onto the hub's shared ClockCore, and the ZoneStates of a tick are computed
+once and handed to every view that asks, so another view only adds the
+cost of rendering it. A window on its own simply has a hub to itself.
+
+Views are registered with add_view() and provide:
+
+    clocks                      display name -> zone name mapping
+    tick_interval()             seconds between the ticks it needs now
+    update_time(now_utc)        render one tick
+    apply_settings(previous)    apply a settings.json reload
+    show_notice(text)           show an alarm or reminder notice
+    show_profile(text)          show the tick profiler's summary, or hide it when None
+
+ClockView supplies everything but update_time() and the widgets to a
+QWidget window that has a `theme_label`, and the plumbing both windows
+share: joining a hub, tick rate on show and hide, deferred loading after
+the first paint, the add-clock palette and the skeleton of a settings reload.
+"""
+
+import sys
+from dataclasses import replace
+from datetime import datetime
+from time import time
+from PyQt6.QtCore import QObject, QCoreApplication, QEvent, QTimer, Qt
+from PyQt6.QtGui import QAction, QKeySequence
+from PyQt6.QtWidgets import QApplication
+from tzlocal import get_localzone
+import config
+import startup_timeline
+from multiclock_core import ClockCore, build_rules
+from tick_scheduler import TickScheduler, MINUTE
+from settings_watcher import SettingsWatcher, diff_settings
+from chime_service import ChimeService
+from event_scheduler import EventScheduler
+from tick_profiler import make_profiler, ProfileOverlay
+from time_server import TimeServer
+from zone_palette import ZonePalette, clock_name
+from resources import resources
+from render_state import RenderState
+
+settings = config.get_settings()
+
+
+def event_time(instant, rule):
+    """Wall time of an event occurrence in its own zone, e.g. '09:00 Asia/Tokyo'."""
+    return f'{datetime.fromtimestamp(instant, rule.tz):%H:%M} {rule.zone_name or "local"}'
+
+
+class ZoneView:
+    """One view's zones, ticked through the hub's shared ClockCore.
+
+    tick() has the signature of ClockCore.tick and returns ZoneStates
+    indexed and named as in this view's `clocks`.
+    """
+
+    def __init__(self, hub, clocks):
+        self.hub = hub
+        self.clocks = dict(clocks)
+        self.names = list(self.clocks.keys())
+        self.zone_names = list(self.clocks.values())
+        self.positions = hub.positions(self.zone_names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def tick(self, now_utc: float = None, zones=None) -> list:
+        if now_utc is None:
+            now_utc = time()
+        if zones is None:
+            zones = range(len(self.names))
+        positions, names = self.positions, self.names
+        shared = self.hub.states(now_utc, [positions[index] for index in zones])
+        return [replace(state, index=index, name=names[index]) for index, state in zip(zones, shared)]
+
+
+class ClockHub(QObject):
+    """The zones, tick, chime, events and settings watcher behind one or more views."""
+
+    def __init__(self, local_zone: str = None, parent=None):
+        super().__init__(parent)
+        self.local_zone = str(get_localzone()) if local_zone is None else local_zone
+        self.views = []
+        self.zone_views = {}
+        self.zone_names = []
+        self.core = None
+        self._now = None
+        self._states = {}
+
+        self.chime = ChimeService(settings.clock.chime, settings.clock.chime_volume, self)
+        self.sounds = {}
+        self.event_rules = []
+        self.sounds_loaded = False
+        self.events = EventScheduler(lambda: self.chime.latency, self)
+        self.events.fired.connect(self.on_events)
+        self.events.missed.connect(self.on_missed_events)
+
+        # Off unless settings.json or --profile asks for it; see tick_profiler
+        self.profiler = make_profiler(settings.profiler)
+        self.events.profiler = self.profiler
+
+        # The local time-query endpoint, when settings.json or --serve turns it on; see time_server
+        self.server = None
+        if QCoreApplication.instance() is not None:
+            # Stopped on the way out, so a Unix socket is not left behind
+            QCoreApplication.instance().aboutToQuit.connect(self.stop_server)
+
+        # Ticks are re-armed to each wall-clock boundary, so they stay aligned with the system clock.
+        # Views start hidden, so the hub ticks per minute until one is shown and asks for seconds.
+        self.scheduler = TickScheduler(MINUTE, self)
+        self.scheduler.tick.connect(self.tick)
+
+        # Edits to settings.json are applied in place, without a restart
+        self.settings_watcher = SettingsWatcher(settings, self)
+        self.settings_watcher.reloaded.connect(self.apply_settings)
+
+    def view(self, owner, clocks) -> ZoneView:
+        """The ZoneView for `owner`'s clocks, replacing any it had before."""
+        view = self.zone_views[owner] = ZoneView(self, clocks)
+        return view
+
+    def positions(self, zone_names) -> list:
+        """Positions of `zone_names` in the shared core, adding zones it does not have yet."""
+        added = [zone_name for zone_name in dict.fromkeys(zone_names) if zone_name not in self.zone_names]
+        if added or self.core is None:
+            self.set_zone_names(self.zone_names + added)
+        index = {zone_name: position for position, zone_name in enumerate(self.zone_names)}
+        return [index[zone_name] for zone_name in zone_names]
+
+    def set_zone_names(self, zone_names):
+        # Keyed by zone name: views that show the same zone under other names share its state
+        self.zone_names = list(zone_names)
+        self.core = ClockCore({zone_name: zone_name for zone_name in self.zone_names}, self.local_zone)
+        self._now, self._states = None, {}
+
+    def prune(self):
+        """Drop zones no view shows any more and re-point the views at the rebuilt core."""
+        used = [zone_name for view in self.zone_views.values() for zone_name in view.zone_names]
+        if set(used) == set(self.zone_names):
+            return
+        self.set_zone_names(dict.fromkeys(used))
+        for view in self.zone_views.values():
+            view.positions = self.positions(view.zone_names)
+
+    def states(self, now_utc: float, positions) -> list:
+        """ZoneStates of the shared core at `now_utc`, each computed once per instant for all views."""
+        if now_utc != self._now:
+            self._now, self._states = now_utc, {}
+        cache = self._states
+        missing = [position for position in dict.fromkeys(positions) if position not in cache]
+        if missing:
+            for state in self.core.tick(now_utc, missing):
+                cache[state.index] = state
+        return [cache[position] for position in positions]
+
+    def add_view(self, view):
+        """Start ticking `view`, after it has built its widgets and its first frame."""
+        self.views.append(view)
+        self.set_events()
+        self.update_server()
+        if not self.scheduler.is_active():
+            self.scheduler.start()
+        self.update_tick_rate()
+
+    def clocks(self) -> dict:
+        """Every view's clocks in one mapping; the first view wins a name both use."""
+        merged = {}
+        for view in reversed(self.views):
+            merged.update(view.clocks)
+        return merged
+
+    def tick(self, now_utc: float = None):
+        if now_utc is None:
+            now_utc = time()
+        profiler = self.profiler
+        profiler.begin()
+        for view in self.views:
+            view.update_time(now_utc)
+        if self.server is not None:
+            self.publish(now_utc)
+            profiler.lap('server')
+        profiler.end(time=now_utc, zones=len(self.zone_names))
+        if profiler.overlay:
+            self.show_profile(profiler.summary())
+
+    def tick_interval(self):
+        """The shortest interval any view needs."""
+        return min((view.tick_interval() for view in self.views), default=MINUTE)
+
+    def update_tick_rate(self):
+        was_coarse = self.scheduler.interval == MINUTE
+        self.scheduler.set_interval(self.tick_interval())
+        if was_coarse and self.scheduler.interval != MINUTE:
+            # Catch the seconds up straight away rather than at the next boundary
+            self.tick()
+
+    def apply_settings(self, previous):
+        """Let every view apply a reload, then fit the shared zones and events to it."""
+        changes = [diff_settings(previous, settings, horizontal) for horizontal in (False, True)]
+        if previous.profiler != settings.profiler:
+            self.set_profiler()
+        for view in self.views:
+            view.apply_settings(previous)
+        self.prune()
+        if any(change.events or change.clocks for change in changes):
+            self.set_events()
+        self.update_server()
+        self.update_tick_rate()
+
+    def set_profiler(self):
+        """Replace the profiler after its settings changed, hiding the overlay if it is off now."""
+        self.profiler.close()
+        self.profiler = self.events.profiler = make_profiler(settings.profiler)
+        if not self.profiler.overlay:
+            self.show_profile(None)
+
+    def update_server(self):
+        """Start, stop or restart the time server to match settings, and give it the views' clocks."""
+        enabled = settings.server.enabled or '--serve' in sys.argv
+        if self.server is not None and (not enabled or self.server.server_settings != settings.server):
+            self.stop_server()
+        if enabled and self.server is None:
+            try:
+                self.server = TimeServer(self.clocks(), self.local_zone, settings.server).start_thread()
+            except OSError as error:
+                print(f'Not serving times: {error}', file=sys.stderr)
+        elif self.server is not None and self.server.clocks != self.clocks():
+            self.server.call(self.server.set_clocks, self.clocks())
+
+    def stop_server(self):
+        if self.server is not None:
+            self.server.stop()
+            self.server = None
+
+    def publish(self, now_utc: float):
+        """Hand this tick's zone states to the time server, computing any the views did not show."""
+        clocks = self.clocks()
+        states = self.states(now_utc, self.positions(list(clocks.values())))
+        self.server.publish(now_utc, list(clocks.keys()), states)
+
+    def set_events(self):
+        """Schedule the hourly chime, alarms and reminders from settings in the views' zones."""
+        self.chime.set_source(settings.clock.chime, settings.clock.chime_volume)
+        for path, sound in self.sounds.items():
+            sound.set_source(path, settings.clock.chime_volume)
+        self.event_rules = build_rules(settings.events, self.clocks(), settings.clock.chime_offset)
+        self.events.set_rules(self.event_rules)
+        if self.sounds_loaded:
+            self.preload_sounds()
+
+    def sound(self, path):
+        """The preloaded player for `path`, or the main chime when `path` is None."""
+        if path is None:
+            return self.chime
+        if path not in self.sounds:
+            self.sounds[path] = ChimeService(path, settings.clock.chime_volume, self)
+        return self.sounds[path]
+
+    def preload_sounds(self):
+        """Decode every sound the events may play; views call this once their first frame is up."""
+        self.sounds_loaded = True
+        for rule in self.event_rules:
+            self.sound(rule.sound).load()
+
+    def on_events(self, occurrences):
+        # Zones that share a wall-clock hour chime at the same instant; play each distinct sound once,
+        # so a zone's own chime or an alarm's sound is not swallowed by the default chime
+        played = set()
+        for instant, rule in occurrences:
+            if (instant, rule.sound) not in played:
+                played.add((instant, rule.sound))
+                self.sound(rule.sound).play()
+            if rule.kind != 'chime':
+                self.show_notice(f'{rule.label} ({event_time(instant, rule)})')
+
+    def on_missed_events(self, occurrences):
+        for instant, rule in occurrences:
+            message = f'Missed {rule.kind} {rule.label!r} due {event_time(instant, rule)}'
+            print(message, file=sys.stderr)
+            self.show_notice(message)
+
+    def show_notice(self, text):
+        for view in self.views:
+            view.show_notice(text)
+
+    def show_profile(self, text):
+        for view in self.views:
+            view.show_profile(text)
+
+
+class ClockView:
+    """View plumbing shared by the MultiClock windows; mix in ahead of QWidget.
+
+    A window sets `horizontal` (which clocks section and alignment it shows)
+    and `icon_setting` (its window icon in settings.window), calls
+    setup_view() once its geometry is set, and implements create_clocks(),
+    update_time(), restyle(), set_formats() (which also picks the
+    `second_zones`), apply_clocks() after its zones changed and window_title().
+    """
+
+    horizontal = False
+    icon_setting = 'icon'
+
+    def setup_view(self, hub, clocks, local_zone):
+        """Theme the window, join or create a hub, build the widgets for `clocks` and start ticking."""
+        self.setWindowTitle(self.window_title())
+        self.setStyleSheet(resources.stylesheet(settings.theme, 'window'))
+        self.setWindowOpacity(settings.window.opacity)
+
+        # The multi-size .ico takes longer to decode than the rest of the window; see load_deferred
+        self.started = False
+        self.zones = []
+        self.render_state = RenderState(0)
+        self.second_interval = settings.window.timer / 1000
+        self.profile_overlay = None
+        startup_timeline.mark('window setup')
+        # On its own a window has a hub to itself; the dashboard shares one between its windows
+        self.hub = ClockHub(local_zone, self) if hub is None else hub
+        self.settings_watcher = self.hub.settings_watcher
+        self.set_zones(clocks)
+        startup_timeline.mark('zones resolved')
+        self.create_clocks()
+        startup_timeline.mark('widgets built')
+        self.update_time()
+        self.hub.add_view(self)
+        startup_timeline.mark('first tick')
+
+        # Ctrl+K or the context menu opens the "add clock" palette
+        self.zone_palette = None
+        add_clock = QAction('Add clock…', self)
+        add_clock.setShortcut(QKeySequence('Ctrl+K'))
+        add_clock.triggered.connect(self.open_palette)
+        self.addAction(add_clock)
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.ActionsContextMenu)
+
+    def set_zones(self, zone_clocks):
+        """Resolve the configured zones and reset the per-zone caches that depend on them."""
+        old_zones = self.zones
+        self.clocks = dict(zone_clocks)
+        self.zones = list(self.clocks.keys())
+        self.core = self.hub.view(self, self.clocks)
+        self.render_state.remap(old_zones, self.zones)
+        self.set_formats()
+        self.last_minute = None
+
+    @property
+    def clock_settings(self):
+        return settings.clock_horizontal if self.horizontal else settings.clock
+
+    def apply_settings(self, previous):
+        """Apply a settings.json reload, touching only what changed."""
+        changes = diff_settings(previous, settings, horizontal=self.horizontal)
+        if not changes:
+            return
+        self.setUpdatesEnabled(False)
+        if changes.clocks:
+            self.set_zones(self.clock_settings.clocks)
+            self.apply_clocks()
+        elif changes.formats:
+            self.set_formats()
+            self.render_state.invalidate()
+        if changes.theme:
+            # The selected theme may have been edited in place under the same name
+            resources.invalidate(settings.theme_name)
+        if changes.theme or changes.align:
+            self.restyle()
+        if changes.window:
+            self.setWindowTitle(self.window_title())
+            self.setWindowOpacity(settings.window.opacity)
+            # The hub picks up the new tick interval once every view has applied the reload
+            self.second_interval = settings.window.timer / 1000
+        self.last_minute = None
+        self.update_time()
+        self.setUpdatesEnabled(True)
+
+    def tick_interval(self):
+        """Seconds while something visible shows seconds, otherwise whole minutes."""
+        if self.second_zones and self.isVisible() and not self.isMinimized():
+            return self.second_interval
+        return MINUTE
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.hub.update_tick_rate()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.hub.update_tick_rate()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.hub.update_tick_rate()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.started:
+            self.started = True
+            startup_timeline.first_paint()
+            QTimer.singleShot(0, self.load_deferred)
+
+    def load_deferred(self):
+        """Load what the first frame does not need, once it is on screen."""
+        icon = resources.icon(getattr(settings.window, self.icon_setting))
+        QApplication.setWindowIcon(icon)
+        self.setWindowIcon(icon)
+        self.hub.preload_sounds()
+
+    def show_notice(self, text):
+        """Show `text` in place of the theme name for a minute."""
+        self.theme_label.setText(text)
+        QTimer.singleShot(60_000, self.show_theme_name)
+
+    def show_profile(self, text):
+        """Show the tick profiler's summary over the window; None hides it."""
+        if text is None:
+            if self.profile_overlay is not None:
+                self.profile_overlay.hide()
+            return
+        if self.profile_overlay is None:
+            self.profile_overlay = ProfileOverlay(self)
+        self.profile_overlay.show_text(text)
+
+    def show_theme_name(self):
+        self.theme_label.setText(f'The current theme is <span style="font-weight: bold;">{settings.theme_name.title()}</span>')
+
+    def open_palette(self):
+        if self.zone_palette is None:
+            self.zone_palette = ZonePalette(self)
+            self.zone_palette.zone_chosen.connect(self.add_clock)
+        self.zone_palette.setStyleSheet(resources.stylesheet(settings.theme, 'palette'))
+        self.zone_palette.open_palette()
+
+    def add_clock(self, entry):
+        """Write the chosen zone into settings.json and apply it straight away."""
+        name = clock_name(entry, self.clocks)
+        section = 'clock.defaults.horizontal' if self.horizontal else 'clock.defaults'
+        try:
+            config.add_clock(name, entry.zone, section, settings.path)
+        except (OSError, ValueError, KeyError) as error:
+            self.show_notice(f'Could not add {name}: {error}')
+            return
+        self.settings_watcher.check()
+        self.show_notice(f'Added {name} ({entry.zone})')
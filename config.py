@@ -3,9 +3,14 @@ Internal configurations and fall-back defaults for MultiClock.
 User configuration is intended through the settings.json file.
 """
 
-import json, os
+import json, os, sys
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
+from multiclock_core.chimes import QUIET_HOURS
+from multiclock_core.events import WEEKDAYS
 
 clocks = {
     'Tokyo': 'Asia/Tokyo',
@@ -38,7 +43,7 @@ fallback_settings = {
         'date.format': '%a, %d %M %Y',
         'time.format': '%H:%M',
         'chime': './assets/jihou-sine-3f.mp3',
-        'chime.offset': -4,
+        'chime.offset': 0,
         'chime.volume': 100
     },
     'clock.align': {
@@ -174,21 +179,418 @@ fallback_settings = {
     }
 }
 
-def write_user_settings():
-    with open('settings.json', 'w', encoding='utf-8') as file:
+def write_user_settings(path='settings.json'):
+    with open(path, 'w', encoding='utf-8') as file:
         json.dump(fallback_settings, file, ensure_ascii=False, indent=4)
 
-def load_settings(path='settings.json'):
-    if os.path.isfile(path):
-        with open(path, 'r') as file:
+
+def add_clock(name, zone, section='clock.defaults', path='settings.json'):
+    """Add or repoint one clock in settings.json.
+
+    The whole file is rewritten with 4-space indentation, so any other
+    formatting it had is lost; keys keep their order. Running windows pick
+    the change up through their SettingsWatcher.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    data[section]['clocks'][name] = zone
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, ensure_ascii=False, indent=4)
+
+
+class SettingsError(ValueError):
+    """settings.json does not match the expected schema."""
+
+
+class Each:
+    """Schema marker: a mapping whose every value matches `schema`."""
+
+    def __init__(self, schema):
+        self.schema = schema
+
+
+class Items:
+    """Schema marker: a list whose every item matches `schema`."""
+
+    def __init__(self, schema):
+        self.schema = schema
+
+
+_number = (int, float)
+_font_schema = {
+    'font': str,
+    'font.size': _number,
+    'font.weight': int,
+    'font.color': str,
+    'background': str,
+    'border-top?': str
+}
+_clock_schema = {
+    'clocks': Each(str),
+    'date.format': str,
+    'time.format': str,
+    'chime': str,
+    'chime.offset': _number,
+    'chime.volume': _number
+}
+_align_schema = {
+    part: {'horizontal': int, 'vertical': int} for part in ('zone', 'date', 'clock')
+}
+
+_events_schema = {
+    'quiet.hours?': Items(int),
+    'zones?': Each({
+        'chime?': str,
+        'quiet.hours?': Items(int)
+    }),
+    'alarms?': Items({
+        'zone': str,
+        'time': str,
+        'label?': str,
+        'days?': Items(str),
+        'sound?': str
+    }),
+    'reminders?': Items({
+        'zone': str,
+        'at': str,
+        'label?': str,
+        'sound?': str
+    })
+}
+
+_profiler_schema = {
+    'enabled?': bool,
+    'overlay?': bool,
+    'export?': str,
+    'samples?': int
+}
+
+_server_schema = {
+    'enabled?': bool,
+    'host?': str,
+    'port?': int,
+    'socket?': str
+}
+
+# Keys ending in '?' are optional; keys not listed are allowed and ignored
+schema = {
+    'app': str,
+    'window.defaults': {
+        'title': str,
+        'icon': str,
+        'icon_alt': str,
+        'background': str,
+        'opacity': _number,
+        'timer': int
+    },
+    'clock.defaults': _clock_schema,
+    'clock.defaults.horizontal': _clock_schema,
+    'clock.align': _align_schema,
+    'clock.align.horizontal': _align_schema,
+    'selected_theme': str,
+    'themes': Each({
+        'window.background': str,
+        'zone': _font_schema,
+        'date': _font_schema,
+        'clock': _font_schema
+    }),
+    'events?': _events_schema,
+    'profiler?': _profiler_schema,
+    'server?': _server_schema
+}
+
+
+def validate(data, expected=schema, path='settings'):
+    """Raise SettingsError naming the first value that does not match `expected`."""
+    if isinstance(expected, Items):
+        if not isinstance(data, list):
+            raise SettingsError(f'{path} must be a list')
+        for index, item in enumerate(data):
+            validate(item, expected.schema, f'{path}[{index}]')
+    elif isinstance(expected, Each):
+        if not isinstance(data, dict):
+            raise SettingsError(f'{path} must be an object')
+        for key, value in data.items():
+            validate(value, expected.schema, f'{path}[{key!r}]')
+    elif isinstance(expected, dict):
+        if not isinstance(data, dict):
+            raise SettingsError(f'{path} must be an object')
+        for key, value_schema in expected.items():
+            optional = key.endswith('?')
+            key = key.rstrip('?')
+            if key not in data:
+                if optional:
+                    continue
+                raise SettingsError(f'{path} is missing {key!r}')
+            validate(data[key], value_schema, f'{path}[{key!r}]')
+    elif (isinstance(data, bool) and expected is not bool) or not isinstance(data, expected):
+        raise SettingsError(f'{path} has an invalid value {data!r}')
+
+
+@dataclass(frozen=True)
+class WindowSettings:
+    title: str
+    icon: str
+    icon_alt: str
+    background: str
+    opacity: float
+    timer: int
+
+
+@dataclass(frozen=True)
+class ClockSettings:
+    clocks: MappingProxyType
+    date_format: str
+    time_format: str
+    chime: str
+    chime_offset: float
+    chime_volume: float
+
+
+@dataclass(frozen=True)
+class Alignment:
+    horizontal: int
+    vertical: int
+
+    @property
+    def flags(self):
+        return Qt.AlignmentFlag(self.horizontal) | Qt.AlignmentFlag(self.vertical)
+
+
+@dataclass(frozen=True)
+class AlignSettings:
+    zone: Alignment
+    date: Alignment
+    clock: Alignment
+
+
+@dataclass(frozen=True)
+class FontStyle:
+    font: str
+    size: float
+    weight: int
+    color: str
+    background: str
+    border_top: str = None
+
+
+@dataclass(frozen=True)
+class Theme:
+    name: str
+    window_background: str
+    zone: FontStyle
+    date: FontStyle
+    clock: FontStyle
+
+
+@dataclass(frozen=True)
+class ZoneEvents:
+    chime: str = None
+    quiet_hours: tuple = None
+
+
+@dataclass(frozen=True)
+class Alarm:
+    zone: str
+    hour: int
+    minute: int
+    label: str
+    days: tuple
+    sound: str = None
+
+
+@dataclass(frozen=True)
+class Reminder:
+    zone: str
+    at: datetime
+    label: str
+    sound: str = None
+
+
+@dataclass(frozen=True)
+class EventSettings:
+    quiet_hours: tuple
+    zones: MappingProxyType
+    alarms: tuple
+    reminders: tuple
+
+
+@dataclass(frozen=True)
+class ProfilerSettings:
+    enabled: bool = False
+    overlay: bool = True
+    export: str = None
+    samples: int = 600
+
+
+@dataclass(frozen=True)
+class ServerSettings:
+    enabled: bool = False
+    host: str = '127.0.0.1'
+    port: int = 8765
+    socket: str = None
+
+
+def _clock(section):
+    return ClockSettings(MappingProxyType(dict(section['clocks'])), section['date.format'],
+                         section['time.format'], section['chime'],
+                         section['chime.offset'], section['chime.volume'])
+
+
+def _align(section):
+    return AlignSettings(*(Alignment(section[part]['horizontal'], section[part]['vertical'])
+                           for part in ('zone', 'date', 'clock')))
+
+
+def _font(section):
+    return FontStyle(section['font'], section['font.size'], int(section['font.weight']),
+                     section['font.color'], section['background'], section.get('border-top'))
+
+
+def _quiet_hours(hours, path):
+    if hours is None:
+        return None
+    if len(hours) != 2 or not all(0 <= hour < 24 for hour in hours):
+        raise SettingsError(f'{path} must be [start hour, end hour]')
+    return tuple(hours)
+
+
+def _alarm(index, section):
+    path = f'settings[\'events\'][\'alarms\'][{index}]'
+    try:
+        time = datetime.strptime(section['time'], '%H:%M')
+    except ValueError:
+        raise SettingsError(f'{path} time must be HH:MM, not {section["time"]!r}') from None
+    days = tuple(day.lower()[:3] for day in section.get('days', WEEKDAYS))
+    if not all(day in WEEKDAYS for day in days):
+        raise SettingsError(f'{path} days must be weekday names')
+    return Alarm(section['zone'], time.hour, time.minute, section.get('label', 'Alarm'), days, section.get('sound'))
+
+
+def _reminder(index, section):
+    try:
+        at = datetime.fromisoformat(section['at'])
+    except ValueError:
+        raise SettingsError(f'settings[\'events\'][\'reminders\'][{index}] at must be '
+                            f'YYYY-MM-DD HH:MM, not {section["at"]!r}') from None
+    return Reminder(section['zone'], at.replace(tzinfo=None), section.get('label', 'Reminder'), section.get('sound'))
+
+
+def _events(section):
+    zones = {name: ZoneEvents(zone.get('chime'),
+                              _quiet_hours(zone.get('quiet.hours'), f'settings[\'events\'][\'zones\'][{name!r}]'))
+             for name, zone in section.get('zones', {}).items()}
+    return EventSettings(_quiet_hours(section.get('quiet.hours', QUIET_HOURS), "settings['events']['quiet.hours']"),
+                         MappingProxyType(zones),
+                         tuple(_alarm(index, alarm) for index, alarm in enumerate(section.get('alarms', []))),
+                         tuple(_reminder(index, reminder) for index, reminder in enumerate(section.get('reminders', []))))
+
+
+def _profiler(section):
+    if section.get('samples', 1) < 1:
+        raise SettingsError("settings['profiler']['samples'] must be at least 1")
+    return ProfilerSettings(section.get('enabled', False), section.get('overlay', True),
+                            section.get('export'), section.get('samples', 600))
+
+
+def _server(section):
+    host = section.get('host', '127.0.0.1')
+    # Only ever served to this machine
+    if host not in ('127.0.0.1', 'localhost', '::1'):
+        raise SettingsError(f"settings['server']['host'] must be a loopback address, not {host!r}")
+    if not 0 <= section.get('port', 8765) < 65536:
+        raise SettingsError("settings['server']['port'] must be between 0 and 65535")
+    return ServerSettings(section.get('enabled', False), host, section.get('port', 8765), section.get('socket'))
+
+
+def _theme(name, section):
+    return Theme(name, section['window.background'],
+                 _font(section['zone']), _font(section['date']), _font(section['clock']))
+
+
+class Settings:
+    """settings.json parsed once, validated and flattened into frozen attributes.
+
+    `data` keeps the raw dict. reload_if_changed() re-parses only when the
+    file's mtime has changed; an invalid edit keeps the previous settings.
+    `version` counts the reloads, so each watcher can tell whether it has
+    seen the latest one whoever did the reloading.
+    """
+
+    def __init__(self, path='settings.json', data=None):
+        self.path = path
+        self.version = 0
+        self.mtime = os.stat(path).st_mtime_ns if os.path.isfile(path) else None
+        self._apply(self._read() if data is None else data)
+
+    def _read(self):
+        if not os.path.isfile(self.path):
+            write_user_settings(self.path)
+            self.mtime = os.stat(self.path).st_mtime_ns
+            return fallback_settings
+        self.mtime = os.stat(self.path).st_mtime_ns
+        with open(self.path, 'r', encoding='utf-8') as file:
             data = json.load(file)
-            if data.get('app') == 'MultiClock':
-                return data
-            else:
-                write_user_settings()
-    else:
-        write_user_settings()
-    return fallback_settings
+        if data.get('app') != 'MultiClock':
+            raise SettingsError(f'{self.path} is not a MultiClock settings file')
+        validate(data)
+        if data['selected_theme'] not in data['themes']:
+            raise SettingsError(f'selected_theme {data["selected_theme"]!r} is not defined in themes')
+        return data
 
+    def _apply(self, data):
+        # Parsed first, so a bad value leaves every attribute as it was
+        events = _events(data.get('events', {}))
+        profiler = _profiler(data.get('profiler', {}))
+        server = _server(data.get('server', {}))
+        self.data = data
+        window = data['window.defaults']
+        self.window = WindowSettings(window['title'], window['icon'], window['icon_alt'],
+                                     window['background'], window['opacity'], window['timer'])
+        self.clock = _clock(data['clock.defaults'])
+        self.clock_horizontal = _clock(data['clock.defaults.horizontal'])
+        self.align = _align(data['clock.align'])
+        self.align_horizontal = _align(data['clock.align.horizontal'])
+        self.themes = MappingProxyType({name: _theme(name, section)
+                                        for name, section in data['themes'].items()})
+        self.theme_name = data['selected_theme']
+        self.theme = self.themes[self.theme_name]
+        self.events = events
+        self.profiler = profiler
+        self.server = server
 
-        
\ No newline at end of file
+    def reload_if_changed(self) -> bool:
+        """Re-parse the file if its mtime changed; return True if settings were replaced."""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self.mtime:
+            return False
+        try:
+            self._apply(self._read())
+        except (OSError, ValueError) as error:
+            print(f'Keeping previous settings: {error}', file=sys.stderr)
+            return False
+        self.version += 1
+        return True
+
+
+_loaded = {}
+
+def get_settings(path='settings.json') -> Settings:
+    """The process-wide Settings for `path`, parsed once; SettingsWatcher reloads it."""
+    settings = _loaded.get(path)
+    if settings is None:
+        try:
+            settings = Settings(path)
+        except (OSError, ValueError) as error:
+            # Fall back to the defaults but leave the user's file alone
+            print(f'Using default settings: {error}', file=sys.stderr)
+            settings = Settings(path, fallback_settings)
+        _loaded[path] = settings
+    return settings
+
+def load_settings(path='settings.json'):
+    """Raw settings dict, shared with get_settings() so the file is parsed once."""
+    return get_settings(path).data
@@ -0,0 +1,41 @@
+"""
+MultiClock dashboard: the digital list, the analog strip or both, in one process.
+
+    python dashboard.py             both windows
+    python dashboard.py --digital   the vertical digital list only
+    python dashboard.py --analog    the horizontal analog strip only
+
+The windows share one ClockHub, so settings.json is parsed and watched once,
+every zone is resolved once, a single timer ticks both windows from the same
+zone states and each chime, alarm and reminder plays once.
+"""
+
+import startup_timeline
+import sys
+from PyQt6.QtWidgets import QApplication
+import multiclock, multiclock_analog
+from clock_hub import ClockHub
+
+startup_timeline.mark('imports')
+
+
+def windows(argv, hub) -> list:
+    digital = '--digital' in argv
+    analog = '--analog' in argv
+    shown = []
+    if digital or not analog:
+        shown.append(multiclock.Window(hub))
+    if analog or not digital:
+        shown.append(multiclock_analog.Window(hub))
+    return shown
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    startup_timeline.mark('QApplication')
+    hub = ClockHub(multiclock.current_zone)
+    dashboard = windows(sys.argv, hub)
+    for window in dashboard:
+        window.show()
+    startup_timeline.mark('shown')
+    sys.exit(app.exec())
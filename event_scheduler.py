@@ -0,0 +1,64 @@
+"""
+Timer-driven clock events for MultiClock.
+
+EventScheduler keeps the chimes, alarms and reminders in a
+multiclock_core EventQueue and arms one precise single-shot timer for the
+earliest of them, instead of checking every tick. The timer is started
+early by `lead()` seconds, typically the chime's measured audio latency.
+"""
+
+import math
+from time import time, perf_counter_ns
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+from multiclock_core import EventQueue
+from tick_profiler import NULL_PROFILER
+
+# Never sleep longer than this, so system clock changes are noticed
+MAX_WAIT = 60.0
+
+
+class EventScheduler(QObject):
+    """Emits `fired` with due (instant, rule) pairs and `missed` with those found too late."""
+
+    fired = pyqtSignal(list)
+    missed = pyqtSignal(list)
+
+    def __init__(self, lead=None, parent=None, missed_after: float = 5.0):
+        super().__init__(parent)
+        self.lead = lead or (lambda: 0.0)
+        self.missed_after = missed_after
+        self.queue = EventQueue(missed_after=missed_after)
+        self.profiler = NULL_PROFILER
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def set_rules(self, rules):
+        """Replace every scheduled event, counting from now."""
+        self.queue = EventQueue(rules, time(), self.missed_after)
+        self._arm()
+
+    def next_instant(self):
+        return self.queue.next_instant()
+
+    def stop(self):
+        self._timer.stop()
+
+    def _arm(self):
+        instant = self.queue.next_instant()
+        if instant is None:
+            self._timer.stop()
+            return
+        wait = min(instant - self.lead() - time(), MAX_WAIT)
+        self._timer.start(max(0, math.ceil(wait * 1000)))
+
+    def _on_timeout(self):
+        started = perf_counter_ns()
+        due, missed = self.queue.pop_due(time(), self.lead())
+        self._arm()
+        if missed:
+            self.missed.emit(missed)
+        if due:
+            self.fired.emit(due)
+        self.profiler.record('events', perf_counter_ns() - started)
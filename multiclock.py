@@ -1,29 +1,31 @@
 __version__ = '1.1'
 
+import startup_timeline
 from PyQt6.QtWidgets import (QApplication,
                              QWidget,
                              QVBoxLayout,
-                             QGridLayout,
                              QLabel)
-from PyQt6.QtCore import Qt, QTimer, QUrl
-from PyQt6.QtGui import QIcon, QFont, QPixmap
-from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
-import sys, os
-import pytz
+from PyQt6.QtCore import Qt
+import sys
 from tzlocal import get_localzone
-from datetime import datetime
-from time import perf_counter, sleep
+from time import time
 import config
+from multiclock_core import ClockFormatter, shows_seconds
+from clock_hub import ClockView
+from resources import resources
+from zone_list import ZoneListModel, ZoneDelegate, ZoneListView
 
-basedir = os.path.dirname(__file__)
+startup_timeline.mark('imports')
 
-settings = config.load_settings()
 
-clocks = settings['clock.defaults']['clocks']
+settings = config.get_settings()
+startup_timeline.mark('settings')
+
+clocks = settings.clock.clocks
 zones = [key for key in clocks.keys()]
 current_zone = str(get_localzone())
 
-theme_name = settings['selected_theme']
+theme_name = settings.theme_name
 
 def screen_size():
     screen = QApplication.primaryScreen()
@@ -31,193 +33,147 @@ def screen_size():
         geom = screen.geometry()
     return (geom.width(), geom.height())
 
-def current_times(clocks=clocks):
-    times = []
-    for key in clocks.keys():
-        times.append(datetime.now(pytz.timezone(clocks[key])))
-    return times
-
-def utc_offset(timezone_name, dt_obj=None):
-    try:
-        tz = pytz.timezone(timezone_name)
-    except pytz.UnknownTimeZoneError:
-        return '?'
-    dt_obj = datetime.now(tz) if not None else tz.localize(dt_obj)
-    offset_timedelta = dt_obj.utcoffset()
-    if offset_timedelta is None:
-        return '?'
-    return int(offset_timedelta.total_seconds() / 3600)
-
-def get_utc_offsets(clocks=clocks):
-    offsets = {}
-    for key in clocks.keys():
-        offsets[key] = str(utc_offset(clocks[key]))
-    return offsets
-
-utc_offsets = get_utc_offsets(clocks)
-
-def full_path(rel_path):
-    return os.path.abspath(rel_path)
-
-class Window(QWidget):
-    def __init__(self) -> None:
+class Window(ClockView, QWidget):
+    def __init__(self, hub=None) -> None:
         super().__init__()
 
-        self.setWindowTitle(settings['window.defaults']['title'])
-
         window_width = 325
-        window_height = int(100 * len(clocks))
         screen_width, screen_height = screen_size()
         left = screen_width - window_width - 20
         #top = (screen_height - window_height) // 2
         top = 40
+        # Beyond what fits on screen the zone list scrolls
+        self.max_height = screen_height - top - 40
+        window_height = self.window_height(len(clocks))
 
         self.setGeometry(left, top, window_width, window_height)
-        self.setWindowIcon(QIcon(settings['window.defaults']['icon']))
-        self.setStyleSheet(f'background: {settings['themes'][theme_name]['window.background']};')
-        self.setWindowOpacity(settings['window.defaults']['opacity'])
-
-        self.night = QPixmap('./assets/night.png')
-        self.dawn = QPixmap('./assets/dawn.png')
-        self.day = QPixmap('./assets/day.png')
-        self.dusk = QPixmap('./assets/dusk.png')
+        self.setup_view(hub, clocks, current_zone)
 
-        self.create_clocks()
-        self.update_time()
+    def set_formats(self):
+        self.formatter = ClockFormatter(settings.clock.date_format,
+                                        settings.clock.time_format,
+                                        len(self.zones))
+        # Only the local clock, or a time format with seconds, changes within a minute
+        self.second_zones = [index for index, zone in enumerate(self.zones)
+                             if self.clocks[zone] == current_zone or shows_seconds(settings.clock.time_format)]
+        self.second_set = set(self.second_zones)
 
-        # The following function aligns the timer to the computer clock within milliseconds
-        self.align_time()
-
-        timer = QTimer(self)
-        timer.timeout.connect(lambda: self.update_time())
-        timer.start(settings['window.defaults']['timer'])
+    def window_height(self, zone_count):
+        return min(int(100 * zone_count), self.max_height)
 
     def create_clocks(self):
         vbox = QVBoxLayout()
         vbox.setContentsMargins(12, 6, 12, 6)
 
-        main_label = QLabel()
-        main_label.setText(f'MultiClock <span style="font-size: 12px;">(version {__version__})</span>')
-        main_label.setMaximumHeight(60)
-        main_label.setFont(QFont('Aptos Narrow', 16))
-        main_label.setStyleSheet(f'color: {settings['themes'][theme_name]['zone']['font.color']}; border-bottom: 1px solid {settings['themes'][theme_name]['zone']['font.color']}; padding-bottom: 3px; margin-bottom: 6px;')
-        main_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        vbox.addWidget(main_label)
-       
-        self.tz_names = []
-        self.tz_dates = []
-        self.tz_imgs = []
-        self.tz_clocks = []
-        self.tz_grids = []
-
-        # Initialize Qlabels for each Timezone in Clocks
-        for key in clocks.keys():
-            self.tz_names.append(QLabel())
-            self.tz_dates.append(QLabel())
-            self.tz_imgs.append(QLabel())
-            self.tz_clocks.append(QLabel())
-            self.tz_grids.append(QGridLayout())
-
-        for grid in self.tz_grids:
-            vbox.addLayout(grid)
-
-        theme = settings['themes'][theme_name]
-        align = settings['clock.align']
-
-        # Set formats for labels
-        for tz_name, tz_date, tz_img, tz_clock, tz_grid, zone in \
-            zip(self.tz_names, self.tz_dates, self.tz_imgs, self.tz_clocks, self.tz_grids, zones):
-
-            tz_name.setStyleSheet(f'background: {theme['zone']['background']}; color: {theme['zone']['font.color']};')
-            tz_name.setFont(QFont(theme['zone']['font'], theme['zone']['font.size'], theme['zone']['font.weight']))
-            tz_name.setAlignment(Qt.AlignmentFlag(align['zone']['horizontal']) | Qt.AlignmentFlag(align['zone']['vertical']))
-            tz_name.setText(zone)
-
-            tz_date.setStyleSheet(f'background: {theme['date']['background']}; color: {theme['date']['font.color']};')
-            tz_date.setFont(QFont(theme['date']['font'], theme['date']['font.size'], theme['date']['font.weight']))
-            tz_date.setAlignment(Qt.AlignmentFlag(align['date']['horizontal']) | Qt.AlignmentFlag(align['date']['vertical']))
-
-            tz_img.setStyleSheet(f'background: {theme['date']['background']}; color: {theme['date']['font.color']}; height: 50; width: 50;')
-
-            tz_clock.setStyleSheet(f'background: {theme['clock']['background']}; color: {theme['clock']['font.color']};')
-            tz_clock.setFont(QFont(theme['clock']['font'], theme['clock']['font.size'], theme['clock']['font.weight']))
-            tz_clock.setAlignment(Qt.AlignmentFlag(align['clock']['horizontal']) | Qt.AlignmentFlag(align['clock']['vertical']))
-
-            tz_grid.addWidget(tz_name, 0, 0, 1, 1)
-            tz_grid.addWidget(tz_date, 0, 1, 1, 2)
-            tz_grid.addWidget(tz_img, 1, 0, 1, 1)
-            tz_grid.addWidget(tz_clock, 1, 1, 1, 2)
-
-        self.tz_imgs[-1].setStyleSheet('margin-bottom: 12px')
-
-        theme_label = QLabel()
-        theme_label.setMaximumHeight(20)
-        theme_label.setText(f'The current theme is <span style="font-weight: bold;">{settings['selected_theme'].title()}</span>')
-        theme_label.setFont(QFont('Aptos Narrow', 9))
-        theme_label.setStyleSheet(f'color: {theme['zone']['font.color']}; border-bottom: 1px solid {theme['zone']['font.color']}; padding-bottom: 3px;')
-        theme_label.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom)
-        vbox.addWidget(theme_label)
-
-        static = QLabel()
-        static.setMaximumHeight(15)
-        static.setText(f'MultiClock, Copyright © 2025, Ben Fisher')
-        static.setFont(QFont('Aptos Narrow', 9))
-        static.setStyleSheet(f'color: {theme['zone']['font.color']};')
-        static.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom)
-        vbox.addWidget(static)
+        self.main_label = QLabel()
+        self.main_label.setText(f'MultiClock <span style="font-size: 12px;">(version {__version__})</span>')
+        self.main_label.setMaximumHeight(60)
+        self.main_label.setFont(resources.font('Aptos Narrow', 16))
+        self.main_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        vbox.addWidget(self.main_label)
+
+        # Rows are painted by a delegate, and only those in view, so any number of zones costs the same
+        self.zone_model = ZoneListModel(self.render_state, self)
+        self.zone_delegate = ZoneDelegate(self.day_image, self)
+        self.zone_list = ZoneListView()
+        self.zone_list.setModel(self.zone_model)
+        self.zone_list.setItemDelegate(self.zone_delegate)
+        self.zone_list.visible_changed.connect(self.refresh_visible)
+        vbox.addWidget(self.zone_list)
+
+        self.theme_label = QLabel()
+        self.theme_label.setMaximumHeight(20)
+        self.theme_label.setFont(resources.font('Aptos Narrow', 9))
+        self.theme_label.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom)
+        vbox.addWidget(self.theme_label)
+
+        self.static = QLabel()
+        self.static.setMaximumHeight(15)
+        self.static.setText(f'MultiClock, Copyright © 2025, Ben Fisher')
+        self.static.setFont(resources.font('Aptos Narrow', 9))
+        self.static.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom)
+        vbox.addWidget(self.static)
         self.setLayout(vbox)
 
-
-
-    def update_time(self):
-
-        _test_chime = False
-
-        for zone, tz_name, tz_date, tz_img, tz_clock, current_time in \
-            zip(zones, self.tz_names, self.tz_dates, self.tz_imgs, self.tz_clocks, current_times(clocks)):
-            tz_name.setText(zone + ' (UTC ' + utc_offsets[zone] + ')')
-            tz_date.setText(current_time.strftime(settings['clock.defaults']['date.format']))
-            if clocks[zone] == current_zone:
-                tz_clock.setText(current_time.strftime('%H:%M') + f'<span style="font-size: 20px;">:{current_time.strftime('%S')}</span>')
-            else:
-                tz_clock.setText(current_time.strftime(settings['clock.defaults']['time.format']))
-            self.set_image(tz_img, current_time)
-        if _test_chime:
-            if datetime.now().second == 59 + settings['clock.defaults']['chime.offset']:
-                self.play_chime()
-        if datetime.now().minute == 59 and \
-            datetime.now().second == 59 + settings['clock.defaults']['chime.offset']:
-                if datetime.now().hour > 7 and datetime.now().hour < 22:
-                # The chime is overridden (silent mode) between 22:00 to 08:00 the next day
-                    self.play_chime()
-
-    def play_chime(self):
-        self.player = QMediaPlayer()
-        self.audio_output = QAudioOutput()
-        self.player.setAudioOutput(self.audio_output)
-        self.player.setSource(QUrl.fromLocalFile(full_path(settings['clock.defaults']['chime'])))
-        self.audio_output.setVolume(settings['clock.defaults']['chime.volume'])
-        self.player.play()
-
-    def set_image(self, image_host: QLabel, current_time):
-        if current_time.hour >= 5 and current_time.hour < 8:
-            image_host.setPixmap(self.dawn)
-        elif current_time.hour >= 8 and current_time.hour < 17:
-            image_host.setPixmap(self.day)
-        elif current_time.hour >= 17 and current_time.hour < 19:
-            image_host.setPixmap(self.dusk)
+        self.restyle()
+
+    def window_title(self):
+        return settings.window.title
+
+    def restyle(self):
+        """Apply the current theme and alignment to the window and every row in place."""
+        theme = settings.theme
+        self.setStyleSheet(resources.stylesheet(theme, 'window'))
+        self.main_label.setStyleSheet(resources.stylesheet(theme, 'heading'))
+        self.show_theme_name()
+        self.theme_label.setStyleSheet(resources.stylesheet(theme, 'notice'))
+        self.static.setStyleSheet(resources.stylesheet(theme, 'footer'))
+        self.zone_delegate.set_style(theme, settings.align)
+        self.zone_list.setStyleSheet(resources.stylesheet(theme, 'zone_list'))
+        self.zone_list.viewport().update()
+
+    def apply_clocks(self):
+        self.zone_model.reset()
+        self.resize(self.width(), self.window_height(len(self.zones)))
+
+    def update_time(self, now_utc=None, rows=None):
+        """Tick the zones in view; `rows` forces those rows to be brought up to date."""
+        if now_utc is None:
+            now_utc = time()
+        minute = int(now_utc // 60)
+        render = self.render_state
+        render.begin_tick()
+        visible = self.zone_list.visible_rows()
+        if rows is not None:
+            indices = rows
+        elif minute == self.last_minute and render.enabled:
+            indices = [index for index in visible if index in self.second_set]
         else:
-            image_host.setPixmap(self.night)
-        image_host.setScaledContents(False)
-
-    def align_time(self):
-        """This function aligns the application timer and the now() time."""
-        sleep(1 - perf_counter() % 1)
-
+            indices = visible
+            self.last_minute = minute
+        profiler = self.hub.profiler
+        zone_states = self.core.tick(now_utc, indices)
+        profiler.lap('zones')
+        formatter = self.formatter
+        pending = []
+        for zone_state in zone_states:
+            index, current_time = zone_state.index, zone_state.wall_time
+            state = render.zones[index]
+            texts = []
+            # Names and dates only change on a minute boundary; a sunrise is shown from the next one
+            if render.minute_changed(state, minute):
+                texts += [('name', zone_state.name + ' (UTC ' + zone_state.offset_label + ')'),
+                          ('date', formatter.date(index, current_time)),
+                          ('phase', zone_state.day_phase)]
+            if zone_state.is_local:
+                texts += [('clock', formatter.local_main(current_time)),
+                          ('seconds', formatter.local_seconds(current_time))]
+            else:
+                texts.append(('clock', formatter.time(current_time)))
+            pending.append((index, state, texts))
+        profiler.lap('format')
+        changed = []
+        for index, state, texts in pending:
+            dirty = False
+            for field, text in texts:
+                dirty |= render.changed(state, field, text)
+            if dirty:
+                changed.append(index)
+        self.zone_model.rows_changed(changed)
+        profiler.lap('labels')
+
+    def refresh_visible(self):
+        """Bring rows that scrolled or resized into view up to date straight away."""
+        self.update_time(rows=self.zone_list.visible_rows())
+
+    def day_image(self, phase):
+        # Decoded on first use and shared; most sessions only ever show one or two phases
+        return resources.pixmap(f'./assets/{phase}.png')
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon(os.path.join(basedir, settings['window.defaults']['icon'])))
+    startup_timeline.mark('QApplication')
     window = Window()
     window.show()
+    startup_timeline.mark('shown')
     sys.exit(app.exec())
\ No newline at end of file
@@ -1,30 +1,32 @@
 __version__ = '1.1'
 
+import startup_timeline
 from PyQt6.QtWidgets import (QApplication,
                              QWidget,
-                             QHBoxLayout,
+                             QGridLayout,
                              QVBoxLayout,
                              QLabel)
-from PyQt6.QtCore import Qt, QTimer, QUrl
-from PyQt6.QtGui import QIcon, QFont, QPixmap
-from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
-import sys, os
-import pytz
+from PyQt6.QtCore import Qt
+import sys
 from tzlocal import get_localzone
-from datetime import datetime
-from time import perf_counter, sleep
+from time import time
 import config
-from aclockv import QAClock
+from multiclock_core import ClockFormatter
+from clock_hub import ClockView
+from resources import resources
+from aclock_strip import AnalogClockStrip
 
-basedir = os.path.dirname(__file__)
+startup_timeline.mark('imports')
 
-settings = config.load_settings()
 
-clocks = settings['clock.defaults.horizontal']['clocks']
+settings = config.get_settings()
+startup_timeline.mark('settings')
+
+clocks = settings.clock_horizontal.clocks
 zones = [key for key in clocks.keys()]
 current_zone = str(get_localzone())
 
-theme_name = settings['selected_theme']
+theme_name = settings.theme_name
 
 def screen_size():
     screen = QApplication.primaryScreen()
@@ -32,39 +34,12 @@ def screen_size():
         geom = screen.geometry()
     return (geom.width(), geom.height())
 
-def current_times(clocks=clocks):
-    times = []
-    for key in clocks.keys():
-        times.append(datetime.now(pytz.timezone(clocks[key])))
-    return times
-
-def utc_offset(timezone_name, dt_obj=None):
-    try:
-        tz = pytz.timezone(timezone_name)
-    except pytz.UnknownTimeZoneError:
-        return '?'
-    dt_obj = datetime.now(tz) if not None else tz.localize(dt_obj)
-    offset_timedelta = dt_obj.utcoffset()
-    if offset_timedelta is None:
-        return '?'
-    return int(offset_timedelta.total_seconds() / 3600)
-
-def get_utc_offsets(clocks=clocks):
-    offsets = {}
-    for key in clocks.keys():
-        offsets[key] = str(utc_offset(clocks[key]))
-    return offsets
-
-utc_offsets = get_utc_offsets(clocks)
-
-def full_path(rel_path):
-    return os.path.abspath(rel_path)
-
-class Window(QWidget):
-    def __init__(self) -> None:
-        super().__init__()
+class Window(ClockView, QWidget):
+    horizontal = True
+    icon_setting = 'icon_alt'
 
-        self.setWindowTitle("MultiClock Analog")
+    def __init__(self, hub=None) -> None:
+        super().__init__()
 
         window_height = 325
         window_width = int(175 * len(clocks))
@@ -74,144 +49,179 @@ class Window(QWidget):
         top = 40
 
         self.setGeometry(left, top, window_width, window_height)
-        self.setWindowIcon(QIcon(settings['window.defaults']['icon_alt']))
-        self.setStyleSheet(f'background: {settings['themes'][theme_name]['window.background']};')
-        self.setWindowOpacity(settings['window.defaults']['opacity'])
-
-        self.night = QPixmap('./assets/night.png')
-        self.dawn = QPixmap('./assets/dawn.png')
-        self.day = QPixmap('./assets/day.png')
-        self.dusk = QPixmap('./assets/dusk.png')
-
-        self.create_clocks()
-        self.update_time()
+        self.setup_view(hub, clocks, current_zone)
 
-        # The following function aligns the timer to the computer clock within milliseconds
-        self.align_time()
-
-        timer = QTimer(self)
-        timer.timeout.connect(lambda: self.update_time())
-        timer.start(settings['window.defaults']['timer'])
+    def set_formats(self):
+        self.formatter = ClockFormatter(settings.clock.date_format,
+                                        settings.clock.time_format,
+                                        len(self.zones))
+        # Every analog face has a second hand, so all zones change each second
+        self.second_zones = list(range(len(self.zones)))
 
     def create_clocks(self):
         global_vbox = QVBoxLayout()
 
 
-        hbox = QHBoxLayout()
-        # hbox.setContentsMargins(0, 12, 0, 12)
-
-        main_label = QLabel()
-        main_label.setText(f'MultiClock Analog <span style="font-size: 12px;">(version {__version__})</span>')
-        main_label.setMaximumHeight(60)
-        main_label.setFont(QFont('Aptos Narrow', 16))
-        main_label.setStyleSheet(f'color: {settings['themes'][theme_name]['zone']['font.color']}; border-bottom: 1px solid {settings['themes'][theme_name]['zone']['font.color']}; padding-bottom: 3px; margin-bottom: 6px;')
-        main_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        global_vbox.addWidget(main_label)
-
-        global_vbox.addLayout(hbox)
-
-        self.tz_names = []
-        self.tz_dates = []
-        self.tz_aclocks = []
-        self.tz_clocks = []
-        self.tz_vboxes = []
+        self.grid = QGridLayout()
+        # self.grid.setContentsMargins(0, 12, 0, 12)
 
-        # Initialize Qlabels for each Timezone in Clocks
-        for key in clocks.keys():
-            self.tz_names.append(QLabel())
-            self.tz_dates.append(QLabel())
-            self.tz_aclocks.append(QAClock())
-            self.tz_clocks.append(QLabel())
-            self.tz_vboxes.append(QVBoxLayout())
+        self.main_label = QLabel()
+        self.main_label.setText(f'MultiClock Analog <span style="font-size: 12px;">(version {__version__})</span>')
+        self.main_label.setMaximumHeight(60)
+        self.main_label.setFont(resources.font('Aptos Narrow', 16))
+        self.main_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        global_vbox.addWidget(self.main_label)
 
-        for tz_vbox in self.tz_vboxes:
-            hbox.addLayout(tz_vbox)
+        global_vbox.addLayout(self.grid)
 
-        theme = settings['themes'][theme_name]
-        align = settings['clock.align.horizontal']
+        # Columns are kept by zone name so a settings reload can add, drop or reorder them
+        self.columns = {}
+        for zone in self.zones:
+            self.columns[zone] = self.create_column(zone)
 
-        # Set formats for labels
-        for tz_name, tz_date, tz_aclock, tz_clock, tz_vbox, zone in \
-            zip(self.tz_names, self.tz_dates, self.tz_aclocks, self.tz_clocks, self.tz_vboxes, zones):
-
-            tz_name.setStyleSheet(f'background: {theme['zone']['background']}; color: {theme['zone']['font.color']};')
-            tz_name.setFont(QFont(theme['zone']['font'], theme['zone']['font.size'], theme['zone']['font.weight']))
-            tz_name.setAlignment(Qt.AlignmentFlag(align['zone']['horizontal']) | Qt.AlignmentFlag(align['zone']['vertical']))
-            tz_name.setText(zone)
-
-            tz_date.setStyleSheet(f'background: {theme['date']['background']}; color: {theme['date']['font.color']};')
-            tz_date.setFont(QFont(theme['date']['font'], theme['date']['font.size'], theme['date']['font.weight']))
-            tz_date.setAlignment(Qt.AlignmentFlag(align['date']['horizontal']) | Qt.AlignmentFlag(align['date']['vertical']))
-
-            tz_clock.setStyleSheet(f'background: {theme['clock']['background']}; color: {theme['clock']['font.color']};')
-            tz_clock.setFont(QFont(theme['clock']['font'], theme['clock']['font.size'], theme['clock']['font.weight']))
-            tz_clock.setAlignment(Qt.AlignmentFlag(align['clock']['horizontal']) | Qt.AlignmentFlag(align['clock']['vertical']))
-
-            tz_vbox.addWidget(tz_name)
-            tz_vbox.addWidget(tz_date)
-            tz_vbox.addWidget(tz_aclock.view)
-            tz_vbox.addWidget(tz_clock)
+        # All analog faces are painted by one widget spanning the zone columns
+        self.aclock_strip = AnalogClockStrip(len(self.zones))
+        self.layout_columns()
 
+        self.theme_label = QLabel()
+        self.theme_label.setMaximumHeight(20)
+        self.theme_label.setFont(resources.font('Aptos Narrow', 9))
+        self.theme_label.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom)
+        global_vbox.addWidget(self.theme_label)
 
-        theme_label = QLabel()
-        theme_label.setMaximumHeight(20)
-        theme_label.setText(f'The current theme is <span style="font-weight: bold;">{settings['selected_theme'].title()}</span>')
-        theme_label.setFont(QFont('Aptos Narrow', 9))
-        theme_label.setStyleSheet(f'color: {theme['zone']['font.color']}; border-bottom: 1px solid {theme['zone']['font.color']}; padding-bottom: 3px;')
-        theme_label.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom)
-        global_vbox.addWidget(theme_label)
 
 
-
-        static = QLabel()
-        static.setMaximumHeight(15)
-        static.setText(f'MultiClock Analog, Copyright © 2025, Ben Fisher')
-        static.setFont(QFont('Aptos Narrow', 9))
-        static.setStyleSheet(f'color: {theme['zone']['font.color']};')
-        static.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom)
-        global_vbox.addWidget(static)
+        self.static = QLabel()
+        self.static.setMaximumHeight(15)
+        self.static.setText(f'MultiClock Analog, Copyright © 2025, Ben Fisher')
+        self.static.setFont(resources.font('Aptos Narrow', 9))
+        self.static.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom)
+        global_vbox.addWidget(self.static)
 
 
         self.setLayout(global_vbox)
+        self.restyle()
+
+    def create_column(self, zone):
+        tz_name, tz_date, tz_clock = QLabel(), QLabel(), QLabel()
+        tz_name.setText(zone)
+        return tz_name, tz_date, tz_clock
+
+    def layout_columns(self):
+        """Place every zone's labels and the clock strip in the grid, in zone order."""
+        for column in range(self.grid.columnCount()):
+            self.grid.setColumnStretch(column, 0)
+        for column, zone in enumerate(self.zones):
+            tz_name, tz_date, tz_clock = self.columns[zone]
+            self.grid.addWidget(tz_name, 0, column)
+            self.grid.addWidget(tz_date, 1, column)
+            self.grid.addWidget(tz_clock, 3, column)
+            self.grid.setColumnStretch(column, 1)
+        self.grid.addWidget(self.aclock_strip, 2, 0, 1, max(len(self.zones), 1))
+        self.tz_names = [self.columns[zone][0] for zone in self.zones]
+        self.tz_dates = [self.columns[zone][1] for zone in self.zones]
+        self.tz_clocks = [self.columns[zone][2] for zone in self.zones]
+
+    def window_title(self):
+        return 'MultiClock Analog'
+
+    def restyle(self):
+        """Apply the current theme and alignment to the window and every column in place."""
+        theme = settings.theme
+        self.setStyleSheet(resources.stylesheet(theme, 'window'))
+        self.main_label.setStyleSheet(resources.stylesheet(theme, 'heading'))
+        self.show_theme_name()
+        self.theme_label.setStyleSheet(resources.stylesheet(theme, 'notice'))
+        self.static.setStyleSheet(resources.stylesheet(theme, 'footer'))
+        self.aclock_strip.set_theme(settings.theme_name)
+        self.restyle_columns(self.zones)
+
+    def restyle_columns(self, columns):
+        theme = settings.theme
+        align = settings.align_horizontal
 
-    def update_time(self):
-
-        _test_chime = False
-
-        for zone, tz_name, tz_date, tz_aclock, tz_clock, current_time in \
-            zip(zones, self.tz_names, self.tz_dates, self.tz_aclocks, self.tz_clocks, current_times(clocks)):
-            tz_name.setText(zone + ' (UTC ' + utc_offsets[zone] + ')')
-            tz_date.setText(current_time.strftime(settings['clock.defaults']['date.format']))
-            if clocks[zone] == current_zone:
-                tz_clock.setText(current_time.strftime('%H:%M') + f'<span style="font-size: 20px;">:{current_time.strftime('%S')}</span>')
+        # Set formats for labels
+        for zone in columns:
+            tz_name, tz_date, tz_clock = self.columns[zone]
+
+            tz_name.setStyleSheet(resources.stylesheet(theme, 'zone'))
+            tz_name.setFont(resources.style_font(theme.zone))
+            tz_name.setAlignment(align.zone.flags)
+
+            tz_date.setStyleSheet(resources.stylesheet(theme, 'date'))
+            tz_date.setFont(resources.style_font(theme.date))
+            tz_date.setAlignment(align.date.flags)
+
+            tz_clock.setStyleSheet(resources.stylesheet(theme, 'clock'))
+            tz_clock.setFont(resources.style_font(theme.clock))
+            tz_clock.setAlignment(align.clock.flags)
+
+    def sync_columns(self):
+        """Add, remove and reorder zone columns to match self.zones, keeping existing widgets."""
+        for widgets in self.columns.values():
+            for widget in widgets:
+                self.grid.removeWidget(widget)
+        self.grid.removeWidget(self.aclock_strip)
+        for zone in [zone for zone in self.columns if zone not in self.clocks]:
+            for widget in self.columns.pop(zone):
+                widget.hide()
+                widget.deleteLater()
+        added = [zone for zone in self.zones if zone not in self.columns]
+        for zone in added:
+            self.columns[zone] = self.create_column(zone)
+        self.aclock_strip.set_count(len(self.zones))
+        self.layout_columns()
+        self.restyle_columns(added)
+        self.resize(int(175 * len(self.zones)), self.height())
+
+    def apply_clocks(self):
+        self.sync_columns()
+
+    def update_time(self, now_utc=None):
+        if now_utc is None:
+            now_utc = time()
+        minute = int(now_utc // 60)
+        render = self.render_state
+        render.begin_tick()
+        if minute == self.last_minute and render.enabled:
+            indices = self.second_zones
+        else:
+            indices = range(len(self.zones))
+            self.last_minute = minute
+        profiler = self.hub.profiler
+        # The strip times its own repaints, which happen after the tick
+        self.aclock_strip.profiler = profiler
+        zone_states = self.core.tick(now_utc, indices)
+        profiler.lap('zones')
+        formatter = self.formatter
+        pending = []
+        for zone_state in zone_states:
+            index, current_time = zone_state.index, zone_state.wall_time
+            state = render.zones[index]
+            texts = []
+            # Names and dates can only change on a minute boundary
+            if render.minute_changed(state, minute):
+                texts += [(self.tz_names[index], 'name', zone_state.name + ' (UTC ' + zone_state.offset_label + ')'),
+                          (self.tz_dates[index], 'date', formatter.date(index, current_time))]
+            if zone_state.is_local:
+                texts.append((self.tz_clocks[index], 'clock', formatter.local_time(current_time)))
             else:
-                tz_clock.setText(current_time.strftime(settings['clock.defaults']['time.format']))
-            tz_aclock.draw_clock(current_time)
-        if _test_chime:
-            if datetime.now().second == 59 + settings['clock.defaults']['chime.offset']:
-                self.play_chime()
-        if datetime.now().minute == 59 and \
-            datetime.now().second == 59 + settings['clock.defaults']['chime.offset']:
-                if datetime.now().hour > 7 and datetime.now().hour < 22:
-                # The chime is overridden (silent mode) between 22:00 to 08:00 the next day
-                    self.play_chime()
-
-    def play_chime(self):
-        self.player = QMediaPlayer()
-        self.audio_output = QAudioOutput()
-        self.player.setAudioOutput(self.audio_output)
-        self.player.setSource(QUrl.fromLocalFile(full_path(settings['clock.defaults']['chime'])))
-        self.audio_output.setVolume(settings['clock.defaults']['chime.volume'])
-        self.player.play()
-
-    def align_time(self):
-        """This function aligns the application timer and the now() time."""
-        sleep(1 - perf_counter() % 1)
+                texts.append((self.tz_clocks[index], 'clock', formatter.time(current_time)))
+            pending.append((state, texts))
+        profiler.lap('format')
+        for state, texts in pending:
+            for label, field, text in texts:
+                render.set_text(label, state, field, text)
+        profiler.lap('labels')
+        for zone_state in zone_states:
+            self.aclock_strip.set_time(zone_state.index, zone_state.wall_time)
+        profiler.lap('analog')
 
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon(os.path.join(basedir, settings['window.defaults']['icon_alt'])))
+    startup_timeline.mark('QApplication')
     window = Window()
     window.show()
+    startup_timeline.mark('shown')
     sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""
+Headless core of MultiClock: zone times, offsets, formats, day phases and
+chimes, with no Qt dependency. The windows are renderers on top of it.
+"""
+
+from .zones import ZoneClockEngine, UtcOffsetCache, format_utc_offset, utc_offset, transition_table, zone_table, load_timezone
+from .zones import convert_many, ZoneConversions, as_unix_seconds
+from .formatting import ClockFormatter, LOCAL_TIME_FORMAT, compile_format, shows_seconds, changes_within_day
+from .phases import DAY_PHASES, day_phase, DayPhaseSchedule, PHASE_ORDER, sun_transitions, zone_coordinates
+from .chimes import QUIET_HOURS, next_local_time, is_quiet
+from .core import ClockCore, ZoneState
+from .events import EventQueue, HourlyRule, DailyRule, OnceRule, build_rules
+from .catalog import ZoneCatalog, CatalogEntry, CITY_ALIASES
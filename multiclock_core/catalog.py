@@ -0,0 +1,186 @@
+"""
+Searchable catalog of every IANA zone, for picking clocks to add.
+
+Each entry carries the zone name, a city to show for it, its country and its
+current UTC offset. Listing the zones and countries reads the whole tz
+database, so the built entries are cached as JSON under the user's cache
+directory and rebuilt only when pytz ships a different database.
+
+ZoneCatalog.search() matches word prefixes through a sorted token list and
+falls back to an ordered-subsequence (fuzzy) match over each entry's text,
+so typos like 'kolkta' or run-togethers like 'nyork' still find a zone.
+"""
+
+import json, os, re, sys, time
+from bisect import bisect_left
+from dataclasses import dataclass, asdict
+import pytz
+from .zones import format_utc_offset, load_timezone, transition_table, zone_table
+
+# Bump when the entry layout changes, so old caches are rebuilt
+CATALOG_VERSION = 1
+
+# Well-known cities that have no zone of their own
+CITY_ALIASES = {
+    'Beijing': 'Asia/Shanghai',
+    'Mumbai': 'Asia/Kolkata',
+    'Delhi': 'Asia/Kolkata',
+    'Bangalore': 'Asia/Kolkata',
+    'Osaka': 'Asia/Tokyo',
+    'San Francisco': 'America/Los_Angeles',
+    'Seattle': 'America/Los_Angeles',
+    'Washington': 'America/New_York',
+    'Boston': 'America/New_York',
+    'Atlanta': 'America/New_York',
+    'Miami': 'America/New_York',
+    'Dallas': 'America/Chicago',
+    'Houston': 'America/Chicago',
+    'Montreal': 'America/Toronto',
+    'Munich': 'Europe/Berlin',
+    'Frankfurt': 'Europe/Berlin',
+    'Milan': 'Europe/Rome',
+    'Barcelona': 'Europe/Madrid',
+    'Geneva': 'Europe/Zurich',
+    'Edinburgh': 'Europe/London',
+    'Abu Dhabi': 'Asia/Dubai',
+    'Hanoi': 'Asia/Bangkok',
+    'Rio de Janeiro': 'America/Sao_Paulo',
+    'Canberra': 'Australia/Sydney',
+    'Wellington': 'Pacific/Auckland',
+}
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """One pickable clock: `city` shown in `zone`, with its offset as of the build."""
+
+    city: str
+    zone: str
+    country: str = ''
+    country_code: str = ''
+    offset: int = 0
+    # The offset above holds until this Unix instant
+    offset_until: float = 0
+
+    def offset_at(self, now: float) -> int:
+        if now < self.offset_until:
+            return self.offset
+        return _current_offset(zone_table(self.zone), now)[0]
+
+    def offset_label(self, now: float = None) -> str:
+        return format_utc_offset(self.offset_at(time.time() if now is None else now))
+
+
+def default_cache_path() -> str:
+    base = (os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME')
+            or os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base, 'MultiClock', 'zone_catalog.json')
+
+
+def _city(zone: str) -> str:
+    return zone.rsplit('/', 1)[-1].replace('_', ' ')
+
+
+def _current_offset(table, now: float):
+    """(offset, next_transition) at `now` from a transition_table."""
+    instants, offsets, _ = table
+    position = bisect_left(instants, int(now // 1) + 1) - 1
+    until = instants[position + 1] if position + 1 < len(instants) else float('inf')
+    return offsets[position], until
+
+
+def build_entries(now: float = None) -> list:
+    """Read every zone in pytz's database into catalog entries."""
+    now = time.time() if now is None else now
+    countries = {}
+    for code, zones in pytz.country_timezones.items():
+        for zone in zones:
+            countries.setdefault(zone, code)
+    entries = []
+    for city, zone in [(_city(zone), zone) for zone in pytz.all_timezones] + list(CITY_ALIASES.items()):
+        code = countries.get(zone, '')
+        try:
+            # Not through the zone_table cache: only the few zones picked need to stay loaded
+            offset, until = _current_offset(transition_table(load_timezone.__wrapped__(zone)), now)
+        except (OSError, pytz.UnknownTimeZoneError):
+            continue
+        entries.append(CatalogEntry(city, zone, pytz.country_names.get(code, ''), code.upper(), offset, until))
+    return entries
+
+
+class ZoneCatalog:
+    """Prefix and fuzzy search over catalog entries."""
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self._texts = []
+        tokens = []
+        for index, entry in enumerate(self.entries):
+            text = f'{entry.city} {entry.zone} {entry.country} {entry.country_code}'.lower()
+            self._texts.append(text)
+            tokens.extend((word, index) for word in set(_WORD.findall(text)))
+        tokens.sort()
+        self._tokens = tokens
+
+    def __len__(self):
+        return len(self.entries)
+
+    @classmethod
+    def load(cls, path: str = None, now: float = None) -> 'ZoneCatalog':
+        """The catalog from its cache file, building and saving it if missing or stale."""
+        path = default_cache_path() if path is None else path
+        stamp = {'version': CATALOG_VERSION, 'tzdata': pytz.OLSON_VERSION}
+        try:
+            with open(path, encoding='utf-8') as file:
+                cached = json.load(file)
+            if cached.get('stamp') == stamp:
+                return cls(CatalogEntry(**entry) for entry in cached['entries'])
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+        catalog = cls(build_entries(now))
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump({'stamp': stamp, 'entries': [asdict(entry) for entry in catalog.entries]}, file)
+        except OSError as error:
+            print(f'Could not cache the zone catalog: {error}', file=sys.stderr)
+        return catalog
+
+    def _prefixed(self, word: str) -> set:
+        tokens = self._tokens
+        matched = set()
+        position = bisect_left(tokens, (word,))
+        while position < len(tokens) and tokens[position][0].startswith(word):
+            matched.add(tokens[position][1])
+            position += 1
+        return matched
+
+    def search(self, query: str, limit: int = 20) -> list:
+        """Entries best matching `query`, prefix matches of every word first."""
+        words = _WORD.findall(query.lower())
+        if not words:
+            return []
+        candidates = self._prefixed(words[0])
+        for word in words[1:]:
+            candidates &= self._prefixed(word)
+        first = words[0]
+        # City matches first, then zones of a country before legacy links like 'US/Central'
+        entries = self.entries
+        ranked = sorted(candidates, key=lambda index: (not entries[index].city.lower().startswith(first),
+                                                       not entries[index].country_code,
+                                                       len(self._texts[index]), index))
+        results = ranked[:limit]
+        if len(results) < limit:
+            pattern = re.compile('.*?'.join(map(re.escape, ''.join(words))))
+            fuzzy = []
+            for index, text in enumerate(self._texts):
+                if index in candidates:
+                    continue
+                match = pattern.search(text)
+                if match:
+                    fuzzy.append((match.end() - match.start(), match.start(), index))
+            fuzzy.sort()
+            results.extend(index for _, _, index in fuzzy[:limit - len(results)])
+        return [self.entries[index] for index in results]
@@ -0,0 +1,33 @@
+"""
+Hourly chime times and quiet hours, shared by the event rules.
+
+The event rules schedule each chime for the next instant it is due rather
+than matching the current second on every tick, so none is skipped while
+the windows tick once a minute.
+"""
+
+from datetime import datetime, timedelta
+
+# Chimes are silent from 22:00 until 08:00 the next day
+QUIET_HOURS = (22, 8)
+
+
+def next_local_time(now: float, minute: int, second: int, shift: float = 0) -> float:
+    """Next instant after `now` at local hh:minute:second, moved by `shift` seconds.
+
+    HourlyRule uses it to put the next chime on the EventQueue, whose timer
+    fires at that instant whatever the windows' tick rate.
+    """
+    local = datetime.fromtimestamp(now).replace(minute=minute, second=second, microsecond=0)
+    candidate = local + timedelta(seconds=shift)
+    while candidate.timestamp() <= now:
+        candidate += timedelta(hours=1)
+    return candidate.timestamp()
+
+
+def is_quiet(hour: int, quiet_hours=QUIET_HOURS) -> bool:
+    """True if `hour` falls in the [start, end) quiet window, which may wrap past midnight."""
+    start, end = quiet_hours
+    if start <= end:
+        return start <= hour < end
+    return hour >= start or hour < end
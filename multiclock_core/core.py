@@ -0,0 +1,62 @@
+"""
+Per-tick clock state for every configured zone, independent of any GUI.
+
+ClockCore.tick takes one UTC instant and returns a ZoneState per zone with
+everything a renderer needs: the aware wall time, the UTC offset and its
+label and the day phase from the sun at the zone. The Qt windows only turn
+these into widget updates; chimes and alarms are scheduled by events.py.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+import time
+from .zones import ZoneClockEngine, UtcOffsetCache
+from .phases import DayPhaseSchedule, zone_coordinates
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneState:
+    index: int
+    name: str
+    zone_name: str
+    wall_time: datetime
+    offset: int
+    offset_label: str
+    day_phase: str
+    is_local: bool
+
+
+class ClockCore:
+    """Zone times, offsets and day phases for one set of clocks.
+
+    `clocks` is the settings mapping of display name to pytz zone name and
+    `local_zone` the system zone name, whose clocks are flagged `is_local`.
+    """
+
+    def __init__(self, clocks: dict, local_zone: str = None):
+        self.clocks = dict(clocks)
+        self.engine = ZoneClockEngine(self.clocks)
+        self.utc_offsets = UtcOffsetCache(self.engine)
+        self.names = self.engine.names
+        self.zone_names = self.engine.zone_names
+        self.local = [zone_name == local_zone for zone_name in self.zone_names]
+        offsets = self.engine.offsets(time.time()).tolist()
+        self.day_phases = DayPhaseSchedule(zone_coordinates(zone_name, offset)
+                                           for zone_name, offset in zip(self.zone_names, offsets))
+
+    def __len__(self):
+        return len(self.names)
+
+    def tick(self, now_utc: float = None, zones=None) -> list:
+        """ZoneState of every zone (or of the positions in `zones`) at `now_utc`."""
+        if now_utc is None:
+            now_utc = time.time()
+        if zones is None:
+            zones = range(len(self.names))
+        times, offsets = self.engine.resolve(now_utc, zones)
+        names, zone_names, local = self.names, self.zone_names, self.local
+        label = self.utc_offsets.label
+        phases = self.day_phases.phases(now_utc, zones)
+        return [ZoneState(index, names[index], zone_names[index], wall_time, offset,
+                          label(names[index], now_utc), phase, local[index])
+                for index, wall_time, offset, phase in zip(zones, times, offsets, phases)]
@@ -0,0 +1,178 @@
+"""
+Upcoming clock events: hourly chimes, daily alarms and one-off reminders.
+
+Each event source is a rule that can name its next occurrence after any
+instant, in the wall time of its own zone. EventQueue keeps one pending
+occurrence per rule in a min-heap, so finding the next thing to wake up for
+is a peek rather than a scan. Occurrences that are found more than
+`missed_after` seconds late, e.g. after a suspend, are handed back as
+missed instead of due.
+"""
+
+import heapq, sys
+from datetime import datetime, timedelta
+from .chimes import QUIET_HOURS, is_quiet, next_local_time
+from .zones import load_timezone
+import pytz
+
+WEEKDAYS = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+
+# Occurrences at the same instant are handled in this order
+PRIORITY = {'reminder': 0, 'alarm': 1, 'chime': 2}
+
+
+def _instant(tz, wall: datetime) -> float:
+    """Unix time of a naive wall time in `tz`, or of local time when `tz` is None."""
+    if tz is None:
+        return wall.timestamp()
+    return tz.localize(wall).timestamp()
+
+
+def _wall(tz, now: float) -> datetime:
+    if tz is None:
+        return datetime.fromtimestamp(now)
+    return datetime.fromtimestamp(now, tz).replace(tzinfo=None)
+
+
+class HourlyRule:
+    """The hourly chime at hh:59:59 plus `shift` seconds, skipping quiet hours.
+
+    `zone_name` None follows the system's local time, like the main chime.
+    """
+
+    kind = 'chime'
+
+    def __init__(self, label: str, zone_name: str = None, shift: float = 0,
+                 quiet_hours=QUIET_HOURS, sound: str = None):
+        self.label = label
+        self.zone_name = zone_name
+        self.tz = None if zone_name is None else load_timezone(zone_name)
+        self.shift = shift
+        self.quiet_hours = quiet_hours
+        self.sound = sound
+
+    def next_after(self, now: float):
+        if self.tz is None:
+            instant = next_local_time(now, 59, 59, self.shift)
+        else:
+            wall = _wall(self.tz, now).replace(minute=59, second=59, microsecond=0)
+            instant = _instant(self.tz, wall) + self.shift
+            if instant <= now:
+                instant = _instant(self.tz, wall + timedelta(hours=1)) + self.shift
+        for _ in range(24):
+            if not is_quiet(_wall(self.tz, instant).hour, self.quiet_hours):
+                return instant
+            instant = self.next_hour(instant)
+        return None
+
+    def next_hour(self, instant: float) -> float:
+        if self.tz is None:
+            return next_local_time(instant, 59, 59, self.shift)
+        return instant + 3600
+
+
+class DailyRule:
+    """An alarm at hh:mm wall time in a zone, on every day or on the given weekdays."""
+
+    kind = 'alarm'
+
+    def __init__(self, label: str, zone_name: str, hour: int, minute: int,
+                 days=WEEKDAYS, sound: str = None):
+        self.label = label
+        self.zone_name = zone_name
+        self.tz = load_timezone(zone_name)
+        self.hour = hour
+        self.minute = minute
+        self.days = {WEEKDAYS.index(day) for day in days}
+        self.sound = sound
+
+    def next_after(self, now: float):
+        if not self.days:
+            return None
+        wall = _wall(self.tz, now).replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        for _ in range(8):
+            if wall.weekday() in self.days:
+                instant = _instant(self.tz, wall)
+                if instant > now:
+                    return instant
+            wall += timedelta(days=1)
+        return None
+
+
+class OnceRule:
+    """A reminder at one wall time in a zone."""
+
+    kind = 'reminder'
+
+    def __init__(self, label: str, zone_name: str, at: datetime, sound: str = None):
+        self.label = label
+        self.zone_name = zone_name
+        self.tz = load_timezone(zone_name)
+        self.at = at
+        self.instant = _instant(self.tz, at)
+        self.sound = sound
+
+    def next_after(self, now: float):
+        return self.instant if self.instant > now else None
+
+
+def _add_rule(rules, rule_type, label, zone, clocks, *args):
+    try:
+        rules.append(rule_type(label, clocks.get(zone, zone), *args))
+    except pytz.UnknownTimeZoneError:
+        print(f'Skipping {rule_type.kind} {label!r}: unknown zone {zone!r}', file=sys.stderr)
+
+
+def build_rules(events, clocks, chime_offset: float = 0) -> list:
+    """Rules for the `events` settings, plus the system-local hourly chime.
+
+    Zones are named by their clock name in `clocks` or by IANA zone name.
+    Entries naming an unknown zone are reported and skipped.
+    """
+    rules = [HourlyRule('Chime', None, chime_offset, events.quiet_hours)]
+    for name, zone in events.zones.items():
+        _add_rule(rules, HourlyRule, name, name, clocks,
+                  chime_offset, zone.quiet_hours or events.quiet_hours, zone.chime)
+    for alarm in events.alarms:
+        _add_rule(rules, DailyRule, alarm.label, alarm.zone, clocks,
+                  alarm.hour, alarm.minute, alarm.days, alarm.sound)
+    for reminder in events.reminders:
+        _add_rule(rules, OnceRule, reminder.label, reminder.zone, clocks, reminder.at, reminder.sound)
+    return rules
+
+
+class EventQueue:
+    """Min-heap of the next occurrence of every rule."""
+
+    def __init__(self, rules=(), now: float = None, missed_after: float = 5.0):
+        self.missed_after = missed_after
+        self._heap = []
+        self._count = 0
+        for rule in rules:
+            self.add(rule, now)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def add(self, rule, now: float):
+        instant = rule.next_after(now)
+        if instant is not None:
+            self._count += 1
+            heapq.heappush(self._heap, (instant, PRIORITY[rule.kind], self._count, rule))
+
+    def next_instant(self):
+        """Instant of the earliest pending occurrence, or None when nothing is scheduled."""
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float, lead: float = 0):
+        """Pop every occurrence due by `now + lead` and schedule each rule's next one.
+
+        Returns (due, missed) lists of (instant, rule), earliest and most
+        important first; `missed` holds those more than `missed_after` late.
+        """
+        due, missed = [], []
+        while self._heap and self._heap[0][0] <= now + lead:
+            instant, _, _, rule = heapq.heappop(self._heap)
+            (missed if now - instant > self.missed_after else due).append((instant, rule))
+            self.add(rule, max(now, instant))
+        return due, missed
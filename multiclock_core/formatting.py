@@ -0,0 +1,114 @@
+"""
+Precompiled strftime formats for the per-tick clock labels.
+
+compile_format turns a `date.format` / `time.format` string from settings.json
+into a specialized Python function once. Common directives become lookups in
+prebuilt tables of hour, minute, day and month-name strings; anything else
+falls back to strftime for that directive only. ClockFormatter adds a
+per-zone date cache that only rebuilds the date string when the day rolls over.
+"""
+
+import re
+from datetime import datetime
+
+# The local clock shows smaller seconds after the hours and minutes
+LOCAL_TIME_MAIN = '%H:%M'
+LOCAL_TIME_SECONDS = ':%S'
+LOCAL_TIME_FORMAT = f'{LOCAL_TIME_MAIN}<span style="font-size: 20px;">{LOCAL_TIME_SECONDS}</span>'
+
+# strftime directives (by letter) whose output changes every second
+SECOND_DIRECTIVES = set('STXcrsf')
+
+# Directives whose output can change within a day
+_SUB_DAY_DIRECTIVES = set('HIMSpXcrsfTRZzlk')
+
+# A directive with an optional flag: %-d and %_H (glibc), %#d (Windows), %0e, %^a
+_directive = re.compile(r'%([-_0^#]?)(.)')
+
+
+def _tables():
+    """Name tables built with strftime itself, so they follow the current locale."""
+    weekdays = [datetime(2024, 1, day) for day in range(1, 8)]  # Monday first
+    months = [datetime(2024, month, 1) for month in range(1, 13)]
+    return {
+        'N2': [f'{n:02d}' for n in range(100)],
+        'H12': [f'{(hour % 12) or 12:02d}' for hour in range(24)],
+        'AMPM': [datetime(2024, 1, 1, hour).strftime('%p') for hour in range(24)],
+        'DAY': [day.strftime('%a') for day in weekdays],
+        'DAYNAME': [day.strftime('%A') for day in weekdays],
+        'MON': [''] + [month.strftime('%b') for month in months],
+        'MONTHNAME': [''] + [month.strftime('%B') for month in months],
+    }
+
+
+_expressions = {
+    'H': 'N2[t.hour]',
+    'M': 'N2[t.minute]',
+    'S': 'N2[t.second]',
+    'I': 'H12[t.hour]',
+    'p': 'AMPM[t.hour]',
+    'd': 'N2[t.day]',
+    'm': 'N2[t.month]',
+    'y': 'N2[t.year % 100]',
+    'Y': 'str(t.year)',
+    'a': 'DAY[t.weekday()]',
+    'A': 'DAYNAME[t.weekday()]',
+    'b': 'MON[t.month]',
+    'B': 'MONTHNAME[t.month]',
+    '%': "'%'",
+}
+
+
+def compile_format(time_format: str):
+    """Return a function equivalent to `lambda t: t.strftime(time_format)`."""
+    parts = []
+    position = 0
+    for match in _directive.finditer(time_format):
+        if match.start() > position:
+            parts.append(repr(time_format[position:match.start()]))
+        flag, letter = match.groups()
+        # Flagged directives are platform-specific, so strftime renders them whole
+        expression = None if flag else _expressions.get(letter)
+        parts.append(expression or f't.strftime({match.group(0)!r})')
+        position = match.end()
+    if position < len(time_format):
+        parts.append(repr(time_format[position:]))
+    source = 'def formatter(t):\n    return ' + (' + '.join(parts) or "''")
+    namespace = _tables()
+    exec(source, namespace)
+    return namespace['formatter']
+
+
+def shows_seconds(time_format: str) -> bool:
+    return any(letter in SECOND_DIRECTIVES for _, letter in _directive.findall(time_format))
+
+
+def changes_within_day(time_format: str) -> bool:
+    return any(letter in _SUB_DAY_DIRECTIVES for _, letter in _directive.findall(time_format))
+
+
+class ClockFormatter:
+    """Compiled date, time and local-clock formats plus a per-zone date cache.
+
+    `local_time` is the local clock as rich text; `local_main` and
+    `local_seconds` are its two parts for renderers that paint them directly.
+    """
+
+    def __init__(self, date_format: str, time_format: str, zone_count: int):
+        self.format_date = compile_format(date_format)
+        self.time = compile_format(time_format)
+        self.local_time = compile_format(LOCAL_TIME_FORMAT)
+        self.local_main = compile_format(LOCAL_TIME_MAIN)
+        self.local_seconds = compile_format(LOCAL_TIME_SECONDS)
+        self._date_per_day = not changes_within_day(date_format)
+        self._days = [None] * zone_count
+        self._dates = [''] * zone_count
+
+    def date(self, index: int, dt_obj: datetime) -> str:
+        if not self._date_per_day:
+            return self.format_date(dt_obj)
+        day = dt_obj.toordinal()
+        if self._days[index] != day:
+            self._days[index] = day
+            self._dates[index] = self.format_date(dt_obj)
+        return self._dates[index]
@@ -0,0 +1,188 @@
+"""
+Day phases shown next to each digital clock, from the sun at each zone.
+
+Every zone is tied to the coordinates of its principal city in the tz
+database's zone.tab (following links such as US/Central to
+America/Chicago); zones without a city, like UTC or Etc/GMT+5, sit on the
+equator at the longitude of their UTC offset. The phases follow the sun's
+altitude there:
+
+    dawn   from when it rises through -6° (civil twilight)
+    day    from when it rises through +6°
+    dusk   from when it sets through +6°
+    night  from when it sets through -6°
+
+so near the poles a phase may last all day or not happen at all. The
+transition instants of a few days are computed for a batch of zones at once
+with NumPy and a zone's phase is only looked up again once its next
+transition has passed.
+
+DAY_PHASES and day_phase() keep the older fixed-hour table.
+"""
+
+from functools import lru_cache
+import numpy as np
+import pytz
+
+DAY_PHASES = (
+    (5, 'dawn'),
+    (8, 'day'),
+    (17, 'dusk'),
+    (19, 'night'),
+)
+
+_by_hour = [next((name for start, name in reversed(DAY_PHASES) if hour >= start), DAY_PHASES[-1][1])
+            for hour in range(24)]
+
+
+def day_phase(hour: int) -> str:
+    """Phase name ('dawn', 'day', 'dusk' or 'night') for an hour of wall time."""
+    return _by_hour[hour]
+
+
+# Phases in the order their transitions happen each day, and the sun's altitude at each
+PHASE_ORDER = ('dawn', 'day', 'dusk', 'night')
+TWILIGHT_ALTITUDE = -6.0
+LOW_SUN_ALTITUDE = 6.0
+
+_J2000 = 2451545.0
+_UNIX_EPOCH_JD = 2440587.5
+_OBLIQUITY = np.radians(23.4397)
+# Solar days computed per zone, relative to the current one
+_DAYS = np.array([-1.0, 0.0, 1.0, 2.0])
+_PER_DAY = len(PHASE_ORDER)
+
+
+def _degrees(text: str, degree_digits: int) -> float:
+    """'+3518' or '+353916' (±DDMM[SS]) or, with 3 degree digits, '+13942' / '+1394441'."""
+    sign = -1 if text[0] == '-' else 1
+    digits = text[1:]
+    degrees = int(digits[:degree_digits])
+    minutes = int(digits[degree_digits:degree_digits + 2])
+    seconds = int(digits[degree_digits + 2:] or 0)
+    return sign * (degrees + minutes / 60 + seconds / 3600)
+
+
+@lru_cache(maxsize=None)
+def _zone_tab():
+    """({zone: (latitude, longitude)}, {link: target}) from pytz's copy of the tz database."""
+    coordinates, links = {}, {}
+    with pytz.open_resource('zone.tab') as file:
+        for line in file.read().decode('utf-8').splitlines():
+            if line.startswith('#') or not line.strip():
+                continue
+            fields = line.split('\t')
+            position, zone_name = fields[1], fields[2]
+            split = max(position.rfind('+'), position.rfind('-'))
+            coordinates[zone_name] = (_degrees(position[:split], 2), _degrees(position[split:], 3))
+    try:
+        with pytz.open_resource('tzdata.zi') as file:
+            for line in file.read().decode('utf-8').splitlines():
+                if line.startswith('L '):
+                    _, target, link = line.split()
+                    links[link] = target
+    except OSError:
+        pass  # older pytz releases do not ship tzdata.zi; links then use their offset
+    return coordinates, links
+
+
+def zone_coordinates(zone_name: str, offset: int = 0):
+    """(latitude, longitude) in degrees for a zone, east and north positive.
+
+    Zones that zone.tab does not place, directly or through a link, get the
+    equator at the longitude matching `offset` seconds from UTC.
+    """
+    coordinates, links = _zone_tab()
+    for _ in range(len(links) + 1):
+        if zone_name in coordinates:
+            return coordinates[zone_name]
+        if zone_name not in links:
+            break
+        zone_name = links[zone_name]
+    return 0.0, offset / 240
+
+
+def sun_transitions(latitudes, longitudes, now: float) -> np.ndarray:
+    """Unix instants at which dawn, day, dusk and night start at each location.
+
+    Returns an array of shape (locations, 16): the four transitions of the
+    solar day before the one containing `now`, of that day and of the two
+    after it, in order. Uses the NOAA sunrise equation; a phase the sun
+    does not reach that day has zero length.
+    """
+    latitudes = np.radians(np.asarray(latitudes, dtype=float))[:, None]
+    longitudes = np.asarray(longitudes, dtype=float)[:, None]
+    day = np.floor(now / 86400 + _UNIX_EPOCH_JD - _J2000 + 0.0008)
+    mean_noon = day + _DAYS - longitudes / 360
+    anomaly = np.radians((357.5291 + 0.98560028 * mean_noon) % 360)
+    center = 1.9148 * np.sin(anomaly) + 0.02 * np.sin(2 * anomaly) + 0.0003 * np.sin(3 * anomaly)
+    ecliptic = np.radians((np.degrees(anomaly) + center + 282.9372) % 360)
+    transit = _J2000 + mean_noon + 0.0053 * np.sin(anomaly) - 0.0069 * np.sin(2 * ecliptic)
+    sin_declination = np.sin(ecliptic) * np.sin(_OBLIQUITY)
+    cos_declination = np.sqrt(1 - sin_declination ** 2)
+
+    def half_arc(altitude):
+        """Fraction of a day from transit to when the sun crosses `altitude`."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cos_hour = ((np.sin(np.radians(altitude)) - np.sin(latitudes) * sin_declination)
+                        / (np.cos(latitudes) * cos_declination))
+        return np.arccos(np.clip(np.nan_to_num(cos_hour), -1, 1)) / (2 * np.pi)
+
+    twilight, low_sun = half_arc(TWILIGHT_ALTITUDE), half_arc(LOW_SUN_ALTITUDE)
+    days = np.stack([transit - twilight, transit - low_sun, transit + low_sun, transit + twilight], axis=-1)
+    return ((days - _UNIX_EPOCH_JD) * 86400).reshape(len(latitudes), -1)
+
+
+class DayPhaseSchedule:
+    """Current day phase of a set of locations, looked up again only at transitions.
+
+    `coordinates` is a sequence of (latitude, longitude) pairs in degrees.
+    Each zone keeps its next transition instant; until that passes its phase
+    is returned as is. Past it, the zone moves along its precomputed
+    transitions, and zones that have run out of them are recomputed
+    together in one batch.
+    """
+
+    def __init__(self, coordinates):
+        coordinates = list(coordinates)
+        self.latitudes = np.array([latitude for latitude, _ in coordinates], dtype=float)
+        self.longitudes = np.array([longitude for _, longitude in coordinates], dtype=float)
+        self._transitions = np.zeros((len(coordinates), len(_DAYS) * _PER_DAY))
+        self._computed = np.zeros(len(coordinates), dtype=bool)
+        self._phases = [None] * len(coordinates)
+        self._changes = [-np.inf] * len(coordinates)
+
+    def __len__(self):
+        return len(self._phases)
+
+    def _compute(self, zones, now: float):
+        self._transitions[zones] = sun_transitions(self.latitudes[zones], self.longitudes[zones], now)
+        self._computed[zones] = True
+
+    def _advance(self, zone: int, now: float) -> bool:
+        """Move one zone to its phase at `now`; False if it needs new transitions."""
+        row = self._transitions[zone]
+        position = int(np.searchsorted(row, now, side='right')) - 1
+        # Keep a whole day of transitions ahead, so a position is never the last one
+        if not self._computed[zone] or not 0 <= position < len(row) - _PER_DAY:
+            return False
+        self._phases[zone] = PHASE_ORDER[position % _PER_DAY]
+        self._changes[zone] = float(row[position + 1])
+        return True
+
+    def phases(self, now: float, zones=None) -> list:
+        """Phase name of every zone (or of the positions in `zones`) at Unix time `now`."""
+        if zones is None:
+            zones = range(len(self._phases))
+        changes = self._changes
+        stale = [zone for zone in zones if now >= changes[zone] and not self._advance(zone, now)]
+        if stale:
+            self._compute(np.array(stale, dtype=np.intp), now)
+            for zone in stale:
+                self._advance(zone, now)
+        phases = self._phases
+        return [phases[zone] for zone in zones]
+
+    def next_change(self, zone: int) -> float:
+        """Instant at which `zone` last looked its phase would change next."""
+        return self._changes[zone]
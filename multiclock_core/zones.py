@@ -0,0 +1,281 @@
+"""
+Shared multi-zone time engine for MultiClock.
+
+Each pytz zone is resolved once and flattened into NumPy tables of UTC
+transition instants and offsets. A tick then takes a single UTC instant and
+derives the wall time of every zone with one batched searchsorted call.
+convert_many() does the same for a whole array of instants at once.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+import time
+import numpy as np
+import pytz
+from pytz.tzfile import build_tzinfo
+
+# Transition instants are clamped to +/- 2**40 seconds (about 35,000 years) so
+# every zone's table can be shifted into its own band of one sorted key array.
+_CLAMP = 2 ** 40
+_BAND = 2 ** 42
+_EPOCH = datetime(1970, 1, 1)
+_NEVER = float('inf')
+
+
+def _epoch_seconds(dt_obj: datetime) -> int:
+    """Whole seconds since the Unix epoch for a naive UTC datetime."""
+    delta = dt_obj - _EPOCH
+    return delta.days * 86400 + delta.seconds
+
+
+def transition_table(tz):
+    """Return (instants, offsets, tzinfos) for a pytz timezone.
+
+    `instants` are the UTC seconds at which each entry starts, `offsets` the
+    UTC offset in seconds from that instant on and `tzinfos` the matching pytz
+    tzinfo to attach to wall times, exactly as pytz's own `fromutc` does.
+    """
+    if hasattr(tz, '_utc_transition_times'):
+        instants = [max(-_CLAMP, _epoch_seconds(t)) for t in tz._utc_transition_times]
+        # The first entry covers all earlier time, as in pytz's fromutc
+        instants[0] = -_CLAMP
+        tzinfos = [tz._tzinfos[info] for info in tz._transition_info]
+        offsets = [int(info[0].total_seconds()) for info in tz._transition_info]
+    else:
+        # StaticTzInfo and pytz.utc: a single offset for all time
+        instants = [-_CLAMP]
+        tzinfos = [tz]
+        offsets = [int(tz.utcoffset(None).total_seconds())]
+    return instants, offsets, tzinfos
+
+
+def format_utc_offset(seconds: int) -> str:
+    """Format an offset in seconds to the minute, e.g. '9', '-6', '5:30', '5:45'."""
+    sign = '-' if seconds < 0 else ''
+    hours, remainder = divmod(abs(int(seconds)), 3600)
+    minutes = remainder // 60
+    return f'{sign}{hours}:{minutes:02d}' if minutes else f'{sign}{hours}'
+
+
+@lru_cache(maxsize=None)
+def load_timezone(zone_name: str):
+    """pytz.timezone(zone_name) without the cold-start cost of its first call.
+
+    The first pytz.timezone call checks for every one of the ~600 zone files
+    in the database before building the one asked for. Exact names are read
+    straight from their file instead; anything else, including the database's
+    other files (zone.tab, tzdata.zi), goes through pytz for its
+    case-insensitive lookup and its UnknownTimeZoneError.
+    """
+    if zone_name.upper() == 'UTC':
+        return pytz.utc
+    try:
+        with pytz.open_resource(zone_name) as fp:
+            if fp.read(4) == b'TZif':
+                fp.seek(0)
+                return build_tzinfo(zone_name, fp)
+    except (OSError, ValueError):
+        pass
+    return pytz.timezone(zone_name)
+
+
+@lru_cache(maxsize=None)
+def zone_table(zone_name: str):
+    """transition_table for a zone name, built once per process and shared by engines."""
+    return transition_table(load_timezone(zone_name))
+
+
+class ZoneClockEngine:
+    """Batched wall-time lookups for a fixed set of named zones.
+
+    `clocks` is the settings mapping of display name to pytz zone name. Zones
+    are resolved once, so an unknown name raises `pytz.UnknownTimeZoneError`
+    at construction rather than on every tick.
+    """
+
+    def __init__(self, clocks: dict):
+        self.names = list(clocks.keys())
+        self.zone_names = list(clocks.values())
+        self.timezones = [load_timezone(zone_name) for zone_name in self.zone_names]
+
+        keys, offsets, tzinfos, starts = [], [], [], []
+        for index, zone_name in enumerate(self.zone_names):
+            zone_instants, zone_offsets, zone_tzinfos = zone_table(zone_name)
+            starts.append(len(keys))
+            keys.extend(index * _BAND + instant for instant in zone_instants)
+            offsets.extend(zone_offsets)
+            tzinfos.extend(zone_tzinfos)
+
+        self._keys = np.array(keys, dtype=np.int64)
+        self._offsets = np.array(offsets, dtype=np.int64)
+        self._tzinfos = tzinfos
+        self._deltas = [timedelta(seconds=offset) for offset in offsets]
+        self._starts = np.array(starts, dtype=np.int64)
+        self._ends = np.append(self._starts[1:], len(keys))
+        self._bands = np.arange(len(self.timezones), dtype=np.int64) * _BAND
+
+    def __len__(self):
+        return len(self.names)
+
+    def indices(self, now_utc: float, zones=None) -> np.ndarray:
+        """Index into the flattened tables of the entry in force for each zone.
+
+        `zones` optionally restricts the lookup to a sequence of zone positions.
+        """
+        now = np.int64(min(max(int(now_utc // 1), -_CLAMP), _CLAMP))
+        bands = self._bands if zones is None else self._bands[np.asarray(zones, dtype=np.intp)]
+        return np.searchsorted(self._keys, bands + now, side='right') - 1
+
+    def offsets(self, now_utc: float) -> np.ndarray:
+        """UTC offset in seconds of every zone at `now_utc` (Unix seconds)."""
+        return self._offsets[self.indices(now_utc)]
+
+    def lookup(self, index: int, now_utc: float):
+        """Return (offset, next_transition) for one zone at `now_utc`.
+
+        `next_transition` is the Unix instant at which the offset next changes,
+        or infinity when the tz database lists no further transitions.
+        """
+        band = int(self._bands[index])
+        now = min(max(int(now_utc // 1), -_CLAMP), _CLAMP)
+        position = int(np.searchsorted(self._keys, band + now, side='right')) - 1
+        if position + 1 < self._ends[index]:
+            next_transition = int(self._keys[position + 1]) - band
+        else:
+            next_transition = _NEVER
+        return int(self._offsets[position]), next_transition
+
+    def resolve(self, now_utc: float, zones=None):
+        """Return (wall_times, offsets) of every zone (or of `zones`) at one shared UTC instant."""
+        indices = self.indices(now_utc, zones)
+        base = _EPOCH + timedelta(seconds=now_utc)
+        tzinfos, deltas = self._tzinfos, self._deltas
+        times = [(base + deltas[index]).replace(tzinfo=tzinfos[index]) for index in indices.tolist()]
+        return times, self._offsets[indices].tolist()
+
+    def tick(self, now_utc: float = None, zones=None) -> list:
+        """Return the aware wall time of every zone (or of `zones`) at one shared UTC instant."""
+        if now_utc is None:
+            now_utc = time.time()
+        return self.resolve(now_utc, zones)[0]
+
+    def offsets_at(self, instants) -> np.ndarray:
+        """UTC offsets in seconds, one row per zone and one column per instant.
+
+        `instants` is an array of whole Unix seconds, e.g. from as_unix_seconds().
+        Instants beyond the clamped tables get the first or last entry.
+        """
+        keys = self._bands[:, None] + np.clip(instants, -_CLAMP, _CLAMP)[None, :]
+        return self._offsets[np.searchsorted(self._keys, keys, side='right') - 1]
+
+
+@dataclass(frozen=True, eq=False)
+class ZoneConversions:
+    """Instants converted to every zone: one row per zone, one column per instant.
+
+    `offsets` are UTC offsets in seconds and `wall_times` the naive local
+    wall times as datetime64[s]; both have shape (len(names), len(instants)).
+    """
+    names: tuple
+    zone_names: tuple
+    instants: np.ndarray
+    offsets: np.ndarray
+    wall_times: np.ndarray
+
+    def offset_labels(self, row: int) -> list:
+        """Formatted offsets of one zone, e.g. ['9', '9', ...]."""
+        return [format_utc_offset(offset) for offset in self.offsets[row].tolist()]
+
+
+def _unix_seconds(instant) -> float:
+    if isinstance(instant, datetime):
+        if instant.tzinfo is None:
+            # Naive times are UTC, as naive datetime64 values are
+            return _epoch_seconds(instant) + instant.microsecond / 1e6
+        return instant.timestamp()
+    if isinstance(instant, np.datetime64):
+        return float(instant.astype('datetime64[s]').astype(np.int64))
+    return float(instant)
+
+
+def as_unix_seconds(instants) -> np.ndarray:
+    """Whole Unix seconds (int64) from numbers, datetime64 values or datetimes.
+
+    Naive datetimes and datetime64 values are both read as UTC.
+    """
+    array = np.asarray(instants)
+    if array.dtype == object:
+        array = np.array([_unix_seconds(instant) for instant in array.ravel()], dtype=np.float64).reshape(array.shape)
+    if array.dtype.kind == 'M':
+        return array.astype('datetime64[s]').astype(np.int64)
+    if array.dtype.kind == 'f':
+        return np.floor(array).astype(np.int64)
+    return array.astype(np.int64)
+
+
+@lru_cache(maxsize=32)
+def _conversion_engine(clocks: tuple) -> ZoneClockEngine:
+    return ZoneClockEngine(dict(clocks))
+
+
+def convert_many(instants, zones) -> ZoneConversions:
+    """Convert every instant to every zone with one vectorized lookup.
+
+    `zones` is a sequence of zone names or a clocks mapping of display name
+    to zone name, such as settings.clock.clocks. A sequence gets one row per
+    entry, repeats included. Instants are truncated to the second.
+    """
+    if isinstance(zones, Mapping):
+        names, zone_names = tuple(zones.keys()), tuple(zones.values())
+    else:
+        names = zone_names = tuple(zones)
+    # Each zone is looked up once; repeated names share its row
+    unique = tuple(dict.fromkeys(zone_names))
+    engine = _conversion_engine(tuple(zip(unique, unique)))
+    seconds = as_unix_seconds(instants).ravel()
+    offsets = engine.offsets_at(seconds)
+    if unique != zone_names:
+        rows = {zone_name: row for row, zone_name in enumerate(unique)}
+        offsets = offsets[[rows[zone_name] for zone_name in zone_names]]
+    wall_times = (seconds[None, :] + offsets).astype('datetime64[s]')
+    return ZoneConversions(names, zone_names, seconds, offsets, wall_times)
+
+
+def utc_offset(timezone_name, dt_obj=None):
+    try:
+        tz = pytz.timezone(timezone_name)
+    except pytz.UnknownTimeZoneError:
+        return '?'
+    if dt_obj is None:
+        dt_obj = datetime.now(tz)
+    elif dt_obj.tzinfo is None:
+        dt_obj = tz.localize(dt_obj)
+    else:
+        dt_obj = dt_obj.astimezone(tz)
+    offset_timedelta = dt_obj.utcoffset()
+    if offset_timedelta is None:
+        return '?'
+    return format_utc_offset(offset_timedelta.total_seconds())
+
+
+class UtcOffsetCache:
+    """Formatted UTC offsets keyed by zone name, valid until the next transition.
+
+    Each entry holds the offset label and the instant of the zone's next
+    offset change, so a lookup costs a single comparison until DST switches.
+    """
+
+    def __init__(self, engine: ZoneClockEngine):
+        self.engine = engine
+        self._indices = {name: index for index, name in enumerate(engine.names)}
+        self._entries = {name: ['', -_NEVER] for name in engine.names}
+
+    def label(self, zone: str, now_utc: float) -> str:
+        entry = self._entries[zone]
+        if now_utc >= entry[1]:
+            offset, next_transition = self.engine.lookup(self._indices[zone], now_utc)
+            entry[0] = format_utc_offset(offset)
+            entry[1] = next_transition
+        return entry[0]
@@ -0,0 +1,264 @@
+"""
+Render the analog clocks to image files without a window or an event loop.
+
+Every frame shows one face per zone, with its name and time below, in the
+selected theme. The static faces and the hand-tip tables of aclock are
+built once and reused for every frame; a frame is only a blit of the face
+and three lines per zone. Frames are PNG or SVG files, one per instant, or
+one sprite sheet PNG with a JSON index of where each instant is.
+
+    python render_frames.py --start 2025-06-01T00:00 --end 2025-06-01T12:00 --step 60
+    python render_frames.py --start 2025-06-01T00:00 --end 2025-06-02T00:00 --sprite --processes 0
+    python render_frames.py --start 2025-06-01T09:00 --end 2025-06-01T09:01 --format svg --theme night
+
+Times without a zone are UTC and `--end` is exclusive. Zones come from
+`clock.defaults.horizontal` unless --section names another clocks section.
+With --processes the instants are split across that many worker processes
+(0 for one per core), each with its own offscreen QGuiApplication.
+"""
+
+import os
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import argparse, json
+from datetime import datetime, timezone
+from multiprocessing import Pool
+from PyQt6.QtGui import QGuiApplication, QImage, QPainter, QPicture, QColor, QFont
+from PyQt6.QtCore import Qt, QPointF, QRect, QSize, QBuffer, QIODevice
+import config
+import aclock
+from multiclock_core import ClockCore, ClockFormatter
+from resources import resources
+
+settings = config.get_settings()
+
+LABEL_HEIGHT = 36
+MARGIN = 8
+# QImage and PNG are limited to 32767 pixels a side
+MAX_SHEET = 32767
+
+
+def face_picture(theme: str, face_size: int) -> QPicture:
+    """The static face recorded as vector drawing commands, for SVG output."""
+    def build():
+        picture = QPicture()
+        painter = QPainter(picture)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        aclock.draw_face(painter, theme, face_size)
+        painter.end()
+        return picture
+    return resources.get(theme, ('face picture', face_size), build)
+
+
+class FrameRenderer:
+    """Paints the clocks of `clocks` at any instant onto a QImage or an SVG file."""
+
+    def __init__(self, clocks, theme_name: str = None, face_size: int = 125, columns: int = None):
+        self.theme_name = theme_name or settings.theme_name
+        self.theme = settings.themes[self.theme_name]
+        self.core = ClockCore(clocks)
+        self.formatter = ClockFormatter(settings.clock.date_format, settings.clock.time_format, len(self.core))
+        self.face_size = face_size
+        self.columns = columns or min(max(len(self.core), 1), 10)
+        self.rows = -(-len(self.core) // self.columns)
+        # Built once; every frame reuses them
+        self.face = aclock.static_face(self.theme_name, face_size, True)
+        self.tips = aclock.hand_tips(face_size)
+        self.pens = aclock.hand_pens(self.theme_name)
+        self.name_font = QFont(self.theme.zone.font, 9)
+        self.time_font = QFont(self.theme.clock.font, 11)
+
+    @property
+    def width(self) -> int:
+        return self.columns * self.face_size + 2 * MARGIN
+
+    @property
+    def height(self) -> int:
+        return self.rows * (self.face_size + LABEL_HEIGHT) + 2 * MARGIN
+
+    def paint(self, painter: QPainter, instant: float, vector: bool = False):
+        size = self.face_size
+        center = QPointF(size / 2, size / 2)
+        sec_tips, min_tips, hour_tips = self.tips
+        sec_pen, min_pen, hour_pen = self.pens
+        face = face_picture(self.theme_name, size) if vector else None
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(0, 0, self.width, self.height, QColor(self.theme.window_background))
+        for state in self.core.tick(instant):
+            row, column = divmod(state.index, self.columns)
+            left, top = MARGIN + column * size, MARGIN + row * (size + LABEL_HEIGHT)
+            wall = state.wall_time
+            painter.save()
+            painter.translate(left, top)
+            if vector:
+                painter.drawPicture(0, 0, face)
+            else:
+                painter.drawPixmap(0, 0, self.face)
+            painter.setPen(sec_pen)
+            painter.drawLine(center, sec_tips[wall.second])
+            painter.setPen(min_pen)
+            painter.drawLine(center, min_tips[wall.minute])
+            painter.setPen(hour_pen)
+            painter.drawLine(center, hour_tips[wall.hour % 12 * 60 + wall.minute])
+            painter.setPen(QColor(self.theme.zone.color))
+            painter.setFont(self.name_font)
+            painter.drawText(QRect(0, size, size, LABEL_HEIGHT // 2), Qt.AlignmentFlag.AlignCenter, state.name)
+            painter.setPen(QColor(self.theme.clock.color))
+            painter.setFont(self.time_font)
+            painter.drawText(QRect(0, size + LABEL_HEIGHT // 2, size, LABEL_HEIGHT // 2),
+                             Qt.AlignmentFlag.AlignCenter, self.formatter.time(wall))
+            painter.restore()
+
+    def image(self, instant: float) -> QImage:
+        image = QImage(self.width, self.height, QImage.Format.Format_ARGB32_Premultiplied)
+        painter = QPainter(image)
+        self.paint(painter, instant)
+        painter.end()
+        return image
+
+    def save_svg(self, instant: float, path: str):
+        try:
+            from PyQt6.QtSvg import QSvgGenerator
+        except ImportError:
+            raise SystemExit('SVG output needs the QtSvg module of PyQt6') from None
+        generator = QSvgGenerator()
+        generator.setFileName(path)
+        generator.setSize(QSize(self.width, self.height))
+        generator.setViewBox(QRect(0, 0, self.width, self.height))
+        generator.setTitle('MultiClock')
+        painter = QPainter(generator)
+        self.paint(painter, instant, vector=True)
+        painter.end()
+
+
+def frame_name(instant: float, extension: str) -> str:
+    return f'clocks_{datetime.fromtimestamp(instant, timezone.utc):%Y%m%dT%H%M%SZ}.{extension}'
+
+
+def png_bytes(image: QImage) -> bytes:
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, 'PNG')
+    return bytes(buffer.data())
+
+
+def render_files(renderer: FrameRenderer, instants, out: str, file_format: str) -> int:
+    for instant in instants:
+        path = os.path.join(out, frame_name(instant, file_format))
+        if file_format == 'svg':
+            renderer.save_svg(instant, path)
+        else:
+            renderer.image(instant).save(path, 'PNG')
+    return len(instants)
+
+
+_app = None
+_renderer = None
+
+
+def _start_worker(clocks, theme_name, face_size, columns):
+    global _app, _renderer
+    _app = QGuiApplication.instance() or QGuiApplication([])
+    _renderer = FrameRenderer(clocks, theme_name, face_size, columns)
+
+
+def _render_chunk(job):
+    """Worker side: write `instants` as files, or return them as PNG bytes for a sprite sheet."""
+    instants, out, file_format = job
+    if out is None:
+        return [png_bytes(_renderer.image(instant)) for instant in instants]
+    return render_files(_renderer, instants, out, file_format)
+
+
+def sheet_layout(frame_count: int, width: int, height: int):
+    """(columns, rows) of a roughly square sprite sheet, or None if it cannot fit in a PNG."""
+    columns = min(max(1, int(frame_count ** 0.5)), MAX_SHEET // width)
+    rows = -(-frame_count // max(columns, 1))
+    if columns < 1 or rows * height > MAX_SHEET:
+        return None
+    return columns, rows
+
+
+def sprite_sheet(renderer: FrameRenderer, frames, out: str):
+    """Tile `frames` ((instant, QImage) pairs) into sprite.png, indexed by sprite.json."""
+    width, height = renderer.width, renderer.height
+    sheet_columns, sheet_rows = sheet_layout(len(frames), width, height)
+    sheet = QImage(sheet_columns * width, sheet_rows * height, QImage.Format.Format_ARGB32_Premultiplied)
+    sheet.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(sheet)
+    index = []
+    for position, (instant, frame) in enumerate(frames):
+        row, column = divmod(position, sheet_columns)
+        painter.drawImage(column * width, row * height, frame)
+        index.append({'time': instant, 'x': column * width, 'y': row * height, 'width': width, 'height': height})
+    painter.end()
+    sheet.save(os.path.join(out, 'sprite.png'), 'PNG')
+    with open(os.path.join(out, 'sprite.json'), 'w', encoding='utf-8') as file:
+        json.dump({'frames': index}, file, indent=1)
+
+
+def parse_time(text: str) -> float:
+    instant = datetime.fromisoformat(text)
+    if instant.tzinfo is None:
+        instant = instant.replace(tzinfo=timezone.utc)
+    return instant.timestamp()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render MultiClock analog clocks to image files offscreen.')
+    parser.add_argument('--start', required=True, type=parse_time, help='first instant, ISO 8601 (UTC if no zone)')
+    parser.add_argument('--end', required=True, type=parse_time, help='end of the range, exclusive')
+    parser.add_argument('--step', type=int, default=60, help='seconds between frames (default 60)')
+    parser.add_argument('--out', default='frames', help='output directory (default ./frames)')
+    parser.add_argument('--format', choices=('png', 'svg'), default='png', dest='file_format')
+    parser.add_argument('--sprite', action='store_true', help='write one PNG sprite sheet instead of a file per frame')
+    parser.add_argument('--theme', choices=sorted(settings.themes), default=settings.theme_name)
+    parser.add_argument('--section', default='clock.defaults.horizontal', help='settings section with the clocks')
+    parser.add_argument('--size', type=int, default=125, help='face size in pixels')
+    parser.add_argument('--columns', type=int, help='faces per row (default up to 10)')
+    parser.add_argument('--processes', type=int, default=1, help='worker processes; 0 for one per core')
+    args = parser.parse_args(argv)
+
+    if args.section not in settings.data or 'clocks' not in settings.data[args.section]:
+        parser.error(f'{args.section!r} is not a clocks section of {settings.path}')
+    if args.sprite and args.file_format != 'png':
+        parser.error('sprite sheets are PNG only')
+    if args.step < 1 or args.end <= args.start:
+        parser.error('--end must be after --start and --step at least 1 second')
+    clocks = dict(settings.data[args.section]['clocks'])
+    instants = list(range(int(args.start), int(args.end), args.step))
+    if args.sprite:
+        columns = args.columns or min(max(len(clocks), 1), 10)
+        width = columns * args.size + 2 * MARGIN
+        height = -(-len(clocks) // columns) * (args.size + LABEL_HEIGHT) + 2 * MARGIN
+        if sheet_layout(len(instants), width, height) is None:
+            parser.error(f'{len(instants)} frames of {width}x{height} do not fit in one sprite sheet; '
+                         f'use a larger --step or write files')
+    os.makedirs(args.out, exist_ok=True)
+    processes = args.processes or os.cpu_count()
+    out = None if args.sprite else args.out
+
+    if processes > 1 and len(instants) > 1:
+        # A few chunks per process, contiguous so each worker's formatter caches stay warm
+        chunk = -(-len(instants) // (processes * 4))
+        jobs = [(instants[start:start + chunk], out, args.file_format) for start in range(0, len(instants), chunk)]
+        with Pool(processes, _start_worker, (clocks, args.theme, args.size, args.columns)) as pool:
+            results = pool.map(_render_chunk, jobs)
+        app = QGuiApplication([])
+        renderer = FrameRenderer(clocks, args.theme, args.size, args.columns)
+        if args.sprite:
+            frames = [QImage.fromData(data, 'PNG') for result in results for data in result]
+            sprite_sheet(renderer, list(zip(instants, frames)), args.out)
+    else:
+        app = QGuiApplication([])
+        renderer = FrameRenderer(clocks, args.theme, args.size, args.columns)
+        if args.sprite:
+            sprite_sheet(renderer, [(instant, renderer.image(instant)) for instant in instants], args.out)
+        else:
+            render_files(renderer, instants, args.out, args.file_format)
+    written = 'sprite.png and sprite.json' if args.sprite else f'{len(instants)} {args.file_format.upper()} files'
+    print(f'{len(instants)} frames of {len(clocks)} zones: {written} in {args.out}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Dirty-checking for the per-zone labels of the MultiClock windows.
+
+Every setText on a rich-text QLabel re-runs Qt's HTML layout, so the windows
+push content through RenderState, which remembers what each widget last
+showed and only touches widgets whose content actually changed.
+"""
+
+
+class ZoneRenderState:
+    """Last content shown by one zone's widgets."""
+
+    __slots__ = ('texts', 'pixmap_key', 'minute')
+
+    def __init__(self):
+        self.texts = {}
+        self.pixmap_key = None
+        self.minute = None
+
+
+class RenderState:
+    """Render-state cache for all zones plus a count of Qt update calls.
+
+    `updates` is the number of setText/setPixmap calls (or changed values) made
+    during the current tick and `total_updates` the running total. With `enabled=False` every call
+    goes through to Qt, which reproduces the old behavior for benchmarks.
+    """
+
+    def __init__(self, zone_count: int, enabled: bool = True):
+        self.enabled = enabled
+        self.zones = [ZoneRenderState() for _ in range(zone_count)]
+        self.updates = 0
+        self.total_updates = 0
+        self.ticks = 0
+
+    def begin_tick(self):
+        self.updates = 0
+        self.ticks += 1
+
+    def minute_changed(self, state: ZoneRenderState, minute: int) -> bool:
+        """True once per minute per zone, when the minute-level labels are due."""
+        if self.enabled and state.minute == minute:
+            return False
+        state.minute = minute
+        return True
+
+    def changed(self, state: ZoneRenderState, field: str, value) -> bool:
+        """Record `value` for `field`; True if whoever shows it must be updated."""
+        if self.enabled and state.texts.get(field) == value:
+            return False
+        state.texts[field] = value
+        self._count()
+        return True
+
+    def set_text(self, label, state: ZoneRenderState, field: str, text: str):
+        if self.changed(state, field, text):
+            label.setText(text)
+
+    def set_pixmap(self, label, state: ZoneRenderState, key, pixmap):
+        if self.enabled and state.pixmap_key == key:
+            return
+        state.pixmap_key = key
+        label.setPixmap(pixmap)
+        self._count()
+
+    def remap(self, old_names, new_names):
+        """Follow zones being added, removed or reordered, keeping the cache of zones that stay."""
+        states = dict(zip(old_names, self.zones))
+        self.zones = [states.get(name) or ZoneRenderState() for name in new_names]
+        for state in self.zones:
+            state.minute = None
+
+    def invalidate(self):
+        """Forget all cached content so the next tick repaints every widget."""
+        for state in self.zones:
+            state.texts.clear()
+            state.pixmap_key = None
+            state.minute = None
+
+    def _count(self):
+        self.updates += 1
+        self.total_updates += 1
@@ -0,0 +1,90 @@
+"""
+Process-wide cache of the Qt resources shared by MultiClock's windows and widgets.
+
+Asset paths are resolved against the app's own directory, or the unpacked
+bundle when running from a PyInstaller build, so the windows find their
+images, icons and sounds whatever the working directory. Pixmaps, fonts,
+pens and stylesheets are built once per theme and key and shared; after a
+theme is switched or edited, invalidate() drops what was built for it.
+"""
+
+import os, sys
+from PyQt6.QtGui import QColor, QFont, QIcon, QPen, QPixmap
+
+basedir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+
+# Stylesheet templates, formatted with a config.Theme as `theme`
+STYLESHEETS = {
+    'window': 'background: {theme.window_background};',
+    'heading': 'color: {theme.zone.color}; border-bottom: 1px solid {theme.zone.color}; '
+               'padding-bottom: 3px; margin-bottom: 6px;',
+    'notice': 'color: {theme.zone.color}; border-bottom: 1px solid {theme.zone.color}; padding-bottom: 3px;',
+    'footer': 'color: {theme.zone.color};',
+    'palette': 'color: {theme.zone.color}; background: {theme.window_background};',
+    'zone': 'background: {theme.zone.background}; color: {theme.zone.color};',
+    'date': 'background: {theme.date.background}; color: {theme.date.color};',
+    'clock': 'background: {theme.clock.background}; color: {theme.clock.color};',
+    'zone_list': 'QListView {{ background: transparent; }}'
+                 'QScrollBar:vertical {{ width: 6px; background: transparent; }}'
+                 'QScrollBar::handle:vertical {{ background: {theme.zone.color}; border-radius: 3px; min-height: 20px; }}'
+                 'QScrollBar::add-line, QScrollBar::sub-line {{ height: 0; }}',
+}
+
+
+def asset_path(path: str) -> str:
+    """Absolute path of a file named relative to the app directory, e.g. './assets/day.png'."""
+    return os.path.normpath(os.path.join(basedir, path))
+
+
+class ResourceCache:
+    """Built resources keyed by (theme, key); theme None for those every theme shares."""
+
+    def __init__(self):
+        self._items = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, theme, key, build):
+        """The resource stored under (theme, key), calling build() the first time."""
+        item = self._items.get((theme, key))
+        if item is None:
+            item = self._items[theme, key] = build()
+        return item
+
+    def invalidate(self, theme=None):
+        """Drop everything built for `theme`, or for every theme when it is None.
+
+        Assets and fonts, which do not depend on a theme, are kept.
+        """
+        self._items = {(name, key): item for (name, key), item in self._items.items()
+                       if name is None or (theme is not None and name != theme)}
+
+    def pixmap(self, path: str) -> QPixmap:
+        path = asset_path(path)
+        return self.get(None, ('pixmap', path), lambda: QPixmap(path))
+
+    def icon(self, path: str) -> QIcon:
+        path = asset_path(path)
+        return self.get(None, ('icon', path), lambda: QIcon(path))
+
+    def font(self, family: str, size: int, weight: int = -1) -> QFont:
+        return self.get(None, ('font', family, size, weight), lambda: QFont(family, size, weight))
+
+    def style_font(self, style) -> QFont:
+        """The QFont for a config.FontStyle."""
+        return self.font(style.font, int(style.size), style.weight)
+
+    def pen(self, theme: str, color: str, width: int = 1) -> QPen:
+        def build():
+            pen = QPen(QColor(color))
+            pen.setWidth(width)
+            return pen
+        return self.get(theme, ('pen', color, width), build)
+
+    def stylesheet(self, theme, name: str) -> str:
+        """STYLESHEETS[name] filled in from a config.Theme."""
+        return self.get(theme.name, ('stylesheet', name), lambda: STYLESHEETS[name].format(theme=theme))
+
+
+resources = ResourceCache()
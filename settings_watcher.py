@@ -0,0 +1,90 @@
+"""
+Hot reload of settings.json for the running MultiClock windows.
+
+SettingsWatcher watches the file (and its directory, since many editors save
+by replacing the file) with QFileSystemWatcher, debounces bursts of writes and
+re-parses through Settings.reload_if_changed(). Windows receive the settings
+as they were before the reload and apply only what diff_settings reports.
+Every watcher keeps its own copy of the settings it last saw, so when two
+hubs share one Settings, a reload done by either still reaches both.
+"""
+
+import copy, os
+from dataclasses import dataclass
+from PyQt6.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+
+
+@dataclass(frozen=True)
+class SettingsChanges:
+    clocks: bool = False
+    formats: bool = False
+    theme: bool = False
+    align: bool = False
+    window: bool = False
+    events: bool = False
+
+    def __bool__(self):
+        return self.clocks or self.formats or self.theme or self.align or self.window or self.events
+
+
+def diff_settings(old, new, horizontal=False) -> SettingsChanges:
+    """Compare the sections one window cares about.
+
+    The vertical window uses `clock.defaults` and `clock.align`; the horizontal
+    one takes its zones from `clock.defaults.horizontal` and its alignment from
+    `clock.align.horizontal`. Both share the formats and chime of
+    `clock.defaults` and the `events` section.
+    """
+    old_clocks = old.clock_horizontal.clocks if horizontal else old.clock.clocks
+    new_clocks = new.clock_horizontal.clocks if horizontal else new.clock.clocks
+    old_align = old.align_horizontal if horizontal else old.align
+    new_align = new.align_horizontal if horizontal else new.align
+    return SettingsChanges(
+        clocks=list(old_clocks.items()) != list(new_clocks.items()),
+        formats=(old.clock.date_format, old.clock.time_format) != (new.clock.date_format, new.clock.time_format),
+        theme=old.theme != new.theme,
+        align=old_align != new_align,
+        window=old.window != new.window,
+        events=(old.events != new.events or
+                (old.clock.chime, old.clock.chime_offset, old.clock.chime_volume) !=
+                (new.clock.chime, new.clock.chime_offset, new.clock.chime_volume)))
+
+
+class SettingsWatcher(QObject):
+    """Emits `reloaded` with the previous settings after settings.json changes on disk."""
+
+    reloaded = pyqtSignal(object)
+
+    def __init__(self, settings, parent=None, delay_ms=100):
+        super().__init__(parent)
+        self.settings = settings
+        self.version = settings.version
+        self.seen = copy.copy(settings)
+        self.path = os.path.abspath(settings.path)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.addPath(os.path.dirname(self.path))
+        if os.path.isfile(self.path):
+            self.watcher.addPath(self.path)
+        self.watcher.fileChanged.connect(self.schedule_check)
+        self.watcher.directoryChanged.connect(self.schedule_check)
+
+        # Editors often write a file in several steps; only look once they settle
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(delay_ms)
+        self._debounce.timeout.connect(self.check)
+
+    def schedule_check(self, *args):
+        self._debounce.start()
+
+    def check(self) -> bool:
+        # A replaced file drops out of the watch list and has to be added again
+        if os.path.isfile(self.path) and self.path not in self.watcher.files():
+            self.watcher.addPath(self.path)
+        self.settings.reload_if_changed()
+        if self.settings.version == self.version:
+            return False
+        previous, self.seen = self.seen, copy.copy(self.settings)
+        self.version = self.settings.version
+        self.reloaded.emit(previous)
+        return True
@@ -0,0 +1,38 @@
+"""
+Startup timeline for MultiClock.
+
+Run a window with --startup-timeline (or MULTICLOCK_STARTUP_TIMELINE=1) to
+print how long each startup phase took, from the first import of this module
+to the first paint of the window. Import it before anything else so the
+timeline includes the Qt and pytz imports. When disabled, mark() is a no-op.
+"""
+
+import os, sys, time
+
+_origin = time.perf_counter()
+enabled = '--startup-timeline' in sys.argv or os.environ.get('MULTICLOCK_STARTUP_TIMELINE', '') not in ('', '0')
+_marks = []
+
+
+def mark(phase: str):
+    if enabled:
+        _marks.append((phase, time.perf_counter()))
+
+
+def report() -> str:
+    lines = [f'{"phase":<28} {"step (ms)":>10} {"total (ms)":>11}']
+    previous = _origin
+    for phase, instant in _marks:
+        lines.append(f'{phase:<28} {(instant - previous) * 1e3:>10.1f} {(instant - _origin) * 1e3:>11.1f}')
+        previous = instant
+    return '\n'.join(lines)
+
+
+def first_paint():
+    """Mark the first paint and print the timeline, once per process."""
+    global enabled
+    if not enabled:
+        return
+    mark('first paint')
+    enabled = False
+    print(report(), file=sys.stderr)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytz
+from datetime import datetime
+
+from multiclock_core import utc_offset, convert_many
+
+# Naive times are read as wall time in the zone
+assert utc_offset('America/New_York', datetime(2025, 1, 15, 12)) == '-5'
+assert utc_offset('America/New_York', datetime(2025, 7, 15, 12)) == '-4'
+
+# Aware times are converted to the zone first
+assert utc_offset('Asia/Tokyo', datetime(2025, 7, 15, 12, tzinfo=pytz.utc)) == '9'
+assert utc_offset('Australia/Sydney', pytz.utc.localize(datetime(2025, 7, 1))) == '10'
+assert utc_offset('Australia/Sydney', pytz.utc.localize(datetime(2025, 1, 1))) == '11'
+
+# Zones off the hour
+assert utc_offset('Asia/Kathmandu', datetime(2025, 6, 1)) == '5:45'
+assert utc_offset('Asia/Kolkata', datetime(2025, 6, 1)) == '5:30'
+assert utc_offset('America/St_Johns', datetime(2025, 1, 15)) == '-3:30'
+
+# No time is now
+assert utc_offset('Asia/Kathmandu') == '5:45'
+assert utc_offset('UTC') == '0'
+assert utc_offset('Not/AZone') == '?'
+
+# Instants past the transition tables stay in their own zone
+year_100 = (datetime(100, 1, 1) - datetime(1970, 1, 1)).total_seconds()
+converted = convert_many([2 ** 42 + 5, 4102444800, -2 ** 42, year_100], ['UTC', 'Asia/Tokyo', 'America/New_York'])
+assert converted.offsets[:, 0].tolist() == converted.offsets[:, 1].tolist(), converted.offsets
+assert converted.offsets[:, 2].tolist() == converted.offsets[:, 3].tolist(), converted.offsets
+assert converted.offsets[:2, 0].tolist() == [0, 9 * 3600], converted.offsets
+
+# Repeated zones keep their rows
+converted = convert_many([0], ['UTC', 'Asia/Kathmandu', 'UTC'])
+assert converted.zone_names == ('UTC', 'Asia/Kathmandu', 'UTC')
+assert converted.offsets[:, 0].tolist() == [0, 19800, 0], converted.offsets
+
+# Naive datetimes are UTC, like naive datetime64, whatever the local zone
+converted = convert_many([datetime(2025, 6, 1), np.datetime64('2025-06-01T00:00')], ['UTC', 'Asia/Tokyo'])
+assert (converted.wall_times[:, 0] == converted.wall_times[:, 1]).all(), converted.wall_times
+assert str(converted.wall_times[1, 0]) == '2025-06-01T09:00:00', converted.wall_times
+
+print('utc_offset ok')
@@ -0,0 +1,185 @@
+"""
+Tick profiler for the MultiClock windows.
+
+Turn it on with `"profiler": {"enabled": true}` in settings.json, or run a
+window with --profile (and --profile-export=PATH to write JSON lines). Each
+tick is split into phases timed with perf_counter_ns:
+
+    zones      time computation in the shared ClockCore
+    format     date and time strings
+    labels     label updates and list rows marked for repaint
+    analog     analog hands moved (the analog window only)
+    server     zone states published to the time server, when it runs
+    tick       the whole tick, every view included
+
+and work that happens outside the tick is recorded on its own:
+
+    paint      the analog strip redrawing its faces
+    events     chime, alarm and reminder checks, including playing them
+
+Rolling p50/p95/p99 over the last `samples` ticks are shown in an overlay
+label over each window and, when exporting, appended to the file once per
+tick, one JSON object per line. When disabled, windows get NULL_PROFILER,
+whose methods do nothing.
+"""
+
+import json, sys
+from collections import deque
+from time import perf_counter_ns
+import numpy as np
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import Qt
+from resources import resources
+
+PHASES = ('zones', 'format', 'labels', 'analog', 'server', 'tick', 'paint', 'events')
+PERCENTILES = (50, 95, 99)
+
+
+def profiler_options(section, argv=sys.argv):
+    """(enabled, overlay, export path, samples) from a config.ProfilerSettings and the command line."""
+    enabled, export = section.enabled, section.export
+    for arg in argv:
+        if arg == '--profile':
+            enabled = True
+        elif arg.startswith('--profile-export='):
+            enabled, export = True, arg.split('=', 1)[1]
+    return enabled, section.overlay, export, section.samples
+
+
+class TickProfiler:
+    """Per-phase tick timings with rolling percentiles.
+
+    A tick is begin(), a lap() after each phase and end(); lap() outside a
+    tick is ignored, so views can also be updated on their own (a reload,
+    a scroll) without skewing the numbers.
+    """
+
+    enabled = True
+
+    def __init__(self, samples: int = 600, export_path: str = None, overlay: bool = True):
+        self.overlay = overlay
+        self.samples = {phase: deque(maxlen=samples) for phase in PHASES}
+        self.ticks = 0
+        self.export_path = export_path
+        self._export = None
+        self._begun = None
+        self._last = None
+        self._laps = {}
+
+    def begin(self):
+        self._laps = {}
+        self._begun = self._last = perf_counter_ns()
+
+    def lap(self, phase: str):
+        """Add the time since the last lap (or begin) to `phase`."""
+        if self._last is None:
+            return
+        now = perf_counter_ns()
+        self._laps[phase] = self._laps.get(phase, 0) + now - self._last
+        self._last = now
+
+    def record(self, phase: str, ns: int):
+        """Record work timed outside a tick, such as a repaint."""
+        self.samples[phase].append(ns)
+
+    def end(self, **info):
+        """Close the tick; `info` (e.g. now_utc, zones) goes into the exported line."""
+        if self._begun is None:
+            return
+        laps = self._laps
+        laps['tick'] = perf_counter_ns() - self._begun
+        self._begun = self._last = None
+        for phase, ns in laps.items():
+            self.samples[phase].append(ns)
+        self.ticks += 1
+        if self.export_path is not None:
+            self.export(laps, info)
+
+    def percentiles(self, phase: str):
+        """(p50, p95, p99) of `phase` in milliseconds, or None before its first sample."""
+        samples = self.samples.get(phase)
+        if not samples:
+            return None
+        return tuple(np.percentile(np.fromiter(samples, np.int64, len(samples)), PERCENTILES) / 1e6)
+
+    def stats(self) -> dict:
+        return {phase: dict(zip(('p50', 'p95', 'p99'), map(float, values)))
+                for phase in self.samples if (values := self.percentiles(phase)) is not None}
+
+    def summary(self) -> str:
+        lines = [f'{"ms":<7}{"p50":>7}{"p95":>7}{"p99":>7}']
+        for phase in self.samples:
+            values = self.percentiles(phase)
+            if values is not None:
+                lines.append(f'{phase:<7}' + ''.join(f'{value:>7.2f}' for value in values))
+        lines.append(f'{self.ticks} ticks')
+        return '\n'.join(lines)
+
+    def export(self, laps, info):
+        if self._export is None:
+            try:
+                self._export = open(self.export_path, 'a', encoding='utf-8')
+            except OSError as error:
+                print(f'Not exporting tick profile: {error}', file=sys.stderr)
+                self.export_path = None
+                return
+        line = {**info, 'ns': laps, 'ms': self.stats()}
+        self._export.write(json.dumps(line) + '\n')
+        self._export.flush()
+
+    def close(self):
+        if self._export is not None:
+            self._export.close()
+            self._export = None
+
+
+class NullProfiler:
+    """Stands in for TickProfiler when profiling is off."""
+
+    enabled = False
+    overlay = False
+    ticks = 0
+
+    def begin(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+    def record(self, phase, ns):
+        pass
+
+    def end(self, **info):
+        pass
+
+    def close(self):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def make_profiler(section, argv=sys.argv):
+    """A TickProfiler as settings.json and the command line ask for, otherwise NULL_PROFILER."""
+    enabled, overlay, export, samples = profiler_options(section, argv)
+    if not enabled:
+        return NULL_PROFILER
+    return TickProfiler(samples, export, overlay)
+
+
+class ProfileOverlay(QLabel):
+    """A small monospaced label pinned to the top right corner of its window."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setFont(resources.font('Consolas', 8))
+        self.setTextFormat(Qt.TextFormat.PlainText)
+        self.setStyleSheet('background: rgba(0, 0, 0, 160); color: #e0e0e0; padding: 3px;')
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+
+    def show_text(self, text: str):
+        self.setText(text)
+        self.adjustSize()
+        self.move(self.parentWidget().width() - self.width() - 4, 4)
+        self.raise_()
+        self.show()
@@ -0,0 +1,105 @@
+"""
+Wall-clock-locked tick scheduler for MultiClock.
+
+Instead of a free-running QTimer(1000) aligned once with a blocking sleep,
+TickScheduler re-arms a single-shot precise timer to the next true
+time.time() boundary on every tick, so it cannot drift, and records how late
+each tick fired in a LatenessHistogram. The interval can be changed at run
+time, so windows wake only as often as their coarsest visible unit needs.
+"""
+
+import math
+from time import time
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+MINUTE = 60.0
+
+
+class LatenessHistogram:
+    """Counts of tick lateness in milliseconds, bucketed by upper bound."""
+
+    bounds_ms = (1, 2, 5, 10, 20, 50, 100, 250, 1000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.bounds_ms) + 1)
+        self.total = 0
+        self.worst_ms = 0.0
+        self.skipped = 0
+
+    def record(self, lateness: float):
+        lateness_ms = lateness * 1000
+        for index, bound in enumerate(self.bounds_ms):
+            if lateness_ms < bound:
+                break
+        else:
+            index = len(self.bounds_ms)
+        self.counts[index] += 1
+        self.total += 1
+        self.worst_ms = max(self.worst_ms, lateness_ms)
+
+    def within(self, bound_ms: float) -> float:
+        """Fraction of ticks that fired less than `bound_ms` late."""
+        if not self.total:
+            return 1.0
+        hits = sum(count for bound, count in zip(self.bounds_ms, self.counts) if bound <= bound_ms)
+        return hits / self.total
+
+    def summary(self) -> str:
+        lines = [f'{self.total} ticks, worst {self.worst_ms:.1f} ms late, {self.skipped} skipped']
+        lower = 0
+        for bound, count in zip(self.bounds_ms + (math.inf,), self.counts):
+            label = f'< {bound} ms' if bound != math.inf else f'>= {lower} ms'
+            lines.append(f'  {label:>10}: {count}')
+            lower = bound
+        return '\n'.join(lines)
+
+
+class TickScheduler(QObject):
+    """Emits `tick` with the boundary instant just after every `interval` seconds of wall time."""
+
+    tick = pyqtSignal(float)
+
+    def __init__(self, interval: float = 1.0, parent=None):
+        super().__init__(parent)
+        self.interval = interval
+        self.histogram = LatenessHistogram()
+        self._target = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def start(self):
+        self._arm(time())
+
+    def set_interval(self, interval: float):
+        """Change the tick resolution, re-arming to the new boundary if running."""
+        if interval == self.interval:
+            return
+        self.interval = interval
+        if self._timer.isActive():
+            self._arm(time())
+
+    def stop(self):
+        self._timer.stop()
+        self._target = None
+
+    def is_active(self) -> bool:
+        return self._timer.isActive()
+
+    def _arm(self, now: float):
+        self._target = (math.floor(now / self.interval) + 1) * self.interval
+        self._timer.start(max(0, math.ceil((self._target - now) * 1000)))
+
+    def _on_timeout(self):
+        now = time()
+        if now < self._target:
+            # Timers may fire a fraction of a millisecond early; wait out the rest
+            self._timer.start(max(0, math.ceil((self._target - now) * 1000)))
+            return
+        # If the event loop stalled past whole intervals, show the current one
+        boundary = math.floor(now / self.interval) * self.interval
+        self.histogram.skipped += round((boundary - self._target) / self.interval)
+        self.histogram.record(now - boundary)
+        self._arm(now)
+        self.tick.emit(boundary)
@@ -0,0 +1,290 @@
+"""
+Local time-query endpoint for MultiClock.
+
+Serves the configured clocks as JSON over HTTP on a loopback port, or on a
+Unix socket, so scripts can ask MultiClock what time it is in Tokyo instead
+of making their own pytz calls:
+
+    GET /zones              every clock now
+    GET /zones/<name>       one clock now, by display name
+    GET /convert?at=<time>  every clock at one instant, Unix seconds or ISO 8601
+
+    curl http://127.0.0.1:8765/zones
+    curl --unix-socket /tmp/multiclock.sock http/convert?at=2025-06-01T09:00Z
+
+Turn it on with `"server": {"enabled": true}` in settings.json (with `port`,
+or `socket` for a Unix socket), or run a window with --serve. It then runs on
+asyncio in a background thread and the window's hub publishes the zone
+states of every tick, so `/zones` returns a body encoded once per tick with
+no timezone work per request. Seconds the windows do not tick (they tick
+per minute while hidden) are computed once here from the same transition
+tables. `python time_server.py` serves settings.json without a window.
+"""
+
+import asyncio, errno, json, os, socket, stat, sys, threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from time import time
+from urllib.parse import urlsplit, parse_qs, unquote
+from tzlocal import get_localzone
+import config
+from multiclock_core import ClockCore, format_utc_offset
+
+# Encoded /convert bodies kept, by instant
+CONVERSIONS = 1024
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+
+def zone_json(name, state) -> dict:
+    return {'name': name, 'zone': state.zone_name, 'time': state.wall_time.isoformat(timespec='seconds'),
+            'offset': state.offset, 'utc_offset': state.offset_label,
+            'day_phase': state.day_phase, 'is_local': state.is_local}
+
+
+def parse_instant(text: str) -> float:
+    """Unix seconds, or an ISO 8601 time (UTC when it names no zone)."""
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    instant = datetime.fromisoformat(text)
+    if instant.tzinfo is None:
+        instant = instant.replace(tzinfo=timezone.utc)
+    return instant.timestamp()
+
+
+def remove_stale_socket(path: str):
+    """Remove a socket left behind by an instance that is gone; refuse to touch anything else."""
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(errno.EEXIST, 'not a socket, leaving it alone', path)
+    probe = socket.socket(socket.AF_UNIX)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise OSError(errno.EADDRINUSE, 'another server is listening on it', path)
+
+
+class Snapshot:
+    """The JSON bodies of one second: all clocks, and each clock on its own."""
+
+    __slots__ = ('second', 'body', 'zones')
+
+    def __init__(self, second: int, names, states):
+        self.second = second
+        zones = [zone_json(name, state) for name, state in zip(names, states)]
+        self.body = json.dumps({'instant': second, 'zones': zones}).encode()
+        self.zones = {zone['name']: json.dumps({'instant': second, **zone}).encode() for zone in zones}
+
+
+class TimeServer:
+    """Answers time queries for `clocks` from per-second snapshots.
+
+    publish() may be called from another thread (the Qt tick); everything
+    else runs on the server's asyncio loop.
+    """
+
+    def __init__(self, clocks: dict, local_zone: str = None, server_settings=None):
+        self.server_settings = server_settings or config.ServerSettings(enabled=True)
+        self.local_zone = str(get_localzone()) if local_zone is None else local_zone
+        self.loop = None
+        self.thread = None
+        self._server = None
+        # (path, inode) of the Unix socket this server created, removed again when it stops
+        self._socket = None
+        self.set_clocks(clocks)
+
+    def set_clocks(self, clocks: dict):
+        self.clocks = dict(clocks)
+        self.names = list(self.clocks.keys())
+        self.core = ClockCore(self.clocks, self.local_zone)
+        self._snapshot = None
+        self._conversions = OrderedDict()
+
+    def publish(self, now_utc: float, names, states):
+        """Take the zone states a tick already computed as the snapshot of its second."""
+        if list(names) == self.names:
+            self._snapshot = Snapshot(int(now_utc), names, states)
+
+    def snapshot(self, now_utc: float = None) -> Snapshot:
+        second = int(time() if now_utc is None else now_utc)
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.second != second:
+            snapshot = self._snapshot = Snapshot(second, self.names, self.core.tick(second))
+        return snapshot
+
+    def convert(self, instant: float) -> bytes:
+        """Every clock at the second of `instant`, from the transition tables without touching the live caches."""
+        # Whole seconds, as in the /zones snapshots
+        instant = int(instant // 1)
+        body = self._conversions.get(instant)
+        if body is not None:
+            self._conversions.move_to_end(instant)
+            return body
+        times, offsets = self.core.engine.resolve(instant)
+        zones = [{'name': name, 'zone': zone_name, 'time': wall_time.isoformat(timespec='seconds'),
+                  'offset': offset, 'utc_offset': format_utc_offset(offset)}
+                 for name, zone_name, wall_time, offset in zip(self.names, self.core.zone_names, times, offsets)]
+        body = self._conversions[instant] = json.dumps({'instant': instant, 'zones': zones}).encode()
+        if len(self._conversions) > CONVERSIONS:
+            self._conversions.popitem(last=False)
+        return body
+
+    def respond(self, method: str, target: str):
+        """(status, body) for one request."""
+        if method != 'GET':
+            return 405, b'{"error": "only GET is supported"}'
+        url = urlsplit(target)
+        path = url.path.rstrip('/')
+        if path == '/zones':
+            return 200, self.snapshot().body
+        if path.startswith('/zones/'):
+            body = self.snapshot().zones.get(unquote(path[len('/zones/'):]))
+            if body is None:
+                return 404, b'{"error": "no such clock"}'
+            return 200, body
+        if path == '/convert':
+            at = parse_qs(url.query).get('at')
+            if not at:
+                return 400, b'{"error": "convert needs ?at=<unix seconds or ISO 8601>"}'
+            # Times that parse but fall outside what datetime can hold (1e20, inf, year 9999 in UTC+) fail here too
+            try:
+                return 200, self.convert(parse_instant(at[0]))
+            except (ValueError, OverflowError):
+                return 400, json.dumps({'error': f'cannot convert time {at[0]!r}'}).encode()
+        return 404, b'{"error": "try /zones, /zones/<name> or /convert?at=<time>"}'
+
+    async def handle(self, reader, writer):
+        # HTTP/1.1 with keep-alive: scripts polling in a loop reuse one connection
+        try:
+            while True:
+                request = await reader.readline()
+                if not request:
+                    break
+                headers = {}
+                while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    key, _, value = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = value.strip().lower()
+                parts = request.decode('latin-1').split()
+                if len(parts) != 3:
+                    status, body = 400, b'{"error": "malformed request"}'
+                else:
+                    status, body = self.respond(parts[0], parts[1])
+                close = headers.get('connection') == 'close' or (len(parts) == 3 and parts[2] == 'HTTP/1.0')
+                writer.write(b'HTTP/1.1 %d %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n%s\r\n'
+                             % (status, REASONS[status].encode(), len(body),
+                                b'Connection: close\r\n' if close else b'') + body)
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        options = self.server_settings
+        if options.socket:
+            remove_stale_socket(options.socket)
+            self._server = await asyncio.start_unix_server(self.handle, options.socket)
+            self._socket = options.socket, os.stat(options.socket).st_ino
+        else:
+            self._server = await asyncio.start_server(self.handle, options.host, options.port)
+        return self._server
+
+    def address(self) -> str:
+        if self.server_settings.socket:
+            return self.server_settings.socket
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f'http://{host}:{port}'
+
+    async def serve(self):
+        """Serve on the current loop until cancelled."""
+        await self.start()
+        print(f'Serving {len(self.names)} clocks on {self.address()}', file=sys.stderr)
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            self._remove_socket()
+
+    def _remove_socket(self):
+        """Unlink the socket file this server created, unless something else has replaced it since."""
+        if self._socket is None:
+            return
+        path, inode = self._socket
+        self._socket = None
+        try:
+            if os.stat(path).st_ino == inode:
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def start_thread(self):
+        """Serve from a daemon thread; returns once the socket is listening."""
+        started = threading.Event()
+        failure = []
+
+        def run():
+            self.loop = asyncio.new_event_loop()
+            try:
+                self.loop.run_until_complete(self.start())
+            except OSError as error:
+                failure.append(error)
+                started.set()
+                return
+            started.set()
+            self.loop.run_forever()
+            self.loop.close()
+
+        self.thread = threading.Thread(target=run, name='MultiClock time server', daemon=True)
+        self.thread.start()
+        started.wait()
+        if failure:
+            raise failure[0]
+        return self
+
+    def call(self, function, *args):
+        """Run `function` on the server's loop, e.g. set_clocks after a settings reload."""
+        self.loop.call_soon_threadsafe(function, *args)
+
+    async def _shutdown(self):
+        self._server.close()
+        self._remove_socket()
+        # Open keep-alive connections would otherwise outlive the loop
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self):
+        """Close the socket and every connection, and end the server thread."""
+        if self.loop is not None:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result(5)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(5)
+            self.loop = None
+
+
+def configured_clocks(settings) -> dict:
+    """The clocks of both windows in one mapping, the vertical window's first."""
+    clocks = dict(settings.clock.clocks)
+    for name, zone_name in settings.clock_horizontal.clocks.items():
+        clocks.setdefault(name, zone_name)
+    return clocks
+
+
+if __name__ == '__main__':
+    settings = config.get_settings()
+    server = TimeServer(configured_clocks(settings), server_settings=settings.server)
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
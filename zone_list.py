@@ -0,0 +1,170 @@
+"""
+Virtualized zone rows for the vertical MultiClock window.
+
+Instead of four QLabels and a QGridLayout per zone, the zones live in a
+ZoneListModel over the window's RenderState and a ZoneDelegate paints each
+row. The QListView only asks for rows inside its viewport, so the number of
+widgets and the cost of a repaint stay the same however many zones are
+configured; ZoneListView.visible_rows() tells the window which zones to tick.
+"""
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QPoint, QRect, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QFontMetrics
+from PyQt6.QtWidgets import QAbstractItemView, QFrame, QListView, QStyledItemDelegate
+
+ROW_HEIGHT = 72
+ROW_SPACING = 6
+IMAGE_SIZE = 50
+# The local clock shows smaller seconds after the hours and minutes
+SECONDS_PIXEL_SIZE = 20
+
+StateRole = Qt.ItemDataRole.UserRole
+
+
+class ZoneListModel(QAbstractListModel):
+    """One row per zone; the row data is the zone's ZoneRenderState."""
+
+    def __init__(self, render_state, parent=None):
+        super().__init__(parent)
+        self.render_state = render_state
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.render_state.zones)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        state = self.render_state.zones[index.row()]
+        if role == StateRole:
+            return state
+        if role == Qt.ItemDataRole.DisplayRole:
+            return state.texts.get('name')
+        return None
+
+    def reset(self):
+        """Zones were added, removed or reordered."""
+        self.beginResetModel()
+        self.endResetModel()
+
+    def rows_changed(self, rows):
+        """Repaint the span of rows whose content changed this tick."""
+        if rows:
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)), [StateRole])
+
+
+class _Part:
+    """Font, metrics, colors and alignment for one text of a row."""
+
+    def __init__(self, style, flags):
+        self.font = QFont(style.font, int(style.size), style.weight)
+        self.metrics = QFontMetrics(self.font)
+        self.color = QColor(style.color)
+        self.background = QColor(style.background)
+        self.flags = flags
+
+    def draw(self, painter, rect, text):
+        if self.background.alpha():
+            painter.fillRect(rect, self.background)
+        if text:
+            painter.setFont(self.font)
+            painter.setPen(self.color)
+            painter.drawText(rect, self.flags.value, text)
+
+
+class ZoneDelegate(QStyledItemDelegate):
+    """Paints a zone row: name and date on top, day-phase image and clock below.
+
+    `pixmap` maps a day-phase name to its QPixmap.
+    """
+
+    def __init__(self, pixmap, parent=None):
+        super().__init__(parent)
+        self.pixmap = pixmap
+        self.zone = self.date = self.clock = None
+
+    def set_style(self, theme, align):
+        self.zone = _Part(theme.zone, align.zone.flags)
+        self.date = _Part(theme.date, align.date.flags)
+        self.clock = _Part(theme.clock, align.clock.flags)
+        self.seconds_font = QFont(self.clock.font)
+        self.seconds_font.setPixelSize(SECONDS_PIXEL_SIZE)
+        self.seconds_metrics = QFontMetrics(self.seconds_font)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), ROW_HEIGHT + ROW_SPACING)
+
+    def paint(self, painter, option, index):
+        texts = index.data(StateRole).texts
+        rect = option.rect.adjusted(0, 0, 0, -ROW_SPACING)
+        line = max(self.zone.metrics.height(), self.date.metrics.height())
+        half = rect.width() // 2
+
+        name_rect = QRect(rect.left(), rect.top(), half, line)
+        name = self.zone.metrics.elidedText(texts.get('name', ''), Qt.TextElideMode.ElideRight, half)
+        self.zone.draw(painter, name_rect, name)
+        self.date.draw(painter, QRect(rect.left() + half, rect.top(), rect.width() - half, line), texts.get('date', ''))
+
+        body_top = rect.top() + line
+        body_height = rect.bottom() - body_top + 1
+        image_rect = QRect(rect.left(), body_top + (body_height - IMAGE_SIZE) // 2, IMAGE_SIZE, IMAGE_SIZE)
+        if 'phase' in texts:
+            painter.drawPixmap(image_rect, self.pixmap(texts['phase']))
+        clock_rect = QRect(image_rect.right() + 1, body_top, rect.right() - image_rect.right(), body_height)
+        if 'seconds' in texts:
+            self.paint_local_clock(painter, clock_rect, texts['clock'], texts['seconds'])
+        else:
+            self.clock.draw(painter, clock_rect, texts.get('clock', ''))
+
+    def paint_local_clock(self, painter, rect, clock, seconds):
+        """Draw hours and minutes in the clock font and the seconds smaller, on one baseline."""
+        if self.clock.background.alpha():
+            painter.fillRect(rect, self.clock.background)
+        width = self.clock.metrics.horizontalAdvance(clock)
+        total = width + self.seconds_metrics.horizontalAdvance(seconds)
+        flags = self.clock.flags
+        if flags & Qt.AlignmentFlag.AlignRight:
+            x = rect.right() + 1 - total
+        elif flags & Qt.AlignmentFlag.AlignHCenter:
+            x = rect.left() + (rect.width() - total) // 2
+        else:
+            x = rect.left()
+        ascent, descent = self.clock.metrics.ascent(), self.clock.metrics.descent()
+        if flags & Qt.AlignmentFlag.AlignTop:
+            baseline = rect.top() + ascent
+        elif flags & Qt.AlignmentFlag.AlignBottom:
+            baseline = rect.bottom() + 1 - descent
+        else:
+            baseline = rect.top() + (rect.height() + ascent - descent) // 2
+        painter.setPen(self.clock.color)
+        painter.setFont(self.clock.font)
+        painter.drawText(QPoint(x, baseline), clock)
+        painter.setFont(self.seconds_font)
+        painter.drawText(QPoint(x + width, baseline), seconds)
+
+
+class ZoneListView(QListView):
+    """Scrollable list of zone rows; emits `visible_changed` when other rows come into view."""
+
+    visible_changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.verticalScrollBar().valueChanged.connect(self.visible_changed)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.visible_changed.emit()
+
+    def visible_rows(self) -> range:
+        count = self.model().rowCount() if self.model() else 0
+        if not count:
+            return range(0)
+        first = self.indexAt(QPoint(0, 0)).row()
+        last = self.indexAt(QPoint(0, self.viewport().height() - 1)).row()
+        return range(max(first, 0), (last if last >= 0 else count - 1) + 1)
@@ -0,0 +1,89 @@
+"""
+"Add clock" palette for the MultiClock windows.
+
+Type part of a city, zone or country name and pick from the matches; the
+window adds the chosen catalog entry to settings.json. The zone catalog is
+loaded on first search, from its disk cache when it has one.
+"""
+
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QDialog, QLineEdit, QListWidget, QListWidgetItem, QVBoxLayout
+from multiclock_core import ZoneCatalog
+
+RESULT_LIMIT = 20
+
+_catalog = None
+
+def catalog() -> ZoneCatalog:
+    """The process-wide zone catalog, loaded on first use."""
+    global _catalog
+    if _catalog is None:
+        _catalog = ZoneCatalog.load()
+    return _catalog
+
+
+def clock_name(entry, clocks) -> str:
+    """A name for a new clock showing `entry` that does not clash with another zone's clock."""
+    name = entry.city
+    if clocks.get(name, entry.zone) != entry.zone:
+        name = f'{name} ({entry.country_code or entry.zone})'
+    return name
+
+
+class ZonePalette(QDialog):
+    """Search box over the zone catalog; emits `zone_chosen(entry)` on Enter or double-click."""
+
+    zone_chosen = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle('Add clock')
+        self.resize(420, 360)
+
+        self.query = QLineEdit()
+        self.query.setPlaceholderText('City, zone or country')
+        self.query.textChanged.connect(self.search)
+        self.results = QListWidget()
+        self.results.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.results.itemActivated.connect(self.choose)
+
+        vbox = QVBoxLayout()
+        vbox.setContentsMargins(8, 8, 8, 8)
+        vbox.addWidget(self.query)
+        vbox.addWidget(self.results)
+        self.setLayout(vbox)
+
+    def open_palette(self):
+        self.query.clear()
+        self.results.clear()
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        self.query.setFocus()
+
+    def search(self, text):
+        self.results.clear()
+        for entry in catalog().search(text, RESULT_LIMIT):
+            country = f' · {entry.country}' if entry.country else ''
+            item = QListWidgetItem(f'{entry.city}  —  {entry.zone}{country} · UTC {entry.offset_label()}')
+            item.setData(Qt.ItemDataRole.UserRole, entry)
+            self.results.addItem(item)
+        if self.results.count():
+            self.results.setCurrentRow(0)
+
+    def keyPressEvent(self, event):
+        # The search box keeps focus; arrows move through the results and Enter picks one
+        key = event.key()
+        row = self.results.currentRow()
+        if key in (Qt.Key.Key_Down, Qt.Key.Key_Up) and self.results.count():
+            step = 1 if key == Qt.Key.Key_Down else -1
+            self.results.setCurrentRow(max(0, min(self.results.count() - 1, row + step)))
+        elif key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            if self.results.currentItem() is not None:
+                self.choose(self.results.currentItem())
+        else:
+            super().keyPressEvent(event)
+
+    def choose(self, item):
+        self.zone_chosen.emit(item.data(Qt.ItemDataRole.UserRole))
+        self.hide()